@@ -25,19 +25,19 @@ https://github.com/CGCookie/blender-addon-updater
 __version__ = "1.1.1"
 
 import errno
+import hashlib
 import traceback
 import platform
-import ssl
-import urllib.request
-import urllib
 import os
 import json
-import zipfile
 import shutil
 import threading
 import fnmatch
 from datetime import datetime, timedelta
 
+# Network and zip modules (ssl, urllib, zipfile) are imported where used, they
+# noticeably slow down addon enable and most sessions never need them.
+
 # Blender imports, used in limited cases.
 import bpy #type: ignore
 import addon_utils #type: ignore
@@ -93,6 +93,10 @@ class SingletonUpdater:
         self._check_interval_hours = 0
         self._check_interval_minutes = 0
 
+        # Seconds before a blocking network request gives up, the check runs
+        # in a background thread but a stalled one would block further checks.
+        self._request_timeout = 30
+
         # runtime variables, initial conditions
         self._verbose = False
         self._use_print_traces = True
@@ -103,6 +107,10 @@ class SingletonUpdater:
         self._update_version = None
         self._source_zip = None
         self._check_thread = None
+        self._check_callbacks = []  # Called once the check in flight ends.
+        self._check_lock = threading.Lock()
+        # Bound once, so the same timer function can be found and unregistered.
+        self._check_timer = self.finish_async_check_update
         self._select_link = None
         self.skip_tag = None
 
@@ -113,6 +121,10 @@ class SingletonUpdater:
             os.path.dirname(__file__), self._addon + "_updater")
         self._addon_root = os.path.dirname(__file__)
         self._json = dict()
+        self._json_written = None  # Last content written to or read from disk.
+        self._json_lock = threading.Lock()
+        self._json_thread = None  # Reads state file after register.
+        self._last_check = None  # In-memory copy of json["last_check"].
         self._error = None
         self._error_msg = None
         self._prefiltered_tag_count = 0
@@ -306,10 +318,19 @@ class SingletonUpdater:
 
     @property
     def json(self):
+        if self._json_thread is not None:
+            # Background read started by start_async_json_load.
+            self._json_thread.join()
+            self._json_thread = None
         if len(self._json) == 0:
             self.set_updater_json()
         return self._json
 
+    @property
+    def json_loaded(self):
+        """False while state file is being read by a background thread"""
+        return self._json_thread is None or not self._json_thread.is_alive()
+
     @property
     def latest_release(self):
         if self._latest_release is None:
@@ -666,7 +687,15 @@ class SingletonUpdater:
                     "Most recent tag found:" + str(self._tags[n]['name']))
 
     def get_raw(self, url):
-        """All API calls to base url."""
+        """All API calls to base url.
+
+        Responses are cached on disk, repeated requests are conditional
+        (ETag / Last-Modified) and a 304 response returns the cached copy.
+        """
+        import ssl
+        import urllib.error
+        import urllib.request
+
         request = urllib.request.Request(url)
         try:
             context = ssl._create_unverified_context()
@@ -686,13 +715,26 @@ class SingletonUpdater:
         request.add_header(
             'User-Agent', "Python/" + str(platform.python_version()))
 
+        # Only ask for the body if it changed since the cached response.
+        cached = self.load_cached_response(url)
+        if cached is not None:
+            if cached.get("etag"):
+                request.add_header('If-None-Match', cached["etag"])
+            if cached.get("last_modified"):
+                request.add_header('If-Modified-Since', cached["last_modified"])
+
         # Run the request.
         try:
             if context:
-                result = urllib.request.urlopen(request, context=context)
+                result = urllib.request.urlopen(
+                    request, context=context, timeout=self._request_timeout)
             else:
-                result = urllib.request.urlopen(request)
+                result = urllib.request.urlopen(
+                    request, timeout=self._request_timeout)
         except urllib.error.HTTPError as e:
+            if e.code == 304 and cached is not None:
+                self.print_verbose("Response not modified, using cached copy")
+                return cached["body"]
             if str(e.code) == "403":
                 self._error = "HTTP error (access denied)"
                 self._error_msg = str(e.code) + " - server error response"
@@ -718,8 +760,51 @@ class SingletonUpdater:
             return None
         else:
             result_string = result.read()
+            headers = result.headers
             result.close()
-            return result_string.decode()
+            body = result_string.decode()
+            self.save_cached_response(url, headers, body)
+            return body
+
+    def get_response_cache_path(self, url):
+        """Returns the path of the file caching the response of given url"""
+        name = hashlib.sha1(url.encode()).hexdigest() + ".json"
+        return os.path.join(self._updater_path, "response_cache", name)
+
+    def load_cached_response(self, url):
+        """Cached response of url with its validators, None if not cached"""
+        try:
+            with open(self.get_response_cache_path(url)) as data_file:
+                cached = json.load(data_file)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            print("Failed to read cached response of", url)
+            self.print_trace()
+            return None
+        if cached.get("url") != url or "body" not in cached:
+            return None
+        return cached
+
+    def save_cached_response(self, url, headers, body):
+        """Store response body with validators sent by the server, if any"""
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if etag is None and last_modified is None:
+            return  # Nothing to revalidate with, caching would not help.
+        path = self.get_response_cache_path(url)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as outf:
+                json.dump({
+                    "url": url,
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "body": body
+                }, outf)
+        except Exception:
+            print("Failed to cache response of", url)
+            self.print_trace()
 
     def get_api(self, url):
         """Result of all api calls, decoded into json format."""
@@ -774,6 +859,9 @@ class SingletonUpdater:
         self._source_zip = os.path.join(local, "source.zip")
         self.print_verbose("Starting download update zip")
         try:
+            import ssl
+            import urllib.request
+
             request = urllib.request.Request(url)
             context = ssl._create_unverified_context()
 
@@ -910,6 +998,7 @@ class SingletonUpdater:
 
         self.print_verbose(
             "Begin extracting source from zip:" + str(self._source_zip))
+        import zipfile
         with zipfile.ZipFile(self._source_zip, "r") as zfile:
 
             if not zfile:
@@ -1186,7 +1275,12 @@ class SingletonUpdater:
         return tuple(segments)
 
     def check_for_update_async(self, callback=None):
-        """Called for running check in a background thread"""
+        """Called for running check in a background thread
+
+        Returns without touching disk or network while the check interval,
+        tracked in memory, is not reached. State file is then loaded by the
+        background thread, if it was not read yet.
+        """
         is_ready = (
             self._json is not None
             and "update_ready" in self._json
@@ -1204,6 +1298,8 @@ class SingletonUpdater:
         # do the check
         if not self._check_interval_enabled:
             return
+        elif self._json and not self.past_interval_timestamp():
+            self.print_verbose("Skipping async check, interval not reached")
         elif self._async_checking:
             self.print_verbose("Skipping async check, already started")
             # already running the bg thread
@@ -1213,18 +1309,14 @@ class SingletonUpdater:
             self.start_async_check_update(False, callback)
 
     def check_for_update_now(self, callback=None):
+        """Forced check, callback waits for the check in flight if any"""
         self._error = None
         self._error_msg = None
         self.print_verbose(
             "Check update pressed, first getting current status")
-        if self._async_checking:
-            self.print_verbose("Skipping async check, already started")
-            return  # already running the bg thread
-        elif self._update_ready is None:
-            self.start_async_check_update(True, callback)
-        else:
+        if not self._async_checking:
             self._update_ready = None
-            self.start_async_check_update(True, callback)
+        self.start_async_check_update(True, callback)
 
     def check_for_update(self, now=False):
         """Check for update not in a syncrhonous manner.
@@ -1254,7 +1346,8 @@ class SingletonUpdater:
         if self._user is None:
             raise ValueError("username not yet defined")
 
-        self.set_updater_json()  # self._json
+        if not self._json:
+            self.set_updater_json()  # self._json, read once per session
 
         if not now and not self.past_interval_timestamp():
             self.print_verbose(
@@ -1277,7 +1370,8 @@ class SingletonUpdater:
         # Primary internet call, sets self._tags and self._tag_latest.
         self.get_tags()
 
-        self._json["last_check"] = str(datetime.now())
+        self._last_check = datetime.now()
+        self._json["last_check"] = str(self._last_check)
         self.save_updater_json()
 
         # Can be () or ('master') in addition to branches, and version tag.
@@ -1455,18 +1549,16 @@ class SingletonUpdater:
         if not self._check_interval_enabled:
             return True  # ie this exact feature is disabled
 
-        if "last_check" not in self._json or self._json["last_check"] == "":
+        if self._last_check is None:
             return True
 
         now = datetime.now()
-        last_check = datetime.strptime(
-            self._json["last_check"], "%Y-%m-%d %H:%M:%S.%f")
         offset = timedelta(
             days=self._check_interval_days + 30 * self._check_interval_months,
             hours=self._check_interval_hours,
             minutes=self._check_interval_minutes)
 
-        delta = (now - offset) - last_check
+        delta = (now - offset) - self._last_check
         if delta.total_seconds() > 0:
             self.print_verbose("Time to check for updates!")
             return True
@@ -1506,7 +1598,15 @@ class SingletonUpdater:
         if os.path.isfile(jpath):
             with open(jpath) as data_file:
                 self._json = json.load(data_file)
+                self._json_written = json.dumps(self._json, indent=4)
                 self.print_verbose("Read in JSON settings from file")
+            self._last_check = None
+            if self._json.get("last_check"):
+                try:
+                    self._last_check = datetime.strptime(
+                        self._json["last_check"], "%Y-%m-%d %H:%M:%S.%f")
+                except ValueError:
+                    self.print_verbose("Ignoring malformed last_check time")
         else:
             self._json = {
                 "last_check": "",
@@ -1520,7 +1620,10 @@ class SingletonUpdater:
             self.save_updater_json()
 
     def save_updater_json(self):
-        """Trigger save of current json structure into file within addon"""
+        """Trigger save of current json structure into file within addon
+
+        The file is only rewritten when its content changed.
+        """
         if self._update_ready:
             if isinstance(self._update_version, tuple):
                 self._json["update_ready"] = True
@@ -1538,13 +1641,18 @@ class SingletonUpdater:
             print("State error: Directory does not exist, cannot save json: ",
                   os.path.basename(jpath))
             return
-        try:
-            with open(jpath, 'w') as outf:
-                data_out = json.dumps(self._json, indent=4)
-                outf.write(data_out)
-        except:
-            print("Failed to open/save data to json: ", jpath)
-            self.print_trace()
+        with self._json_lock:
+            data_out = json.dumps(self._json, indent=4)
+            if data_out == self._json_written:
+                self.print_verbose("Updater JSON settings unchanged")
+                return
+            try:
+                with open(jpath, 'w') as outf:
+                    outf.write(data_out)
+                self._json_written = data_out
+            except:
+                print("Failed to open/save data to json: ", jpath)
+                self.print_trace()
         self.print_verbose("Wrote out updater JSON settings with content:")
         self.print_verbose(str(self._json))
 
@@ -1569,19 +1677,31 @@ class SingletonUpdater:
     # ASYNC related methods
     # -------------------------------------------------------------------------
     def start_async_check_update(self, now=False, callback=None):
-        """Start a background thread which will check for updates"""
-        if self._async_checking:
-            return
-        self.print_verbose("Starting background checking thread")
-        check_thread = threading.Thread(target=self.async_check_update,
-                                        args=(now, callback,))
-        check_thread.daemon = True
-        self._check_thread = check_thread
-        check_thread.start()
-
-    def async_check_update(self, now, callback=None):
+        """Start a background thread which will check for updates
+
+        Only one check runs at a time, if one is still in flight (even after
+        stop_async_check_update) the new callback waits for its result. Every
+        callback is called on the main thread by a timer once the check ends.
+        """
+        with self._check_lock:
+            if callback is not None:
+                self._check_callbacks.append(callback)
+            self._async_checking = True
+            if self._check_thread is not None:
+                self.print_verbose("Check already in flight, awaiting result")
+                return
+            self.print_verbose("Starting background checking thread")
+            check_thread = threading.Thread(target=self.async_check_update,
+                                            args=(now,))
+            check_thread.daemon = True
+            self._check_thread = check_thread
+            check_thread.start()
+        if not bpy.app.timers.is_registered(self._check_timer):
+            bpy.app.timers.register(self._check_timer,
+                                    first_interval=0.1, persistent=True)
+
+    def async_check_update(self, now):
         """Perform update check, run as target of background thread"""
-        self._async_checking = True
         self.print_verbose("Checking for update now in background")
 
         try:
@@ -1597,13 +1717,31 @@ class SingletonUpdater:
                 self._error = "Error occurred"
                 self._error_msg = "Encountered an error while checking for updates"
 
-        self._async_checking = False
-        self._check_thread = None
-
-        if callback:
+        with self._check_lock:
+            self._async_checking = False
+            self._check_thread = None
+        self.print_verbose("BG thread: Finished check update")
+
+    def finish_async_check_update(self):
+        """Timer polling the background check, calls back on the main thread"""
+        with self._check_lock:
+            if self._check_thread is not None:
+                return 0.25
+            callbacks = self._check_callbacks
+            self._check_callbacks = []
+        for callback in callbacks:
             self.print_verbose("Finished check update, doing callback")
             callback(self._update_ready)
-        self.print_verbose("BG thread: Finished check update, no callback")
+        return None
+
+    def start_async_json_load(self):
+        """Read state file in a background thread, so enabling the addon
+        does not wait for disk. Reading json waits for the thread."""
+        if self._json or self._json_thread is not None:
+            return
+        self._json_thread = threading.Thread(target=self.set_updater_json)
+        self._json_thread.daemon = True
+        self._json_thread.start()
 
     def stop_async_check_update(self):
         """Method to give impression of stopping check for update.
@@ -1619,6 +1757,8 @@ class SingletonUpdater:
             # however, "There is no direct kill method on a thread object."
             # better to let it run its course
             # self._check_thread.stop()
+        with self._check_lock:
+            self._check_callbacks = []
         self._async_checking = False
         self._error = None
         self._error_msg = None
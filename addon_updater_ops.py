@@ -52,6 +52,8 @@ except Exception as e:
 
         def check_for_update(self): pass
 
+        def stop_async_check_update(self): pass
+
 
     Updater = SingletonUpdaterNone()
     Updater.error = "Error initializing updater module"
@@ -181,10 +183,9 @@ class AddonUpdaterInstallPopup(bpy.types.Operator):
                 else:
                     print("Updater returned {}, error occurred".format(res))
         elif Updater.update_ready is None:
-            _ = Updater.check_for_update(now=True)
-
-            atr = AddonUpdaterInstallPopup.bl_idname.split(".")
-            getattr(getattr(bpy.ops, atr[0]), atr[1])('INVOKE_DEFAULT')
+            # Never wait for the network here, UI shows result once it's known.
+            Updater.check_for_update_now(ui_refresh)
+            self.report({'INFO'}, "Checking for update, try again once finished")
         else:
             if Updater.verbose:
                 print("Doing nothing, not ready for update")
@@ -258,9 +259,9 @@ class AddonUpdaterUpdateNow(bpy.types.Operator):
                 atr = AddonUpdaterInstallManually.bl_idname.split(".")
                 getattr(getattr(bpy.ops, atr[0]), atr[1])('INVOKE_DEFAULT')
         elif Updater.update_ready is None:
-            update_ready, version, link = Updater.check_for_update(now=True)
-            atr = AddonUpdaterInstallPopup.bl_idname.split(".")
-            getattr(getattr(bpy.ops, atr[0]), atr[1])('INVOKE_DEFAULT')
+            # Never wait for the network here, UI shows result once it's known.
+            Updater.check_for_update_now(ui_refresh)
+            self.report({'INFO'}, "Checking for update, try again once finished")
 
         elif Updater.update_ready is False:
             self.report({'INFO'}, "Nothing to update")
@@ -622,11 +623,11 @@ def check_for_update_background():
     settings = get_user_preferences(bpy.context)
     if not settings:
         return
-    Updater.set_check_interval(enable=settings.auto_check_update,
+    Updater.set_check_interval(enabled=settings.auto_check_update,
                                months=settings.updater_interval_months,
-                               days=settings.updater_intrval_days,
-                               hours=settings.updater_intrval_hours,
-                               minutes=settings.updater_intrval_minutes)
+                               days=settings.updater_interval_days,
+                               hours=settings.updater_interval_hours,
+                               minutes=settings.updater_interval_minutes)
 
     if Updater.verbose:
         print("{} updater: Running background check for update".format(Updater.addon))
@@ -634,35 +635,11 @@ def check_for_update_background():
     ran_background_check = True
 
 
-def check_for_update_nonthreaded(self, _):
-    if Updater.invalid_updater is True:
-        return
-
-    settings = get_user_preferences(bpy.context)
-    if not settings:
-        if Updater.verbose:
-            print("Could not get {} preferences, update check skipped".format(
-                __package__))
-        return
-    Updater.set_check_interval(enable=settings.auto_check_update,
-                               months=settings.updater_interval_months,
-                               days=settings.updater_intrval_days,
-                               hours=settings.updater_intrval_hours,
-                               minutes=settings.updater_intrval_minutes)
-
-    update_ready, version, link = Updater.check_for_update(now=False)
-    if update_ready is True:
-        atr = AddonUpdaterInstallPopup.bl_idname.split(".")
-        getattr(getattr(bpy.ops, atr[0]), atr[1])('INVOKE_DEFAULT')
-    else:
-        if Updater.verbose:
-            print("No update ready")
-        self.report({'INFO'}, "No update ready")
-
-
 def show_reload_popup():
     if not hasattr(Updater, 'invalid_updater') or Updater.invalid_updater is True:
         return
+    if not Updater.json_loaded:
+        return 0.25  # Poll until the state file is read in background.
     saved_state = Updater.json
     global ran_update_sucess_popup
 
@@ -1072,13 +1049,19 @@ def register(bl_info):
         make_annotations(cls)
         bpy.utils.register_class(cls)
 
-    show_reload_popup()
+    # Reading the state file waits for disk, so it's read by a background
+    # thread and the popup check polls for it.
+    Updater.start_async_json_load()
+    bpy.app.timers.register(show_reload_popup, first_interval=0.5)
 
 
 def unregister():
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
 
+    if bpy.app.timers.is_registered(show_reload_popup):
+        bpy.app.timers.unregister(show_reload_popup)
+    Updater.stop_async_check_update()
     Updater.clear_state()
 
     global ran_autocheck_install_popup
@@ -0,0 +1,9 @@
+"""
+Headless benchmarks of QuickImport buffer parsing and mesh data processing
+
+Runs outside of Blender on plain Python with numpy, from repository root:
+    python -m benchmarks --vertices 10000,100000
+    python -m benchmarks --compare <commit>
+Add-on enable time is measured inside Blender instead:
+    blender -b --factory-startup --python benchmarks/enable_time.py
+"""
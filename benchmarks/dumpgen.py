@@ -0,0 +1,297 @@
+"""
+Generator of synthetic 3DMigoto dumps
+
+Writes frame analysis dumps (vb*.txt / .buf, ib.txt / .buf and log.txt) and raw buffers (.vb*, .ib, .fmt, .vgmap)
+of a grid mesh with configurable vertex count, semantics and formats. Data is random but seeded,
+so the same arguments always produce the same files.
+"""
+import json
+import os
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy
+
+from quickimport.modules.core.datastructures import format_components, format_numpy_type, format_size
+
+
+@dataclass
+class ElementSpec:
+    semantic: str
+    format: str
+    slot: int = 0
+    index: int = 0
+
+    @property
+    def name(self) -> str:
+        return f"{self.semantic}{self.index or ''}"
+
+
+DEFAULT_LAYOUT = [
+    ElementSpec("POSITION", "R32G32B32_FLOAT", 0),
+    ElementSpec("NORMAL", "R32G32B32_FLOAT", 0),
+    ElementSpec("TANGENT", "R32G32B32A32_FLOAT", 0),
+    ElementSpec("COLOR", "R8G8B8A8_UNORM", 1),
+    ElementSpec("TEXCOORD", "R32G32_FLOAT", 1),
+    ElementSpec("TEXCOORD", "R16G16_FLOAT", 1, index=1),
+    ElementSpec("BLENDWEIGHT", "R32G32B32A32_FLOAT", 2),
+    ElementSpec("BLENDINDICES", "R32G32B32A32_UINT", 2),
+]
+
+
+def parse_layout(text: str) -> list[ElementSpec]:
+    """Parses comma separated NAME=FORMAT@SLOT list, e.g. POSITION=R32G32B32_FLOAT@0,TEXCOORD1=R16G16_FLOAT@1"""
+    layout = []
+    for item in text.split(","):
+        name, _, rest = item.strip().partition("=")
+        fmt, _, slot = rest.partition("@")
+        semantic = name.rstrip("0123456789")
+        index = int(name[len(semantic):] or 0)
+        layout.append(ElementSpec(semantic, fmt, int(slot or 0), index))
+    return layout
+
+
+@dataclass
+class SyntheticMesh:
+    """Grid mesh with values of every layout element kept decoded, as (V, C) arrays"""
+    layout: list[ElementSpec]
+    values: dict[str, numpy.ndarray]
+    faces: numpy.ndarray
+    num_groups: int
+    # Byte offset of every element within its slot and byte stride of every slot
+    offsets: dict[str, int] = field(default_factory=dict)
+    strides: dict[int, int] = field(default_factory=dict)
+
+    def __post_init__(self):
+        for elem in self.layout:
+            self.offsets[elem.name] = self.strides.get(elem.slot, 0)
+            self.strides[elem.slot] = self.offsets[elem.name] + format_size(elem.format)
+
+    @property
+    def vertex_count(self) -> int:
+        return len(next(iter(self.values.values())))
+
+    @property
+    def slots(self) -> list[int]:
+        return sorted(self.strides)
+
+    def get_slot_elements(self, slot: int) -> list[ElementSpec]:
+        return [elem for elem in self.layout if elem.slot == slot]
+
+    def encode_slot(self, slot: int) -> bytes:
+        elements = self.get_slot_elements(slot)
+        dtype = numpy.dtype({
+            "names": [elem.name for elem in elements],
+            "formats": [(format_numpy_type(elem.format)[0], format_components(elem.format)) for elem in elements],
+            "offsets": [self.offsets[elem.name] for elem in elements],
+            "itemsize": self.strides[slot],
+        })
+        records = numpy.zeros(self.vertex_count, dtype)
+        for elem in elements:
+            numpy_type, scale = format_numpy_type(elem.format)
+            data = self.values[elem.name]
+            if scale is not None:
+                data = numpy.around(data * scale)
+            records[elem.name] = data.astype(numpy_type)
+        return records.tobytes()
+
+
+def make_mesh(
+    vertex_count: int,
+    layout: Optional[list[ElementSpec]] = None,
+    num_groups: int = 64,
+    seed: int = 0,
+) -> SyntheticMesh:
+    """Makes grid of roughly vertex_count vertices, every quad is split into two triangles"""
+    layout = layout or DEFAULT_LAYOUT
+    rng = numpy.random.default_rng(seed)
+
+    width = max(int(numpy.sqrt(vertex_count)), 2)
+    height = max(vertex_count // width, 2)
+    num_vertices = width * height
+
+    x, y = numpy.meshgrid(numpy.arange(width, dtype=numpy.float32), numpy.arange(height, dtype=numpy.float32))
+    grid = numpy.stack([x.ravel(), y.ravel(), rng.random(num_vertices, dtype=numpy.float32)], axis=1)
+
+    quads = (numpy.arange(height - 1)[:, None] * width + numpy.arange(width - 1)).ravel()
+    faces = numpy.concatenate([
+        numpy.stack([quads, quads + 1, quads + width], axis=1),
+        numpy.stack([quads + 1, quads + width + 1, quads + width], axis=1),
+    ]).astype(numpy.uint32)
+
+    values = {}
+    for elem in layout:
+        components = format_components(elem.format)
+        if elem.semantic == "POSITION":
+            data = numpy.ones((num_vertices, components), numpy.float32)
+            data[:, :3] = grid[:, :components]
+        elif elem.semantic in ("NORMAL", "TANGENT", "BINORMAL"):
+            data = rng.standard_normal((num_vertices, components)).astype(numpy.float32)
+            data[:, :3] /= numpy.linalg.norm(data[:, :3], axis=1, keepdims=True)
+            if components == 4:
+                data[:, 3] = 1.0 if elem.semantic == "TANGENT" else 0.0
+        elif elem.semantic == "BLENDINDICES":
+            data = rng.integers(0, num_groups, (num_vertices, components))
+        elif elem.semantic == "BLENDWEIGHT":
+            data = rng.random((num_vertices, components), dtype=numpy.float32)
+            data /= data.sum(axis=1, keepdims=True)
+        else:
+            data = rng.random((num_vertices, components), dtype=numpy.float32)
+        if elem.format.endswith("SNORM"):
+            data = data * 2.0 - 1.0
+        if elem.format.endswith("UNORM") or elem.format.endswith("SNORM"):
+            # Keep values exactly representable, so text and binary dumps decode to the same numbers
+            scale = format_numpy_type(elem.format)[1]
+            data = numpy.around(data * scale) / scale
+        values[elem.name] = data
+
+    return SyntheticMesh(layout, values, faces, num_groups)
+
+
+def format_layout(mesh: SyntheticMesh) -> str:
+    lines = []
+    for i, elem in enumerate(mesh.layout):
+        lines += [
+            f"element[{i}]:",
+            f"  SemanticName: {elem.semantic}",
+            f"  SemanticIndex: {elem.index}",
+            f"  Format: {elem.format}",
+            f"  InputSlot: {elem.slot}",
+            f"  AlignedByteOffset: {mesh.offsets[elem.name]}",
+            "  InputSlotClass: per-vertex",
+            "  InstanceDataStepRate: 0",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def format_values(data: numpy.ndarray, is_int: bool) -> list[str]:
+    if is_int:
+        return [", ".join(map(str, row)) for row in data.tolist()]
+    return [", ".join(f"{value:.9g}" for value in row) for row in data.tolist()]
+
+
+def write_vb_txt(mesh: SyntheticMesh, slot: int, path: str):
+    elements = mesh.get_slot_elements(slot)
+    rows = {
+        elem.name: format_values(mesh.values[elem.name], elem.format.endswith("INT"))
+        for elem in elements
+    }
+    with open(path, "w") as f:
+        f.write(f"stride: {mesh.strides[slot]}\n")
+        f.write("byte offset: 0\n")
+        f.write("first vertex: 0\n")
+        f.write(f"vertex count: {mesh.vertex_count}\n")
+        f.write("topology: trianglelist\n")
+        f.write(format_layout(mesh))
+        f.write("\nvertex-data:\n\n")
+        for i in range(mesh.vertex_count):
+            for elem in elements:
+                f.write(f"vb{slot}[{i}]+{mesh.offsets[elem.name]:03} {elem.name}: {rows[elem.name][i]}\n")
+            f.write("\n")
+
+
+def write_ib_txt(mesh: SyntheticMesh, path: str, ib_format: str):
+    with open(path, "w") as f:
+        f.write("byte offset: 0\n")
+        f.write("first index: 0\n")
+        f.write(f"index count: {mesh.faces.size}\n")
+        f.write("topology: trianglelist\n")
+        f.write(f"format: DXGI_FORMAT_{ib_format}\n")
+        f.write("\n")
+        f.write("\n".join(" ".join(map(str, face)) for face in mesh.faces.tolist()))
+        f.write("\n")
+
+
+def encode_indices(mesh: SyntheticMesh, ib_format: str) -> bytes:
+    return mesh.faces.astype(format_numpy_type(ib_format)[0]).tobytes()
+
+
+def get_ib_format(mesh: SyntheticMesh) -> str:
+    return "R16_UINT" if mesh.vertex_count <= 0xFFFF else "R32_UINT"
+
+
+def write_frame_analysis_log(mesh: SyntheticMesh, path: str, draw_calls: int, draw_call: int, vb_hashes: dict[int, str]):
+    """Writes log of draw_calls draw calls, the one with draw_call index binds the generated buffers"""
+    rng = numpy.random.default_rng(draw_calls)
+    with open(path, "w") as f:
+        for i in range(draw_calls):
+            f.write(f"{i:06} IASetVertexBuffers(StartSlot:0, NumBuffers:{len(mesh.slots)}, ppVertexBuffers:0x0000000000000000, pStrides:0x0000000000000000, pOffsets:0x0000000000000000)\n")
+            for slot in mesh.slots:
+                if i == draw_call:
+                    buffer_hash = vb_hashes[slot]
+                else:
+                    buffer_hash = f"{rng.integers(0, 2 ** 32):08x}"
+                address = int(buffer_hash, 16) * 0x10
+                f.write(f"       {slot}: resource=0x{address:016X} hash={buffer_hash}\n")
+            if i % 16 == 0:
+                f.write(f"{i:06} SOSetTargets(NumBuffers:1, ppSOTargets:0x0000000000000000, pOffsets:0x0000000000000000)\n")
+                f.write(f"       0: resource=0x{(i + 1) * 0x1000:016X} hash={i + 1:08x}\n")
+            f.write(f"{i:06} DrawIndexed(IndexCount:{mesh.faces.size}, StartIndexLocation:0, BaseVertexLocation:0)\n")
+        f.write(f"{draw_calls:06} Present(SyncInterval:1, Flags:0)\n")
+
+
+def write_frame_analysis_dump(
+    mesh: SyntheticMesh,
+    folder: str,
+    draw_calls: int = 100,
+    draw_call: int = 1,
+) -> dict[str, list[str]]:
+    """Writes frame analysis dump of mesh, returns written paths keyed by kind"""
+    os.makedirs(folder, exist_ok=True)
+    shaders = "vs=0123456789abcdef-ps=fedcba9876543210"
+    ib_format = get_ib_format(mesh)
+    vb_hashes = {slot: f"{0x1000 + slot:08x}" for slot in mesh.slots}
+
+    paths = {"vb_txt": [], "vb_buf": [], "ib_txt": [], "ib_buf": [], "log": []}
+    for slot in mesh.slots:
+        prefix = os.path.join(folder, f"{draw_call:06}-vb{slot}={vb_hashes[slot]}-{shaders}")
+        write_vb_txt(mesh, slot, prefix + ".txt")
+        with open(prefix + ".buf", "wb") as f:
+            f.write(mesh.encode_slot(slot))
+        paths["vb_txt"].append(prefix + ".txt")
+        paths["vb_buf"].append(prefix + ".buf")
+
+    prefix = os.path.join(folder, f"{draw_call:06}-ib=0000abcd-{shaders}")
+    write_ib_txt(mesh, prefix + ".txt", ib_format)
+    with open(prefix + ".buf", "wb") as f:
+        f.write(encode_indices(mesh, ib_format))
+    paths["ib_txt"].append(prefix + ".txt")
+    paths["ib_buf"].append(prefix + ".buf")
+
+    log_path = os.path.join(folder, "log.txt")
+    write_frame_analysis_log(mesh, log_path, draw_calls, draw_call, vb_hashes)
+    paths["log"].append(log_path)
+
+    return paths
+
+
+def write_raw_buffers(mesh: SyntheticMesh, folder: str, name: str = "Synthetic") -> dict[str, list[str]]:
+    """Writes raw buffers in exported mod layout: name.vb*, name.ib, name.fmt and name.vgmap"""
+    os.makedirs(folder, exist_ok=True)
+    prefix = os.path.join(folder, name)
+    ib_format = get_ib_format(mesh)
+
+    paths = {"vb": [], "ib": [prefix + ".ib"], "fmt": [prefix + ".fmt"], "vgmap": [prefix + ".vgmap"]}
+    for slot in mesh.slots:
+        with open(f"{prefix}.vb{slot}", "wb") as f:
+            f.write(mesh.encode_slot(slot))
+        paths["vb"].append(f"{prefix}.vb{slot}")
+
+    with open(prefix + ".ib", "wb") as f:
+        f.write(encode_indices(mesh, ib_format))
+
+    with open(prefix + ".fmt", "w") as f:
+        if len(mesh.slots) == 1:
+            f.write(f"stride: {mesh.strides[mesh.slots[0]]}\n")
+        else:
+            for slot in mesh.slots:
+                f.write(f"vb{slot} stride: {mesh.strides[slot]}\n")
+        f.write("topology: trianglelist\n")
+        f.write(f"format: DXGI_FORMAT_{ib_format}\n")
+        f.write(format_layout(mesh))
+
+    with open(prefix + ".vgmap", "w") as f:
+        json.dump({str(i): i for i in range(mesh.num_groups)}, f, indent=2)
+
+    return paths
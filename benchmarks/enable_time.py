@@ -0,0 +1,36 @@
+"""
+Measures how long enabling the add-on takes, run by Blender from repository root:
+    blender -b --factory-startup --python benchmarks/enable_time.py -- [add-on module name]
+Modules stay imported once the add-on is enabled, so every measurement needs a fresh Blender process
+"""
+import sys
+import time
+
+import addon_utils
+import bpy
+
+
+ADDON_NAME = "XXMI Scripts & Quick Import"
+
+
+def find_addon_module() -> str:
+    for module in addon_utils.modules():
+        if module.bl_info.get("name") == ADDON_NAME:
+            return module.__name__
+    raise SystemExit(f"{ADDON_NAME} is not installed")
+
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    module_name = argv[0] if argv else find_addon_module()
+
+    numpy_loaded = "numpy" in sys.modules
+    start_time = time.perf_counter()
+    addon_utils.enable(module_name, default_set=False)
+    duration = time.perf_counter() - start_time
+
+    print(f"Blender {bpy.app.version_string}: enabled {module_name} in {duration * 1000:.1f} ms")
+    print(f"numpy loaded before enable: {numpy_loaded}, after enable: {'numpy' in sys.modules}")
+
+
+main()
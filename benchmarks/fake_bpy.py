@@ -0,0 +1,100 @@
+"""
+Lightweight stand-in of bpy.types.Mesh for benchmarks run outside of Blender
+
+FakeMesh only tracks element counts and records every foreach_set / foreach_get call, so benchmarks
+can report how much data the mesh builder moves into Blender without actually creating a mesh.
+"""
+import importlib.util
+import sys
+import types
+
+from dataclasses import dataclass
+
+import numpy
+
+
+@dataclass
+class ForeachCall:
+    target: str
+    attribute: str
+    method: str
+    values: int
+    bytes: int
+
+
+class FakeCollection:
+    def __init__(self, mesh: "FakeMesh", name: str):
+        self.mesh = mesh
+        self.name = name
+        self.length = 0
+
+    def __len__(self) -> int:
+        return self.length
+
+    def add(self, count: int):
+        self.length += count
+
+    def foreach_set(self, attribute: str, seq):
+        self.mesh.record(self.name, attribute, "foreach_set", seq)
+
+    def foreach_get(self, attribute: str, seq):
+        self.mesh.record(self.name, attribute, "foreach_get", seq)
+
+
+class FakeAttribute:
+    def __init__(self, mesh: "FakeMesh", name: str):
+        self.name = name
+        self.data = FakeCollection(mesh, name)
+
+
+class FakeAttributes(dict):
+    """Mesh attributes, UV layers and color layers, built-in attributes are created on first access"""
+
+    def __init__(self, mesh: "FakeMesh"):
+        super().__init__()
+        self.mesh = mesh
+
+    def __missing__(self, name: str) -> FakeAttribute:
+        self[name] = FakeAttribute(self.mesh, name)
+        return self[name]
+
+    def new(self, name: str, type: str = None, domain: str = None) -> FakeAttribute:
+        return self[name]
+
+
+class FakeMesh:
+    def __init__(self, name: str = "Mesh"):
+        self.name = name
+        self.calls: list[ForeachCall] = []
+        self.vertices = FakeCollection(self, "vertices")
+        self.edges = FakeCollection(self, "edges")
+        self.loops = FakeCollection(self, "loops")
+        self.polygons = FakeCollection(self, "polygons")
+        self.attributes = FakeAttributes(self)
+        self.color_attributes = FakeAttributes(self)
+        self.uv_layers = FakeAttributes(self)
+        self.vertex_colors = FakeAttributes(self)
+
+    def record(self, target: str, attribute: str, method: str, seq):
+        data = numpy.asarray(seq)
+        self.calls.append(ForeachCall(target, attribute, method, data.size, data.nbytes))
+
+    def get_counters(self) -> dict[str, int]:
+        return {
+            "foreach_calls": len(self.calls),
+            "foreach_values": sum(call.values for call in self.calls),
+            "foreach_bytes": sum(call.bytes for call in self.calls),
+        }
+
+
+def install_fake_bpy(version: tuple = (4, 2, 0)):
+    """
+    Registers minimal bpy module, so modules that only need bpy.app.version and bpy.types.Mesh can be imported
+    Does nothing when real bpy is available
+    """
+    if importlib.util.find_spec("bpy") is not None:
+        return
+    module = types.ModuleType("bpy")
+    module.app = types.SimpleNamespace(version=version)
+    module.types = types.SimpleNamespace(Mesh=FakeMesh)
+    sys.modules["bpy"] = module
@@ -0,0 +1,396 @@
+"""
+Benchmarks of Blender-independent import and export code
+
+Every benchmark prepares its input from synthetic dump once per vertex count and times only the measured call.
+Results are stored as JSON named after the current commit, so runs of different commits can be compared.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import numpy
+
+from .dumpgen import SyntheticMesh, make_mesh, parse_layout, write_frame_analysis_dump, write_raw_buffers
+from .fake_bpy import FakeMesh, install_fake_bpy
+
+install_fake_bpy()
+
+from quickimport.modules.core import metrics  # noqa: E402
+from quickimport.modules.core.datastructures import FALogFile, IndexBuffer, VertexBufferGroup, recalculated_semantics  # noqa: E402
+from quickimport.modules.core import converters  # noqa: E402
+from quickimport.modules.core.byte_buffer import NumpyBuffer  # noqa: E402
+from quickimport.modules.data.mesh_builder import BlenderMeshBuilder  # noqa: E402
+from quickimport.modules.core.migoto_buffers import load_vertex_buffer  # noqa: E402
+from quickimport.modules.core.shape_keys import make_sparse_shapekeys  # noqa: E402
+from quickimport.modules.core.topology import build_triangle_edges  # noqa: E402
+from quickimport.modules.core.welding import weld_vertices  # noqa: E402
+
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+class QuietOperator:
+    """Collects reports passed to operator argument, so exporters don't print during timing"""
+
+    def __init__(self):
+        self.reports = []
+
+    def report(self, report_type: set, message: str):
+        self.reports.append((report_type, message))
+
+
+@dataclass
+class Fixture:
+    """Synthetic mesh and its dumps shared by all benchmarks of single vertex count"""
+    mesh: SyntheticMesh
+    dump: dict[str, list[str]]
+    raw: dict[str, list[str]]
+    output_dir: str
+
+
+# Benchmark functions take fixture and return callable to time, the callable returns counters of single run
+benchmarks: dict[str, Callable[[Fixture], Callable[[], dict]]] = {}
+
+
+def benchmark(name: str):
+    def register(func):
+        benchmarks[name] = func
+        return func
+    return register
+
+
+def load_vertex_buffer_group(fixture: Fixture, load_vertices: bool) -> VertexBufferGroup:
+    vb = VertexBufferGroup(skip_semantics=recalculated_semantics)
+    vb.parse_vb_bin(list(zip(fixture.dump["vb_buf"], fixture.dump["vb_txt"])), load_vertices=load_vertices)
+    return vb
+
+
+@benchmark("vb_txt_parse")
+def bench_vb_txt_parse(fixture):
+    def run():
+        vb = VertexBufferGroup(fixture.dump["vb_txt"], skip_semantics=recalculated_semantics)
+        return {"vertices": len(vb.vertices), "bytes": sum(map(os.path.getsize, fixture.dump["vb_txt"]))}
+    return run
+
+
+@benchmark("vb_bin_numpy_load")
+def bench_vb_bin_numpy_load(fixture):
+    def run():
+        vertex_buffer = load_vertex_buffer(load_vertex_buffer_group(fixture, load_vertices=False))
+        return {"vertices": len(vertex_buffer.data), "bytes": vertex_buffer.data.nbytes}
+    return run
+
+
+@benchmark("vb_bin_legacy_decode")
+def bench_vb_bin_legacy_decode(fixture):
+    def run():
+        vb = load_vertex_buffer_group(fixture, load_vertices=True)
+        return {"vertices": len(vb.vertices)}
+    return run
+
+
+@benchmark("raw_buffers_load")
+def bench_raw_buffers_load(fixture):
+    fmt_path = fixture.raw["fmt"][0]
+
+    def run():
+        vb = VertexBufferGroup(skip_semantics=recalculated_semantics)
+        vb.parse_vb_bin([(path, fmt_path) for path in fixture.raw["vb"]], load_vertices=False)
+        vertex_buffer = load_vertex_buffer(vb)
+        with open(fmt_path, "r") as f:
+            ib = IndexBuffer(f, load_indices=False)
+        with open(fixture.raw["ib"][0], "rb") as f:
+            ib.parse_ib_bin(f)
+        return {"vertices": len(vertex_buffer.data), "indices": ib.index_count}
+    return run
+
+
+@benchmark("ib_txt_parse")
+def bench_ib_txt_parse(fixture):
+    def run():
+        with open(fixture.dump["ib_txt"][0], "r") as f:
+            ib = IndexBuffer(f)
+        return {"indices": ib.index_count}
+    return run
+
+
+@benchmark("ib_bin_parse")
+def bench_ib_bin_parse(fixture):
+    def run():
+        with open(fixture.dump["ib_txt"][0], "r") as f:
+            ib = IndexBuffer(f, load_indices=False)
+        with open(fixture.dump["ib_buf"][0], "rb") as f:
+            ib.parse_ib_bin(f)
+        return {"indices": ib.index_count}
+    return run
+
+
+@benchmark("fa_log_parse")
+def bench_fa_log_parse(fixture):
+    def run():
+        with open(fixture.dump["log"][0], "r") as f:
+            log = FALogFile(f)
+        uses = log.find_resource_uses(0x1000 * 0x10, "vb")
+        return {"draw_calls": log.draw_call, "resource_uses": len(uses)}
+    return run
+
+
+@benchmark("vb_write")
+def bench_vb_write(fixture):
+    vb = load_vertex_buffer_group(fixture, load_vertices=True)
+    strides = {str(slot): stride for slot, stride in fixture.mesh.strides.items()}
+    prefix = os.path.join(fixture.output_dir, "Write.vb")
+
+    def run():
+        written = vb.write(prefix, strides, operator=QuietOperator())
+        return {"vertices": len(vb), "bytes": written}
+    return run
+
+
+@benchmark("ib_write")
+def bench_ib_write(fixture):
+    with open(fixture.dump["ib_txt"][0], "r") as f:
+        ib = IndexBuffer(f)
+    path = os.path.join(fixture.output_dir, "Write.ib")
+
+    def run():
+        with open(path, "wb") as f:
+            written = ib.write(f, operator=QuietOperator())
+        return {"indices": ib.index_count, "bytes": written}
+    return run
+
+
+@benchmark("numpy_buffer_dedupe")
+def bench_numpy_buffer_dedupe(fixture):
+    vertex_buffer = load_vertex_buffer(load_vertex_buffer_group(fixture, load_vertices=False))
+    # Per-loop copy of vertex data is what export deduplicates
+    loop_data = vertex_buffer.data[fixture.mesh.faces.ravel()]
+
+    def run():
+        buffer = NumpyBuffer(vertex_buffer.layout, loop_data.copy())
+        buffer.remove_duplicates()
+        return {"loops": len(loop_data), "vertices": len(buffer.data)}
+    return run
+
+
+@benchmark("export_converters")
+def bench_export_converters(fixture):
+    values = fixture.mesh.values
+    loop_vertex_ids = fixture.mesh.faces.ravel()
+    # Export converts per-loop data fetched from Blender
+    positions = values["POSITION"][loop_vertex_ids, :3]
+    texcoords = values["TEXCOORD"][loop_vertex_ids] if "TEXCOORD" in values else positions[:, :2]
+    weights = values["BLENDWEIGHT"][loop_vertex_ids] if "BLENDWEIGHT" in values else positions
+
+    def run():
+        converters.resize_second_dim(converters.mirror_vector(positions.copy()), 4, fill=1)
+        converters.flip_texcoord_v(texcoords.copy())
+        converters.normalize_weights(weights)
+        converters.rgb_to_bgr_vector(fixture.mesh.faces)
+        return {"loops": len(loop_vertex_ids)}
+    return run
+
+
+@benchmark("weld_vertices")
+def bench_weld_vertices(fixture):
+    values = fixture.mesh.values
+    attributes = [values[name] for name in ("BLENDINDICES", "BLENDWEIGHT") if name in values]
+
+    def run():
+        weld = weld_vertices(values["POSITION"], 1e-4, attributes=attributes)
+        return {"vertices": len(weld.remap), "welded": len(weld)}
+    return run
+
+
+@benchmark("triangle_edges")
+def bench_triangle_edges(fixture):
+    faces = fixture.mesh.faces.astype(numpy.int32)
+
+    def run():
+        edges, loop_edges = build_triangle_edges(faces, fixture.mesh.vertex_count)
+        return {"faces": len(faces), "edges": len(edges)}
+    return run
+
+
+@benchmark("sparse_shapekeys")
+def bench_sparse_shapekeys(fixture):
+    rng = numpy.random.default_rng(0)
+    num_vertices = fixture.mesh.vertex_count
+    offsets = numpy.zeros((8, num_vertices, 3), numpy.float32)
+    for shapekey in offsets:
+        moved = rng.choice(num_vertices, num_vertices // 10, replace=False)
+        shapekey[moved] = rng.standard_normal((len(moved), 3))
+    names = [f"Deform {i}" for i in range(len(offsets))]
+
+    def run():
+        shapekeys = make_sparse_shapekeys(names, offsets, 1e-6)
+        return {"shapekeys": len(shapekeys), "deltas": sum(map(len, shapekeys))}
+    return run
+
+
+@benchmark("mesh_builder")
+def bench_mesh_builder(fixture):
+    mesh_data = fixture.mesh
+    loop_vertex_ids = mesh_data.faces.ravel()
+    edges, loop_edges = build_triangle_edges(mesh_data.faces.astype(numpy.int32), mesh_data.vertex_count)
+    uvs = mesh_data.values["TEXCOORD"][loop_vertex_ids] if "TEXCOORD" in mesh_data.values else None
+    colors = mesh_data.values["COLOR"][loop_vertex_ids] if "COLOR" in mesh_data.values else None
+
+    def run():
+        mesh = FakeMesh()
+        builder = BlenderMeshBuilder(mesh)
+        builder.add_triangles(mesh_data.faces)
+        builder.add_vertices(mesh_data.vertex_count)
+        builder.set_positions(mesh_data.values["POSITION"][:, :3])
+        builder.add_edges(edges, loop_edges)
+        if uvs is not None:
+            builder.add_uv_layer("TEXCOORD.xy", uvs)
+        if colors is not None:
+            builder.add_color_layer("COLOR", colors)
+        return mesh.get_counters()
+    return run
+
+
+def run_benchmark(prepare: Callable, fixture: Fixture, repeat: int) -> dict:
+    run = prepare(fixture)
+    durations = []
+    counters = {}
+    # Instrumented code prints its stages when no run is recorded, recorder keeps the output quiet
+    metrics.start("Benchmark")
+    try:
+        for _ in range(repeat):
+            start_time = time.perf_counter()
+            counters = run()
+            durations.append(time.perf_counter() - start_time)
+    finally:
+        metrics.discard()
+    result = {
+        "best": min(durations),
+        "median": statistics.median(durations),
+        "repeat": repeat,
+        "counters": {name: int(value) for name, value in counters.items()},
+    }
+    # Benchmarks producing output report its size, throughput is based on the best run
+    if counters.get("bytes"):
+        result["mb_per_s"] = counters["bytes"] / 1e6 / result["best"]
+    return result
+
+
+def get_commit() -> str:
+    """Returns short hash of current commit, marked as dirty when working tree has changes"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=root, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(["git", "diff", "--quiet", "HEAD"], cwd=root).returncode != 0
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return commit + ("-dirty" if dirty else "")
+
+
+def make_fixture(vertex_count: int, layout_text: Optional[str], folder: str) -> Fixture:
+    layout = parse_layout(layout_text) if layout_text else None
+    mesh = make_mesh(vertex_count, layout)
+    output_dir = os.path.join(folder, "output")
+    os.makedirs(output_dir, exist_ok=True)
+    return Fixture(
+        mesh=mesh,
+        dump=write_frame_analysis_dump(mesh, os.path.join(folder, "FrameAnalysis")),
+        raw=write_raw_buffers(mesh, os.path.join(folder, "Raw")),
+        output_dir=output_dir,
+    )
+
+
+def run_suite(vertex_counts: list[int], names: list[str], repeat: int, layout_text: Optional[str]) -> list[dict]:
+    results = []
+    for vertex_count in vertex_counts:
+        with tempfile.TemporaryDirectory(prefix="quickimport-bench-") as folder:
+            fixture = make_fixture(vertex_count, layout_text, folder)
+            for name in names:
+                result = run_benchmark(benchmarks[name], fixture, repeat)
+                result.update(name=name, vertices=fixture.mesh.vertex_count)
+                results.append(result)
+                throughput = f"  {result['mb_per_s']:9.1f} MB/s" if "mb_per_s" in result else ""
+                print(f"{name:<24} {fixture.mesh.vertex_count:>9} vertices  best {result['best'] * 1000:9.2f} ms"
+                      f"  median {result['median'] * 1000:9.2f} ms{throughput}")
+    return results
+
+
+def compare(results: list[dict], baseline: dict, threshold: float) -> bool:
+    """Prints timing ratios against baseline report, returns False if any benchmark got slower than threshold"""
+    baseline_results = {(r["name"], r["vertices"]): r for r in baseline["results"]}
+    ok = True
+    print(f"\nCompared to {baseline['commit']}:")
+    for result in results:
+        previous = baseline_results.get((result["name"], result["vertices"]))
+        if previous is None:
+            continue
+        ratio = result["best"] / previous["best"]
+        regressed = ratio > threshold
+        ok &= not regressed
+        print(f"{result['name']:<24} {result['vertices']:>9} vertices  x{ratio:5.2f}{'  REGRESSION' if regressed else ''}")
+    return ok
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--vertices", default="10000,100000", help="comma separated vertex counts")
+    parser.add_argument("--layout", help="comma separated NAME=FORMAT@SLOT elements, e.g. POSITION=R32G32B32_FLOAT@0")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", help="comma separated benchmark names")
+    parser.add_argument("--results-dir", default=RESULTS_DIR)
+    parser.add_argument("--compare", help="commit or report path to compare with")
+    parser.add_argument("--threshold", type=float, default=1.2, help="slowdown ratio reported as regression")
+    parser.add_argument("--list", action="store_true", help="list benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(benchmarks))
+        return 0
+
+    names = args.only.split(",") if args.only else list(benchmarks)
+    unknown = [name for name in names if name not in benchmarks]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+
+    # Baseline is read first, it may be the report of current commit this run overwrites
+    baseline = None
+    if args.compare:
+        baseline_path = args.compare
+        if not os.path.isfile(baseline_path):
+            baseline_path = os.path.join(args.results_dir, f"{args.compare}.json")
+        with open(baseline_path, "r") as f:
+            baseline = json.load(f)
+
+    vertex_counts = [int(count) for count in args.vertices.split(",")]
+    results = run_suite(vertex_counts, names, args.repeat, args.layout)
+
+    report = {
+        "commit": get_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "numpy": numpy.__version__,
+        "platform": platform.platform(),
+        "layout": args.layout,
+        "results": results,
+    }
+    os.makedirs(args.results_dir, exist_ok=True)
+    report_path = os.path.join(args.results_dir, f"{report['commit']}.json")
+    with open(report_path, "w") as f:
+        json.dump(report, f, indent=4)
+    print(f"\nResults written to {report_path}")
+
+    if baseline is not None and not compare(results, baseline, args.threshold):
+        return 1
+
+    return 0
@@ -0,0 +1,525 @@
+
+import bpy #type: ignore
+import os
+from .modules.import_ops import QuickImportXXMIFrameAnalysis, QuickImport3DMigotoRaw
+from .modules.datahandling import cleanup_meshes
+from .modules.import_job import ImportJob, OperatorImplementation
+from .modules.core import metrics
+from .texturehandling import TextureHandler, TextureHandler42
+import traceback
+
+COMBINED_NAME_KEYWORDS = ['Body', 'Head', 'Arm', 'Leg', 'Dress', 'Extra', 'Extras', 'Hair', 'Mask', 'Idle', 'Face', 'Wings']
+
+def split_combined_name(name):
+    """Splits name into (prefix, keyword, letter), returns None when no keyword matches"""
+    lower_name = name.lower()
+    for keyword in COMBINED_NAME_KEYWORDS:
+        keyword_index = lower_name.find(keyword.lower())
+        if keyword_index != -1:
+            # Find the actual keyword in the original case
+            actual_keyword = name[keyword_index:keyword_index + len(keyword)]
+            parts = name.split(actual_keyword)
+            prefix = parts[0]
+            letter = parts[1][0] if len(parts) > 1 and parts[1] else ''
+            return prefix, actual_keyword, letter
+    return None
+
+class MaterialIndex:
+    """Lookup tables of "mat_" materials by combined name and letter, built once per post-import pass"""
+    def __init__(self, materials):
+        self.by_combined_letter = {}
+        self.by_combined = {}
+        self.by_keyword_letter = {}
+        # Blender keeps materials sorted by name, first material wins like in a linear scan
+        for material in materials:
+            if not material.name.startswith("mat_"):
+                continue
+            split = split_combined_name(material.name[len("mat_"):])
+            if split is None:
+                continue
+            prefix, keyword, letter = split
+            combined_name = (prefix + keyword).lower()
+            self.by_combined_letter.setdefault((combined_name, letter.lower()), material)
+            self.by_combined.setdefault(combined_name, material)
+            self.by_keyword_letter.setdefault((keyword + letter).lower(), material)
+
+    def get(self, combined_name, letter=''):
+        return self.by_combined_letter.get((combined_name.lower(), letter.lower()))
+
+    def get_any_letter(self, combined_name):
+        return self.by_combined.get(combined_name.lower())
+
+    def get_by_keyword(self, keyword_with_letter):
+        return self.by_keyword_letter.get(keyword_with_letter.lower())
+
+class QuickImportBase:
+    # Seconds of Blender-side work done on every timer event of modal import
+    import_time_slice = 0.05
+    # Events modal import lets through, so viewport can be navigated while it runs
+    import_pass_through_events = {'MOUSEMOVE', 'MIDDLEMOUSE', 'WHEELUPMOUSE', 'WHEELDOWNMOUSE', 'TRACKPADPAN', 'TRACKPADZOOM'}
+
+    def use_background_import(self, context):
+        return context.scene.quick_import_settings.background_import and context.window is not None
+
+    def make_import_job(self, context):
+        return ImportJob(self, use_workers=self.use_background_import(context))
+
+    def run_import_job(self, context, job, report_dir):
+        """
+        Runs job right away, or starts modal import that runs it in time slices when background import is enabled
+        Stages are timed while job runs, stats report is written to report_dir once it's done
+        """
+        metrics.start(self.bl_label, trace_memory=context.scene.quick_import_settings.trace_memory)
+        # Post-import steps are added while job runs, stats are written once they're done too
+        job.add_final_step("Writing import stats", lambda context: metrics.stop(report_dir))
+
+        if not self.use_background_import(context):
+            # Recorder is stopped by the last step, anything but reported Fatal errors skips it
+            try:
+                job.run(context)
+            finally:
+                job.finish()
+                metrics.discard()
+            return {"FINISHED"}
+
+        wm = context.window_manager
+        self.import_job = job
+        self.import_timer = wm.event_timer_add(0.01, window=context.window)
+        wm.modal_handler_add(self.operator)
+        wm.progress_begin(0, 100)
+        return {"RUNNING_MODAL"}
+
+    def modal(self, context, event):
+        job = self.import_job
+
+        if event.type == 'ESC' and event.value == 'PRESS':
+            job.cancel()
+            metrics.discard()
+            self.report({'WARNING'}, "Import cancelled")
+            return self.end_import_job(context, {"CANCELLED"})
+
+        if event.type != 'TIMER':
+            if event.type in self.import_pass_through_events:
+                return {"PASS_THROUGH"}
+            return {"RUNNING_MODAL"}
+
+        try:
+            finished = job.run(context, self.import_time_slice)
+        except Exception as e:
+            traceback.print_exc()
+            job.cancel()
+            metrics.discard()
+            self.report({'ERROR'}, f"Import failed: {e}")
+            return self.end_import_job(context, {"CANCELLED"})
+
+        if finished:
+            job.finish()
+            return self.end_import_job(context, {"FINISHED"})
+
+        context.window_manager.progress_update(int(job.progress * 100))
+        context.workspace.status_text_set(f"Quick Import: {job.label} ({job.num_done}/{job.num_total}), Esc to cancel")
+        return {"RUNNING_MODAL"}
+
+    def end_import_job(self, context, result):
+        wm = context.window_manager
+        wm.event_timer_remove(self.import_timer)
+        wm.progress_end()
+        context.workspace.status_text_set(None)
+        # Panel shows stats of the last import
+        for area in context.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+        return result
+
+    def post_import_processing(self, context, folder):
+        for label, step in self.get_post_import_steps(context, folder):
+            step(context)
+
+    def get_post_import_steps(self, context, folder):
+        """
+        Returns post-import processing as list of (label, callable), so modal import can spread it over timer events
+        Every callable takes context it's run with, context passed here is only valid while steps are made
+        """
+        xxmi = context.scene.quick_import_settings
+        imported_objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        steps = []
+
+        if xxmi.reset_rotation:
+            steps.append(("Resetting rotation", self.reset_rotation))
+
+        # Single cleanup pass over all imported meshes, every option used to delete loose geometry as well
+        # Merge by distance isn't part of it, vertices are welded on import already
+        steps.append(("Cleaning up meshes", lambda context: cleanup_meshes(
+            [obj.data for obj in imported_objects],
+            tris_to_quads=xxmi.tri_to_quads,
+            delete_loose=xxmi.tri_to_quads or xxmi.merge_by_distance or xxmi.import_textures,
+        )))
+
+        if xxmi.import_textures:
+            steps.append(("Setting up textures", self.setup_textures))
+
+        if xxmi.create_collection:
+            steps.append(("Creating collection", lambda context: self.create_collection(context, folder)))
+
+        def assign_materials(context):
+            new_meshes = [obj for obj in imported_objects if obj.type == 'MESH']
+            print(f"New meshes detected: {[obj.name for obj in new_meshes]}")
+            if xxmi.import_textures:
+                self.assign_existing_materials(new_meshes)
+
+        steps.append(("Assigning materials", assign_materials))
+
+        if xxmi.import_face:
+            steps.append(("Importing face", self.import_face))
+
+        if xxmi.import_armature:
+            steps.append(("Importing armature", self.import_armature))
+
+        if xxmi.create_mesh_collection:
+            steps.append(("Creating mesh collection", lambda context: self.create_mesh_collection(context, folder)))
+
+        steps.append(("Finishing", lambda context: bpy.ops.object.select_all(action='DESELECT')))
+        return steps
+
+    def assign_existing_materials(self, new_meshes):
+        material_index = MaterialIndex(bpy.data.materials)
+        for obj in new_meshes:
+            if not obj.material_slots:
+                combined_name, letter = self.extract_combined_name(obj.name)
+                print(f"Combined name extracted for {obj.name}: '{combined_name}', letter: '{letter}'")
+
+                if combined_name:
+                    matching_material = self.find_matching_material(combined_name, letter, material_index)
+                    
+                    # If still no material found and it's a Dress, try finding any Body material
+                    if not matching_material and "Dress" in combined_name:
+                        prefix = combined_name.split("Dress")[0]
+                        matching_material = material_index.get_any_letter(f"{prefix}Body")
+                        if matching_material:
+                            print(f"Using generic Body material for Dress: {matching_material.name}")
+                
+                    if matching_material:
+                        obj.data.materials.append(matching_material)
+                        print(f"Assigned material {matching_material.name} to {obj.name}")
+                    else:
+                        print(f"No matching material found for {obj.name} with combined name '{combined_name}'")
+                else:
+                    print(f"No valid combined name found in {obj.name} to match materials")
+
+    def extract_combined_name(self, name):
+        split = split_combined_name(name)
+        if split is None:
+            print(f"No keywords matched in {name}")
+            return "", ""
+        prefix, actual_keyword, letter = split
+        combined_name = prefix + actual_keyword
+        print(f"Combined name '{combined_name}' created from '{prefix}' and '{actual_keyword}' for {name}, letter: '{letter}'")
+        return combined_name, letter
+
+    def find_matching_material(self, combined_name, letter, material_index=None):
+        if material_index is None:
+            material_index = MaterialIndex(bpy.data.materials)
+
+        # F4ck you Asta 
+        if combined_name.lower() == "astabody":
+            asta_material_mapping = {
+                'C': 'BodyB',
+                'D': 'BodyA',
+                'E': 'BodyB'
+            }
+            target_material_suffix = asta_material_mapping.get(letter)
+            if target_material_suffix:
+                material = material_index.get_by_keyword(target_material_suffix)
+                if material:
+                    print(f"Found material {material.name} for Asta rule with letter '{letter}'")
+                    return material
+                print(f"No Asta rule material found for letter '{letter}'")
+            else:
+                print(f"Letter '{letter}' does not match Asta rule requirements")
+            return None
+
+        # Standard matching logic for other prefixes, SCYLL WHY THE ENTIRE ALPHABET
+        letters = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+        start_index = letters.index(letter) if letter in letters else -1
+
+        for i in range(start_index, -1, -1):
+            current_letter = letters[i] if i >= 0 else ''
+            material = material_index.get(combined_name, current_letter)
+            if material:
+                return material
+
+        return None
+           
+    def create_collection(self, context, folder):
+        collection_name = os.path.basename(folder)
+        new_collection = bpy.data.collections.new(collection_name)
+        bpy.context.scene.collection.children.link(new_collection)
+
+        for obj in bpy.context.selected_objects:
+            if obj.users_collection:  
+                for coll in obj.users_collection:
+                    coll.objects.unlink(obj)
+            new_collection.objects.link(obj)
+            print(f"Moved {obj.name} to collection {collection_name}")
+
+    def create_mesh_collection(self, context, folder):
+        #Sins logic for collections with custom properties, 
+        # I will probably change this to don't use bmesh in futurec
+        import bmesh #type: ignore
+        collection_name = os.path.basename(folder)
+        new_collection = bpy.data.collections.new(collection_name+"_CustomProperties")
+        bpy.context.scene.collection.children.link(new_collection)
+        new_collection.color_tag = "COLOR_08"
+
+        selected_objects = [obj for obj in bpy.context.selected_objects]
+        for obj in selected_objects:
+            # Skip if object is an armature or in Face collection
+            if obj.type == 'ARMATURE' or (obj.users_collection and 'Face' in [c.name for c in obj.users_collection]):
+                print(f"Skipping {obj.name} as it is an armature or face mesh")
+                continue
+
+            if obj.name.startswith(collection_name):
+                bpy.ops.object.mode_set(mode='OBJECT')
+                bpy.context.scene.collection.objects.unlink(obj)
+                new_collection.objects.link(obj)
+                new_collection.hide_select = True
+
+                try:
+                    #duplicate data to new containers in collections
+                    name = obj.name.split(collection_name)[1].rsplit("-", 1)[0]
+                    new_sub_collection = bpy.data.collections.new(obj.name.rsplit("-", 1)[0])
+                    bpy.context.scene.collection.children.link(new_sub_collection)
+                    ob = bpy.data.objects.new(name = name, object_data = obj.data.copy())
+                    ob.location = obj.location
+                    ob.rotation_euler = obj.rotation_euler
+                    ob.scale = obj.scale
+                    new_sub_collection.objects.link(ob)
+
+                    #Del verts of imported containers
+                    if obj.type == 'MESH':
+                        bm = bmesh.new()
+                        bm.from_mesh(obj.data)
+                        [bm.verts.remove(v) for v in bm.verts]
+                        bm.to_mesh(obj.data)
+                        obj.data.update()
+                        bm.free()
+                        print(f"Moved {obj.name} to collection {name} as {ob.name}.")
+                        obj.name = obj.name.rsplit("-", 1)[0] + "-KeepEmpty"
+                        print(f"{obj.name} maintains custom properties, don't delete.")
+
+                        # Move any existing armature modifiers from the empty to the new mesh
+                        for mod in obj.modifiers:
+                            if mod.type == 'ARMATURE':
+                                new_mod = ob.modifiers.new(name="Armature", type='ARMATURE')
+                                new_mod.object = mod.object
+                                obj.modifiers.remove(mod)
+                    else:
+                        print(f"Skipping vertex removal for non-mesh object {obj.name}")
+
+                except IndexError:
+                    print(f"Failed on {obj.name} as it does not contain collection name")
+            else:
+                print(f"Ignored {obj.name} as it does not match the collection name")
+
+    def reset_rotation(self, context):
+        for obj in context.selected_objects:
+            if obj.name in [o.name for o in bpy.context.selected_objects]:
+                obj.rotation_euler = (0, 0, 0)
+
+    def setup_textures(self, context):
+        for area in context.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.spaces.active.shading.type = 'MATERIAL'
+        
+        # if bpy.app.version >= (4, 2, 0):
+        #     bpy.data.scenes["Scene"].view_settings.view_transform = 'Khronos PBR Neutral'
+
+    def import_armature(self, context):
+        try:
+            # Step 1: Track the original selection
+            previously_selected = set(bpy.context.selected_objects)
+
+            # Step 2: Filter out invalid body objects (Head and Faces should have armatures on it)
+            body_objects = [
+                obj for obj in previously_selected
+                if obj.type == 'MESH'
+                and not any(col.name == 'Face' for col in obj.users_collection)
+                and '-KeepEmpty' not in obj.name
+                and not any(head in obj.name for head in ['HeadA', 'HeadB'])
+            ]
+
+            if not body_objects:
+                raise Exception("No valid body objects selected for armature import")
+
+            # Step 3: Select the first body object as reference for armature import
+            obj = body_objects[0]
+            bpy.ops.object.select_all(action='DESELECT')
+            obj.select_set(True)
+            context.view_layer.objects.active = obj
+
+            # Step 4: Import the armature file
+            original_selection = set(bpy.context.selected_objects)
+            bpy.ops.import_scene.armature_file()
+            newly_imported = set(bpy.context.selected_objects) - original_selection
+
+            # Step 5: Identify all imported armatures
+            imported_armatures = [obj for obj in newly_imported if obj.type == 'ARMATURE']
+            if not imported_armatures:
+                raise Exception("No armatures found in imported objects")
+
+            # Step 6: Match each mesh to the most appropriate armature
+            for obj in body_objects:
+                # Extract base name for matching
+                obj_base_name = obj.name.split('-')[0].split('=')[0].lower()
+
+                # Find the best matching armature dynamically
+                best_match = None
+                best_score = 0
+                for armature in imported_armatures:
+                    # Set armature scale based on flip_mesh setting
+                    if context.scene.quick_import_settings.flip_mesh:
+                        armature.scale = (1, 1, 1)
+                    else:
+                        armature.scale = (-1, 1, 1)
+                        
+                    armature_base = armature.name.replace('_', '').lower()
+                    score = sum(1 for char in obj_base_name if char in armature_base)
+                    if score > best_score:
+                        best_match = armature
+                        best_score = score
+
+                if best_match:
+                    # Check if armature modifier already exists
+                    existing_mod = next((mod for mod in obj.modifiers if mod.type == 'ARMATURE'), None)
+                    if existing_mod:
+                        existing_mod.object = best_match
+                    else:
+                        mod = obj.modifiers.new(name="Armature", type='ARMATURE')
+                        mod.object = best_match
+
+            # Step 7: Restore selection to include newly imported objects and previously selected objects
+            for obj in newly_imported:
+                obj.select_set(True)
+            for obj in previously_selected:
+                if obj not in newly_imported:
+                    obj.select_set(True)
+
+        except Exception as e:
+            self.report({'ERROR'}, f"Armature import failed: {str(e)}")
+            for obj in previously_selected:
+                obj.select_set(True)
+
+                
+    def import_face(self, context):
+        try:
+            previously_selected = set(bpy.context.selected_objects)
+            
+            if previously_selected:
+                obj = list(previously_selected)[0]
+                bpy.ops.object.select_all(action='DESELECT')
+                obj.select_set(True)
+                context.view_layer.objects.active = obj
+            
+            bpy.ops.import_scene.face_file()
+            newly_imported = set(bpy.context.selected_objects) - previously_selected
+            
+            if not newly_imported:
+                raise Exception("No face mesh was found to import")
+                
+            face_collection = bpy.data.collections.new("Face")
+            bpy.context.scene.collection.children.link(face_collection)
+            
+            # Move all imported meshes to Face collection
+            for obj in newly_imported:
+                # Remove from current collections
+                for col in obj.users_collection:
+                    col.objects.unlink(obj)   
+                face_collection.objects.link(obj)
+                obj.select_set(True)
+
+            # Reselect original objects
+            for obj in previously_selected:
+                obj.select_set(True)
+                
+        except Exception as e:
+            self.report({'ERROR'}, f"Face import failed: {str(e)}")
+            for obj in previously_selected:
+                obj.select_set(True)
+
+
+class QuickImportRawImplementation(OperatorImplementation, QuickImport3DMigotoRaw, QuickImportBase):
+    """Setup Character file with raw data .IB + .VB"""
+
+    def execute(self, context):
+        self.merge_verts = context.scene.quick_import_settings.merge_by_distance
+        self.merge_verts_match_skinning = context.scene.quick_import_settings.merge_match_skinning
+        folder = os.path.dirname(self.properties.filepath)
+
+        job = self.make_import_job(context)
+        self.add_import_steps(job, context)
+        job.add_step("Creating materials", lambda context: self.create_materials(context, folder))
+        # Post-processing works with imported objects, so its steps are only made once they exist
+        job.add_step("Preparing post-processing", lambda context: job.add_steps(self.get_post_import_steps(context, folder)))
+        return self.run_import_job(context, job, folder)
+
+    def create_materials(self, context, folder):
+        print("------------------------")
+
+        print(f"Found Folder: {folder}")
+        files = os.listdir(folder)
+        files = [f for f in files if f.endswith("Diffuse.dds")]
+        print(f"List of files: {files}")
+
+        if bpy.app.version < (4, 2, 0):
+            importedmeshes = TextureHandler.create_material(context, files, folder)
+        else:
+            importedmeshes = TextureHandler42.create_material(context, files, folder)
+
+        print(f"Imported meshes: {[obj.name for obj in importedmeshes]}")
+
+class QuickImportImplementation(OperatorImplementation, QuickImportXXMIFrameAnalysis, QuickImportBase):
+    """Setup Character .txt file"""
+
+    def execute(self, context):
+        cfg = context.scene.quick_import_settings
+        self.flip_mesh = cfg.flip_mesh
+        self.merge_verts = cfg.merge_by_distance
+        self.merge_verts_match_skinning = cfg.merge_match_skinning
+        folder = os.path.dirname(self.properties.filepath)
+
+        job = self.make_import_job(context)
+        self.add_import_steps(job, context)
+        job.add_step("Creating materials", lambda context: self.create_materials(context, folder))
+        # Post-processing works with imported objects, so its steps are only made once they exist
+        job.add_step("Preparing post-processing", lambda context: job.add_steps(self.get_post_import_steps(context, folder)))
+        return self.run_import_job(context, job, folder)
+
+    def create_materials(self, context, folder):
+        cfg = context.scene.quick_import_settings
+        print(f"Found Folder: {folder}")
+
+        files = os.listdir(folder)
+        print (f"Files: {files}")
+
+        texture_files = []
+        if cfg.import_textures:
+            texture_map = {
+                "Diffuse": cfg.import_diffuse,
+                "DiffuseUlt" : cfg.import_diffuse,
+                "NormalMap": cfg.import_normalmap,
+                "LightMap": cfg.import_lightmap,
+                "StockingMap": cfg.import_stockingmap,
+                "MaterialMap": cfg.import_materialmap
+                # if cfg.game == 'HSR' else False,
+            }
+
+            for texture_type, should_import in texture_map.items():
+                if should_import:
+                    texture_files.extend([f for f in files if f.lower().endswith(f"{texture_type.lower()}.dds")])
+            print(f"Texture files: {texture_files}")
+        if bpy.app.version < (4, 2, 0):
+            importedmeshes = TextureHandler.create_material(context, texture_files, folder)
+        else:
+            importedmeshes = TextureHandler42.create_material(context, texture_files, folder)
+
+        print(f"Imported meshes: {[obj.name for obj in importedmeshes]}")
@@ -0,0 +1,103 @@
+import os
+import bpy #type: ignore
+
+
+# (resource file, object name, file mtime) -> (name, pointer) of hidden cache copy holding that resource data
+# Kept for current session only, copies have no users so they are never saved into user's file
+_session_cache = {}
+
+
+def make_cache_key(path, object_name):
+    path = os.path.normcase(os.path.abspath(path))
+    return path, object_name, os.stat(path).st_mtime_ns
+
+
+def find_cached_object(key):
+    """Returns cache copy holding resource data for key, None once it was purged or file was reloaded"""
+    name, pointer = _session_cache.get(key, (None, None))
+    obj = bpy.data.objects.get(name) if name else None
+    # Name alone could now belong to another object, e.g. after cache copy was purged,
+    # copy linked into scene by user isn't untouched anymore
+    if obj is None or obj.as_pointer() != pointer or obj.users_collection:
+        _session_cache.pop(key, None)
+        return None
+    return obj
+
+
+def duplicate_objects(sources):
+    """Copies objects with their data and remaps references between copied objects to the copies"""
+    copies = {}
+    for source in sources:
+        obj = source.copy()
+        if source.data is not None:
+            obj.data = source.data.copy()
+        copies[source] = obj
+
+    for obj in copies.values():
+        if obj.parent in copies:
+            obj.parent = copies[obj.parent]
+        for modifier in obj.modifiers:
+            if getattr(modifier, "object", None) in copies:
+                modifier.object = copies[modifier.object]
+
+    return [copies[source] for source in sources]
+
+
+def store_cache_copies(path, loaded):
+    """
+    Keeps untouched copies of freshly loaded objects as source of later duplicates
+    Imported objects get posed, parented or modified by user, so they can't be copied themselves
+    Copies aren't linked to any collection and have no users, so they stay hidden, Purge Orphans
+    removes them and they are left out when file is saved
+    """
+    names = list(loaded.keys())
+    for name, obj in zip(names, duplicate_objects([loaded[name] for name in names])):
+        _session_cache[make_cache_key(path, name)] = (obj.name, obj.as_pointer())
+
+
+def load_library_objects(path, object_names, link=False):
+    """
+    Returns new objects for requested names of resource .blend file, they aren't linked to any collection yet
+    Appended objects already brought in by previous imports are duplicated from their hidden cache copies
+    instead of being loaded from disk again
+    With link=True objects are linked from library and made editable via library overrides, Blender
+    shares linked library data itself, so nothing is cached
+    """
+    cached, missing = {}, []
+    for name in object_names:
+        obj = None
+        if not link:
+            obj = find_cached_object(make_cache_key(path, name))
+        if obj is not None:
+            cached[name] = obj
+        else:
+            missing.append(name)
+
+    loaded = {}
+    if missing:
+        with bpy.data.libraries.load(path, link=link) as (data_from, data_to):
+            data_to.objects = missing
+
+        for name, obj in zip(missing, data_to.objects):
+            if obj is None:
+                continue
+            if link:
+                # Linked data is read-only, override lets import adjust scale and modifiers
+                obj = obj.override_create(remap_local_usages=True)
+            loaded[name] = obj
+        print(f"Loaded {len(loaded)} objects from {os.path.basename(path)}")
+
+        if not link:
+            store_cache_copies(path, loaded)
+
+    if cached:
+        print(f"Reused {len(cached)} objects of {os.path.basename(path)} from previous imports")
+
+    duplicates = dict(zip(cached.keys(), duplicate_objects(list(cached.values()))))
+    return [loaded.get(name) or duplicates[name] for name in object_names if name in loaded or name in duplicates]
+
+
+def list_library_objects(path, name_filter=None):
+    """Lists object names of .blend file without loading any data"""
+    with bpy.data.libraries.load(path) as (data_from, data_to):
+        return [name for name in data_from.objects if name_filter is None or name_filter(name)]
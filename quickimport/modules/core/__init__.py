@@ -0,0 +1,5 @@
+"""
+Blender-independent core: 3DMigoto dump parsers, input layouts, DXGI formats, numpy buffers, mesh data processing
+and stage metrics
+Modules of this package must not import bpy, bmesh or mathutils, Blender glue lives in modules.data and modules.datahandling
+"""
@@ -167,13 +167,20 @@ class BufferLayout:
         return ret
 
     def get_numpy_type(self) -> DTypeLike:
-        dtype = numpy.dtype([])
-        for semantic in self.semantics:
-            dtype = numpy.dtype(
-                dtype.descr
-                + [(semantic.abstract.get_name(), (semantic.get_numpy_type()))]
+        if self.force_stride:
+            # Layout describes existing buffer, keep element offsets and padding as is
+            return numpy.dtype(
+                {
+                    "names": [semantic.abstract.get_name() for semantic in self.semantics],
+                    "formats": [semantic.get_numpy_type() for semantic in self.semantics],
+                    "offsets": [semantic.offset for semantic in self.semantics],
+                    "itemsize": self.stride,
+                }
             )
-        return dtype
+        # Build packed dtype in one go instead of re-parsing growing descr for every element
+        return numpy.dtype(
+            [(semantic.abstract.get_name(), semantic.get_numpy_type()) for semantic in self.semantics]
+        )
 
 
 class NumpyBuffer:
@@ -272,8 +279,8 @@ class NumpyBuffer:
 
     def to_file(self, file: Path) -> None:
         """Writes the buffer to a file in the specified format"""
-        with open(file, "wb", encoding="utf-8") as f:
-            f.write(self.get_bytes())
+        with open(file, "wb") as f:
+            self.data.tofile(f)
 
     def append(self, other: "NumpyBuffer") -> None:
         """Appends another NumpyBuffer to this one"""
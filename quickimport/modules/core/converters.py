@@ -0,0 +1,105 @@
+from typing import Union
+
+import numpy
+from numpy.typing import NDArray
+
+
+def flip_vector(data: NDArray) -> NDArray:
+    return -data
+
+
+def mirror_vector(data: NDArray) -> NDArray:
+    data[:, 0] *= -1
+    return data
+
+
+def flip_texcoord_v(data: NDArray) -> NDArray:
+    if data.dtype != numpy.float32:
+        data = data.astype(numpy.float32)
+    data[:, 1] = 1.0 - data[:, 1]
+    return data
+
+
+def reshape_second_dim(data: NDArray, width: int) -> NDArray:
+    """
+    Restructures 2-dim numpy array's 2-nd dimension to given width by regrouping values
+    Automatically converts 1-dim array to 2-dim with given width (every `width` elements are getting wrapped in array)
+    """
+    data = numpy.reshape(data, (-1, width))
+    return data
+
+
+def resize_second_dim(data: NDArray, width: int, fill: Union[int, float] = 0) -> NDArray:
+    """
+    Restructures 2-dim numpy array's 2-nd dimension to given width by padding or dropping values
+    Automatically converts 1-dim array to 2-dim with given width (every element is getting padded to width)
+    """
+    num_dimensions, num_values = data.ndim, data.shape[1] if data.ndim > 1 else 0
+    if num_dimensions != 2 or num_values != width:
+        if num_values < width:
+            if num_dimensions == 1:
+                # Array is 1-dim one and requires conversion to 2-dim
+                num_values = 1
+                # Wrap every value into array
+                data = data.reshape(-1, 1)
+                if width == 1:
+                    # Requested width is also 1, lets exit early
+                    return data
+            # Change the size of 2-nd dimension
+            new_shape = list(data.shape)
+            new_shape[1] = width
+            if fill == 1:
+                new_data = numpy.ones(dtype=data.dtype, shape=new_shape)
+            else:
+                new_data = numpy.zeros(dtype=data.dtype, shape=new_shape)
+                if fill != 0:
+                    new_data.fill(fill)
+            # Fill empty array with data
+            new_data[:, 0:num_values] = data
+            return new_data
+        else:
+            # Trim excessive values to given width
+            return data[:, : -(num_values - width)]
+    else:
+        # Array structure
+        return data
+
+
+def rgb_to_bgr_vector(data: NDArray) -> NDArray:
+    data = data.flatten()
+    # Create array from 0 to len
+    # Creates [0, 1, 2, 3, 4, 5] for len=6
+    indices = numpy.arange(len(data))
+    # Convert flat array to 2-dim array of index triads
+    # [0, 1, 2, 3, 4, 5] -> [[0, 1, 2], [3, 4, 5]]
+    indices = indices.reshape(-1, 3)
+    # Swap every first with every third element of index triads
+    # [[0, 1, 2], [3, 4, 5]] -> [[2, 1, 0], [5, 4, 3]]
+    indices[:, [0, 2]] = indices[:, [2, 0]]
+    # Destroy first dimension so we could use the array as index for loop data array
+    # [[2, 1, 0], [5, 4, 3]] -> [2, 1, 0, 5, 4, 3]
+    indices = indices.flatten()
+    # Swap every first with every third element of loop data array
+    data = data[indices]
+
+    data = data.reshape(-1, 3)
+
+    return data
+
+
+def normalize_weights(data: NDArray) -> NDArray:
+    """Normalizes weight values to ensure they sum to 1.0 for each vertex"""
+    if data.size == data.shape[0]:
+        return data
+    sums: NDArray = numpy.sum(data, axis=1, keepdims=True)
+    # Avoid division by zero - if sum is 0, set it to 1
+    sums[sums == 0] = 1.0
+    normalized: NDArray = data / sums
+
+    return normalized
+
+
+def flip_bitangent_sign(data: NDArray) -> NDArray:
+    """Flips the sign of the bitangent vector"""
+    data *= -1
+    return data
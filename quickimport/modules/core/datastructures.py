@@ -1,12 +1,14 @@
 import collections
+import functools
 import io
 import itertools
 import re
-import struct
 import textwrap
 from enum import Enum
 import numpy
-from mathutils import Matrix
+
+from .dxgi_format import normalized_decoder
+from . import metrics
 
 IOOBJOrientationHelper = type("DummyIOOBJOrientationHelper", (object,), {})
 vertex_color_layer_channels = 4
@@ -30,6 +32,8 @@ game_enum = [None] + [
 ]
 
 supported_topologies = ("trianglelist", "pointlist", "trianglestrip")
+# Semantics import skips in favour of recalculating them on export
+recalculated_semantics = ("TANGENT", "BINORMAL")
 
 ImportPaths = collections.namedtuple(
     "ImportPaths", ("vb_paths", "ib_paths", "use_bin", "pose_path")
@@ -68,78 +72,49 @@ misc_float_pattern = re.compile(
 misc_int_pattern = re.compile(r"""(?:DXGI_FORMAT_)?(?:[RGBAD][0-9]+)+_[SU]INT""")
 
 
+@functools.lru_cache(maxsize=None)
+def format_numpy_type(fmt):
+    """
+    Returns (numpy type, normalization scale) of single format component, scale is None for plain types
+    Results are memoized, formats are only matched against patterns once
+    """
+    for pattern, numpy_type, scale in (
+        (f32_pattern, "<f4", None),
+        (f16_pattern, "<f2", None),
+        (u32_pattern, "<u4", None),
+        (u16_pattern, "<u2", None),
+        (u8_pattern, "u1", None),
+        (s32_pattern, "<i4", None),
+        (s16_pattern, "<i2", None),
+        (s8_pattern, "i1", None),
+        (unorm16_pattern, "<u2", 65535.0),
+        (unorm8_pattern, "u1", 255.0),
+        (snorm16_pattern, "<i2", 32767.0),
+        (snorm8_pattern, "i1", 127.0),
+    ):
+        if pattern.match(fmt):
+            return numpy.dtype(numpy_type), scale
+
+    raise Fatal("File uses an unsupported DXGI Format: %s" % fmt)
+
+
+@functools.lru_cache(maxsize=None)
 def EncoderDecoder(fmt):
-    if f32_pattern.match(fmt):
-        return (
-            lambda data: b"".join(struct.pack("<f", x) for x in data),
-            lambda data: numpy.frombuffer(data, numpy.float32).tolist(),
-        )
-    if f16_pattern.match(fmt):
-        return (
-            lambda data: numpy.fromiter(data, numpy.float16).tobytes(),
-            lambda data: numpy.frombuffer(data, numpy.float16).tolist(),
-        )
-    if u32_pattern.match(fmt):
-        return (
-            lambda data: numpy.fromiter(data, numpy.uint32).tobytes(),
-            lambda data: numpy.frombuffer(data, numpy.uint32).tolist(),
-        )
-    if u16_pattern.match(fmt):
-        return (
-            lambda data: numpy.fromiter(data, numpy.uint16).tobytes(),
-            lambda data: numpy.frombuffer(data, numpy.uint16).tolist(),
-        )
-    if u8_pattern.match(fmt):
-        return (
-            lambda data: numpy.fromiter(data, numpy.uint8).tobytes(),
-            lambda data: numpy.frombuffer(data, numpy.uint8).tolist(),
-        )
-    if s32_pattern.match(fmt):
-        return (
-            lambda data: numpy.fromiter(data, numpy.int32).tobytes(),
-            lambda data: numpy.frombuffer(data, numpy.int32).tolist(),
-        )
-    if s16_pattern.match(fmt):
-        return (
-            lambda data: numpy.fromiter(data, numpy.int16).tobytes(),
-            lambda data: numpy.frombuffer(data, numpy.int16).tolist(),
-        )
-    if s8_pattern.match(fmt):
-        return (
-            lambda data: numpy.fromiter(data, numpy.int8).tobytes(),
-            lambda data: numpy.frombuffer(data, numpy.int8).tolist(),
-        )
+    numpy_type, scale = format_numpy_type(fmt)
 
-    if unorm16_pattern.match(fmt):
-        return (
-            lambda data: numpy.around((numpy.fromiter(data, numpy.float32) * 65535.0))
-            .astype(numpy.uint16)
-            .tobytes(),
-            lambda data: (numpy.frombuffer(data, numpy.uint16) / 65535.0).tolist(),
-        )
-    if unorm8_pattern.match(fmt):
+    if scale is None:
         return (
-            lambda data: numpy.around((numpy.fromiter(data, numpy.float32) * 255.0))
-            .astype(numpy.uint8)
-            .tobytes(),
-            lambda data: (numpy.frombuffer(data, numpy.uint8) / 255.0).tolist(),
-        )
-    if snorm16_pattern.match(fmt):
-        return (
-            lambda data: numpy.around((numpy.fromiter(data, numpy.float32) * 32767.0))
-            .astype(numpy.int16)
-            .tobytes(),
-            lambda data: (numpy.frombuffer(data, numpy.int16) / 32767.0).tolist(),
-        )
-    if snorm8_pattern.match(fmt):
-        return (
-            lambda data: numpy.around((numpy.fromiter(data, numpy.float32) * 127.0))
-            .astype(numpy.int8)
-            .tobytes(),
-            lambda data: (numpy.frombuffer(data, numpy.int8) / 127.0).tolist(),
+            lambda data: numpy.fromiter(data, numpy_type).tobytes(),
+            lambda data: numpy.frombuffer(data, numpy_type).tolist(),
         )
 
-    raise Fatal("File uses an unsupported DXGI Format: %s" % fmt)
+    decode = normalized_decoder(scale)
+    return (
+        lambda data: numpy.around((numpy.fromiter(data, numpy.float32) * scale))
+        .astype(numpy_type)
+        .tobytes(),
+        lambda data: decode(numpy.frombuffer(data, numpy_type)).tolist(),
+    )
 
 
 components_pattern = re.compile(r"""(?<![0-9])[0-9]+(?![0-9])""")
@@ -313,9 +288,68 @@ class InputLayoutElement(object):
         )
 
 
+class RecordCodec(object):
+    """
+    Numpy record dtype compiled from elements of a single vertex buffer slot
+    Encodes and decodes whole arrays of vertex records with one call per element
+    """
+
+    def __init__(self, elems, stride=None):
+        if stride is None:
+            stride = max([elem.AlignedByteOffset + elem.size() for elem in elems], default=0)
+        self.stride = stride
+        # Elements overflowing the stride can only be partially read, they keep per-record handling
+        self.elems = [elem for elem in elems if elem.AlignedByteOffset + elem.size() <= stride]
+        self.overflowing_elems = [elem for elem in elems if elem.AlignedByteOffset + elem.size() > stride]
+        self.scales = [format_numpy_type(elem.Format)[1] for elem in self.elems]
+        self.decoders = [scale and normalized_decoder(scale) for scale in self.scales]
+        self.dtype = numpy.dtype(
+            {
+                "names": [elem.name for elem in self.elems],
+                "formats": [
+                    (format_numpy_type(elem.Format)[0], (elem.format_len,))
+                    for elem in self.elems
+                ],
+                "offsets": [elem.AlignedByteOffset for elem in self.elems],
+                "itemsize": stride,
+            }
+        )
+
+    def decode_records(self, data):
+        """Decodes all whole records of data into vertex dicts"""
+        count = len(data) // self.stride if self.stride else 0
+        records = numpy.frombuffer(data, self.dtype, count=count)
+        columns = []
+        for elem, decode in zip(self.elems, self.decoders):
+            values = records[elem.name]
+            if decode is not None:
+                values = decode(values)
+            columns.append(values.tolist())
+        names = [elem.name for elem in self.elems]
+        vertices = [dict(zip(names, values)) for values in zip(*columns)] if columns else [{} for i in range(count)]
+        for elem in self.overflowing_elems:
+            start = elem.AlignedByteOffset
+            for i, vertex in enumerate(vertices):
+                record = data[i * self.stride : (i + 1) * self.stride]
+                vertex[elem.name] = elem.decode(record[start : start + elem.size()])
+        return vertices
+
+    def encode_records(self, vertices):
+        """Encodes vertex dicts into array of records, elements missing from vertices are left zeroed"""
+        records = numpy.zeros(len(vertices), self.dtype)
+        for elem, scale in zip(self.elems, self.scales):
+            values = numpy.array([vertex[elem.name] for vertex in vertices], dtype=numpy.float64)
+            values = values.reshape(len(vertices), -1)
+            if scale is not None:
+                values = numpy.around(values.astype(numpy.float32) * scale)
+            records[elem.name][:, : values.shape[1]] = values
+        return records
+
+
 class InputLayout(object):
     def __init__(self, custom_prop=[]):
         self.semantic_translations_cache = None
+        self.codecs = {}
         self.elems = collections.OrderedDict()
         for item in custom_prop:
             elem = InputLayoutElement(item)
@@ -334,6 +368,28 @@ class InputLayout(object):
     def parse_element(self, f):
         elem = InputLayoutElement(f)
         self.elems[elem.name] = elem
+        self.codecs = {}
+
+    def get_codec(self, vbuf_idx, stride=None, semantics=None):
+        """
+        Returns codec for elements of given slot, compiled once per slot, stride and semantics filter
+        vbuf_idx can be slot number or non-numeric string to put every element into single record
+        """
+        if semantics is not None:
+            semantics = frozenset(semantics)
+        key = (vbuf_idx, stride, semantics)
+        if key not in self.codecs:
+            if isinstance(vbuf_idx, str):
+                slot = int(vbuf_idx) if vbuf_idx.isnumeric() else None
+            else:
+                slot = vbuf_idx
+            elems = [
+                elem for elem in self.elems.values()
+                if (slot is None or elem.InputSlot == slot)
+                and (semantics is None or elem.name in semantics)
+            ]
+            self.codecs[key] = RecordCodec(elems, stride)
+        return self.codecs[key]
 
     def __iter__(self):
         return iter(self.elems.values())
@@ -352,30 +408,45 @@ class InputLayout(object):
         return self[semantic]
 
     def encode(self, vertex, vbuf_idx, stride):
-        buf = bytearray(stride)
-
-        for semantic, data in vertex.items():
-            if semantic.startswith("~"):
+        return bytearray(self.encode_vertices([vertex], vbuf_idx, stride).tobytes())
+
+    def encode_vertices(self, vertices, vbuf_idx, stride):
+        """Encodes list of vertices into numpy array of records of given slot with a single codec call"""
+        if not vertices:
+            return numpy.zeros(0, numpy.uint8)
+        semantics = [semantic for semantic in vertices[0] if not semantic.startswith("~")]
+        codec = self.get_codec(vbuf_idx, stride, semantics)
+        for elem in codec.elems:
+            if len(vertices[0][elem.name]) > elem.format_len:
+                raise Fatal("%s has more components than %s can store" % (elem.name, elem.Format))
+        records = codec.encode_records(vertices)
+        assert records.nbytes == stride * len(vertices)
+        return records
+
+    def get_decoded_semantics(self, skip_semantics=()):
+        """
+        Returns names of elements import actually reads: per-vertex elements that don't
+        reuse offset of an earlier element (see flag_invalid_semantics) and aren't skipped
+        """
+        seen_offsets = set()
+        semantics = set()
+        for elem in self.elems.values():
+            if elem.InputSlotClass != "per-vertex":
+                continue
+            if (elem.InputSlot, elem.AlignedByteOffset) in seen_offsets:
                 continue
-            elem = self.elems[semantic]
-            if vbuf_idx.isnumeric() and elem.InputSlot != int(vbuf_idx):
-                # Belongs to a different vertex buffer
+            seen_offsets.add((elem.InputSlot, elem.AlignedByteOffset))
+            if elem.name.upper() in skip_semantics:
                 continue
-            data = elem.encode(data)
-            buf[elem.AlignedByteOffset : elem.AlignedByteOffset + len(data)] = data
+            semantics.add(elem.name)
+        return semantics
 
-        assert len(buf) == stride
-        return buf
+    def decode(self, buf, vbuf_idx, semantics=None):
+        return self.decode_vertices(buf, vbuf_idx, len(buf), semantics)[0]
 
-    def decode(self, buf, vbuf_idx):
-        vertex = {}
-        for elem in self.elems.values():
-            if elem.InputSlot != vbuf_idx:
-                # Belongs to a different vertex buffer
-                continue
-            data = buf[elem.AlignedByteOffset : elem.AlignedByteOffset + elem.size()]
-            vertex[elem.name] = elem.decode(data)
-        return vertex
+    def decode_vertices(self, data, vbuf_idx, stride, semantics=None):
+        """Decodes every record of data, semantics limits which elements are decoded"""
+        return self.get_codec(vbuf_idx, stride, semantics).decode_records(data)
 
     def __eq__(self, other):
         return self.elems == other.elems
@@ -468,7 +539,7 @@ class IndividualVertexBuffer(object):
         r"""vb\d+\[\d*\]\+\d+ (?P<semantic>[^:]+): (?P<data>.*)$"""
     )
 
-    def __init__(self, idx, f=None, layout=None, load_vertices=True):
+    def __init__(self, idx, f=None, layout=None, load_vertices=True, skip_semantics=()):
         self.vertices = []
         self.layout = layout and layout or InputLayout()
         self.first = 0
@@ -477,6 +548,10 @@ class IndividualVertexBuffer(object):
         self.topology = "trianglelist"
         self.stride = 0
         self.idx = idx
+        # Undecoded contents of binary buffer, only kept until vertices are decoded
+        self.raw_data = None
+        # Semantics that are never decoded nor stored in vertices
+        self.skip_semantics = skip_semantics
 
         if f is not None:
             self.parse_vb_txt(f, load_vertices)
@@ -511,19 +586,22 @@ class IndividualVertexBuffer(object):
         if self.vertices:
             assert len(self.vertices) == self.vertex_count
 
-    def parse_vb_bin(self, f, use_drawcall_range=False):
+    def parse_vb_bin(self, f, use_drawcall_range=False, load_vertices=True):
         f.seek(self.offset)
         if use_drawcall_range:
             f.seek(self.first * self.stride, 1)
         else:
             self.first = 0
-        for i in itertools.count():
-            if use_drawcall_range and i == self.vertex_count:
-                break
-            vertex = f.read(self.stride)
-            if not vertex:
-                break
-            self.vertices.append(self.layout.decode(vertex, self.idx))
+        if use_drawcall_range:
+            data = f.read(self.vertex_count * self.stride)
+        else:
+            data = f.read()
+        # Only whole vertex records are kept
+        self.raw_data = data[: len(data) // self.stride * self.stride]
+        if not load_vertices:
+            self.vertex_count = len(self.raw_data) // self.stride
+            return
+        self.decode_raw_data()
         # We intentionally disregard the vertex count when loading from a
         # binary file, as we assume frame analysis might have only dumped a
         # partial buffer to the .txt files (e.g. if this was from a dump where
@@ -532,12 +610,20 @@ class IndividualVertexBuffer(object):
         # we are loading the .buf file because it contains the entire mesh):
         self.vertex_count = len(self.vertices)
 
+    def decode_raw_data(self):
+        data, self.raw_data = self.raw_data, None
+        semantics = self.layout.get_decoded_semantics(self.skip_semantics)
+        self.vertices = self.layout.decode_vertices(data, self.idx, self.stride, semantics)
+
     def append(self, vertex):
         self.vertices.append(vertex)
         self.vertex_count += 1
 
     def parse_vertex_data(self, f):
-        vertex = {}
+        # Layout elements are declared before vertex data, so the filter is known by now
+        semantics = self.layout.get_decoded_semantics(self.skip_semantics)
+        # Vertex stays None until its first element, so vertices with only skipped elements are kept too
+        vertex = None
         for line in map(str.strip, f):
             # print(line)
             if line.startswith("instance-data:"):
@@ -545,11 +631,14 @@ class IndividualVertexBuffer(object):
 
             match = self.vb_elem_pattern.match(line)
             if match:
-                vertex[match.group("semantic")] = self.parse_vertex_element(match)
-            elif line == "" and vertex:
+                if vertex is None:
+                    vertex = {}
+                if match.group("semantic") in semantics:
+                    vertex[match.group("semantic")] = self.parse_vertex_element(match)
+            elif line == "" and vertex is not None:
                 self.vertices.append(vertex)
-                vertex = {}
-        if vertex:
+                vertex = None
+        if vertex is not None:
             self.vertices.append(vertex)
 
     @staticmethod
@@ -585,7 +674,7 @@ class VertexBufferGroup(object):
     # Python gotcha - do not set layout=InputLayout() in the default function
     # parameters, as they would all share the *same* InputLayout since the
     # default values are only evaluated once on file load
-    def __init__(self, files=None, layout=None, load_vertices=True, topology=None):
+    def __init__(self, files=None, layout=None, load_vertices=True, topology=None, skip_semantics=()):
         self.vertices = []
         self.layout = layout and layout or InputLayout()
         self.first = 0
@@ -593,6 +682,7 @@ class VertexBufferGroup(object):
         self.topology = topology or "trianglelist"
         self.vbs = []
         self.slots = {}
+        self.skip_semantics = skip_semantics
 
         if files is not None:
             self.parse_vb_txt(files, load_vertices)
@@ -603,7 +693,7 @@ class VertexBufferGroup(object):
             if match is None:
                 raise Fatal("Cannot determine vertex buffer index from filename %s" % f)
             idx = int(match.group(1))
-            vb = IndividualVertexBuffer(idx, open(f, "r"), self.layout, load_vertices)
+            vb = IndividualVertexBuffer(idx, open(f, "r"), self.layout, load_vertices, self.skip_semantics)
             if vb.vertices:
                 self.vbs.append(vb)
                 self.slots[idx] = vb
@@ -619,7 +709,8 @@ class VertexBufferGroup(object):
             self.merge_vbs(self.vbs)
             assert len(self.vertices) == self.vertex_count
 
-    def parse_vb_bin(self, files, use_drawcall_range=False):
+    def parse_vb_bin(self, files, use_drawcall_range=False, load_vertices=True):
+        # With load_vertices=False buffers keep raw bytes, call decode_vertices() if dicts are required
         for bin_f, fmt_f in files:
             match = self.vb_idx_pattern.search(bin_f)
             if match is not None:
@@ -630,9 +721,9 @@ class VertexBufferGroup(object):
                     % bin_f
                 )
                 idx = 0
-            vb = IndividualVertexBuffer(idx, open(fmt_f, "r"), self.layout, False)
-            vb.parse_vb_bin(open(bin_f, "rb"), use_drawcall_range)
-            if vb.vertices:
+            vb = IndividualVertexBuffer(idx, open(fmt_f, "r"), self.layout, False, self.skip_semantics)
+            vb.parse_vb_bin(open(bin_f, "rb"), use_drawcall_range, load_vertices)
+            if vb.vertices or vb.raw_data:
                 self.vbs.append(vb)
                 self.slots[idx] = vb
 
@@ -643,6 +734,19 @@ class VertexBufferGroup(object):
         self.vertex_count = self.vbs[0].vertex_count
         self.topology = self.vbs[0].topology
 
+        if load_vertices:
+            self.merge_vbs(self.vbs)
+            assert len(self.vertices) == self.vertex_count
+
+    def has_raw_data(self):
+        return any(vb.raw_data is not None for vb in self.vbs)
+
+    def decode_vertices(self):
+        """Decodes raw binary buffers into per-vertex dicts used by legacy import path"""
+        if not self.has_raw_data():
+            return
+        for vb in self.vbs:
+            vb.decode_raw_data()
         self.merge_vbs(self.vbs)
         assert len(self.vertices) == self.vertex_count
 
@@ -675,17 +779,23 @@ class VertexBufferGroup(object):
                 if semantic.startswith("BLENDINDICES"):
                     vertex[semantic] = (0, 0, 0, 0)
 
-    def write(self, output_prefix, strides, operator=None):
+    def write(self, output_prefix, strides, operator=None) -> int:
+        """Writes vertex buffer of every slot in strides, returns total bytes written"""
+        written = 0
         for vbuf_idx, stride in strides.items():
-            with open(output_prefix + vbuf_idx, "wb") as output:
-                for vertex in self.vertices:
-                    output.write(self.layout.encode(vertex, vbuf_idx, stride))
+            with open(output_prefix + vbuf_idx, "wb") as output, metrics.span("Vertex buffer write") as stage:
+                # Whole buffer is packed into one preallocated record array and written at once
+                records = self.layout.encode_vertices(self.vertices, vbuf_idx, stride)
+                records.tofile(output)
+                stage.count(vertices=len(records), bytes=records.nbytes)
+                written += records.nbytes
 
                 msg = "Wrote %i vertices to %s" % (len(self), output.name)
                 if operator:
                     operator.report({"INFO"}, msg)
                 else:
                     print(msg)
+        return written
 
     def __len__(self):
         return len(self.vertices)
@@ -916,15 +1026,23 @@ class IndexBuffer(object):
         self.index_count += other.index_count
         self.faces.extend(other.faces)
 
-    def write(self, output, operator=None):
-        for face in self.faces:
-            output.write(self.encoder(face))
+    def encode_faces(self):
+        """Returns flat numpy array of all indices in buffer format"""
+        return numpy.array(self.faces, dtype=format_numpy_type(self.format)[0]).ravel()
+
+    def write(self, output, operator=None) -> int:
+        """Writes encoded indices to output file, returns bytes written"""
+        with metrics.span("Index buffer write") as stage:
+            indices = self.encode_faces()
+            indices.tofile(output)
+            stage.count(indices=len(indices), bytes=indices.nbytes)
 
         msg = "Wrote %i indices to %s" % (len(self), output.name)
         if operator:
             operator.report({"INFO"}, msg)
         else:
             print(msg)
+        return indices.nbytes
 
     @property
     def indices_per_face(self):
@@ -969,6 +1087,9 @@ class ConstantBuffer(object):
         assert entry == []
 
     def as_3x4_matrices(self):
+        # Imported here, so buffer parsers can be used outside of Blender
+        from mathutils import Matrix
+
         return [Matrix(self.entries[i : i + 3]) for i in range(0, len(self.entries), 3)]
 
 
@@ -1,5 +1,6 @@
 import numpy
 from enum import Enum
+from types import MappingProxyType
 from typing import Callable
 
 from numpy.typing import DTypeLike
@@ -24,6 +25,24 @@ class Topology(str, Enum):
             return Topology.UNSOPORTED
 
 
+# Precision policy: normalized integers are decoded straight into float32, same as Blender stores them,
+# so color, normal and weight arrays never go through float64 intermediates
+NORMALIZED_FLOAT_TYPE = numpy.float32
+
+
+def normalized_decoder(max_value: float) -> Callable:
+    """
+    Returns decoder of normalized integers that multiplies by float32 reciprocal of max value
+    Decoded values can be written into preallocated float32 array via `out`
+    """
+    reciprocal = NORMALIZED_FLOAT_TYPE(1.0 / max_value)
+
+    def decode(data, out=None):
+        return numpy.multiply(data, reciprocal, out=out, dtype=NORMALIZED_FLOAT_TYPE)
+
+    return decode
+
+
 class DXGIType(Enum):
     # dxgi_type.value = (numpy_type, list_encoder, list_decoder, type_encoder, type_decoder)
     FLOAT32 = (numpy.float32, None, None, None, None)
@@ -39,48 +58,46 @@ class DXGIType(Enum):
         lambda data: numpy.fromiter(data, numpy.float32),
         None,
         lambda data: numpy.around(data * 65535.0).astype(numpy.uint16),
-        lambda data: data / 65535.0,
+        normalized_decoder(65535.0),
     )
     UNORM8 = (
         numpy.uint8,
         lambda data: numpy.fromiter(data, numpy.float32),
         None,
         lambda data: numpy.around(data * 255.0).astype(numpy.uint8),
-        lambda data: data / 255.0,
+        normalized_decoder(255.0),
     )
     SNORM16 = (
         numpy.int16,
         lambda data: numpy.fromiter(data, numpy.float32),
         None,
         lambda data: numpy.around(data * 32767.0).astype(numpy.int16),
-        lambda data: data / 32767.0,
+        normalized_decoder(32767.0),
     )
     SNORM8 = (
         numpy.int8,
         lambda data: numpy.fromiter(data, numpy.float32),
         None,
         lambda data: numpy.around(data * 127.0).astype(numpy.int8),
-        lambda data: data / 127.0,
+        normalized_decoder(127.0),
     )
 
 
 class DXGIFormat(Enum):
     @classmethod
     def from_type(cls, dxgi_type: DXGIType, dimensions) -> "DXGIFormat":
-        for member in cls:
-            if member.dxgi_type == dxgi_type and member.num_values == dimensions:
-                return member
-        raise ValueError(
-            f"DXGIFormat not found for {dxgi_type} and {dimensions} dimensions!"
-        )
+        member = _formats_by_type.get((dxgi_type, dimensions))
+        if member is None:
+            raise ValueError(
+                f"DXGIFormat not found for {dxgi_type} and {dimensions} dimensions!"
+            )
+        return member
 
     @classmethod
     def _missing_(cls, value: str):
-        if value.startswith("DXGI_FORMAT_"):
-            value = value[12:]
-        for member in cls:
-            if member.value == value:
-                return member
+        # Only called for values not found by regular lookup, e.g. with DXGI_FORMAT_ prefix
+        if isinstance(value, str) and value.startswith("DXGI_FORMAT_"):
+            return cls._value2member_map_.get(value[12:])
         return None
 
     def __new__(cls, fmt, dxgi_type):
@@ -99,25 +116,24 @@ class DXGIFormat(Enum):
         obj.type_encoder = type_encoder
         obj.type_decoder = type_decoder
 
+        # Decoders and encoders are composed once here, chained lambdas must capture the base ones
         if list_encoder is None:
-            obj.encoder = lambda data: numpy.fromiter(data, obj.numpy_base_type)
-        else:
-            obj.encoder = list_encoder
-
+            list_encoder = lambda data: numpy.fromiter(data, numpy_type)
         if list_decoder is None:
-            obj.decoder = lambda data: numpy.frombuffer(data, obj.numpy_base_type)
-        else:
-            obj.decoder = list_decoder
+            list_decoder = lambda data: numpy.frombuffer(data, numpy_type)
 
         if type_encoder is not None:
-            obj.encoder = lambda data: type_encoder(obj.encoder(data))  # type: ignore
+            obj.encoder = lambda data: type_encoder(list_encoder(data))
         else:
+            obj.encoder = list_encoder
             # Special encoder is not defined, lets use basic type conversion
             # We shouldn't do it earlier, as list encoder already does it via fromiter
-            obj.type_encoder = lambda data: data.astype(obj.numpy_base_type)
+            obj.type_encoder = lambda data: data.astype(numpy_type)
 
         if type_decoder is not None:
-            obj.decoder = lambda data: type_decoder(obj.decoder(data))  # type: ignore
+            obj.decoder = lambda data: type_decoder(list_decoder(data))
+        else:
+            obj.decoder = list_decoder
 
         for value_bit_width, value_byte_width in {"32": 4, "16": 2, "8": 1}.items():
             if value_bit_width in obj.dxgi_type.name:
@@ -130,6 +146,8 @@ class DXGIFormat(Enum):
         if obj.byte_width <= 0:
             raise ValueError(f"Invalid byte width {obj.byte_width} for {obj.format}!")
 
+        obj.numpy_type = obj.make_numpy_type(obj.num_values)
+
         return obj
 
     def __init__(self, fmt, dxgi_type):
@@ -142,6 +160,7 @@ class DXGIFormat(Enum):
         self.value_bit_width: int
         self.value_byte_width: int
         self.numpy_base_type: DTypeLike
+        self.numpy_type: DTypeLike
         self.encoder: Callable
         self.decoder: Callable
         self.type_encoder: Callable
@@ -151,14 +170,18 @@ class DXGIFormat(Enum):
         return "DXGI_FORMAT_" + self.format
 
     def get_num_values(self, data_stride=0) -> int:
-        if data_stride > 0:
+        if data_stride > 0 and data_stride != self.byte_width:
             # Caller specified data_stride, number of values may differ from the base dtype
             return int(data_stride / self.value_byte_width)
         else:
             return self.num_values
 
     def get_numpy_type(self, data_stride=0) -> DTypeLike:
-        num_values = self.get_num_values(data_stride)
+        if data_stride <= 0 or data_stride == self.byte_width:
+            return self.numpy_type
+        return self.make_numpy_type(self.get_num_values(data_stride))
+
+    def make_numpy_type(self, num_values: int) -> DTypeLike:
         # Tuple format of (type, 1) is deprecated, so we have to take special care
         if num_values == 1:
             return self.numpy_base_type
@@ -225,3 +248,10 @@ class DXGIFormat(Enum):
     R8G8B8_SNORM = "R8G8B8_SNORM", DXGIType.SNORM8
     R8G8_SNORM = "R8G8_SNORM", DXGIType.SNORM8
     R8_SNORM = "R8_SNORM", DXGIType.SNORM8
+
+
+# Lookup tables are built once on import, so layout construction never has to scan enum members
+# First declared member wins for (type, dimensions) shared by several formats, same as member scan did
+_formats_by_type: MappingProxyType = MappingProxyType(
+    {(member.dxgi_type, member.num_values): member for member in reversed(DXGIFormat)}
+)
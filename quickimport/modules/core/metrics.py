@@ -0,0 +1,203 @@
+import json
+import os
+import threading
+import time
+import tracemalloc
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+REPORT_FILENAME = "quickimport_stats.json"
+
+
+@dataclass
+class Span:
+    """Timed stage of import or export with its counters and nested stages"""
+    name: str
+    duration: float = 0.0
+    counters: dict[str, int] = field(default_factory=dict)
+    # Peak of traced memory during the span, only set when memory is traced and span runs on recording thread
+    peak_memory: Optional[int] = None
+    children: list["Span"] = field(default_factory=list)
+    # Highest traced memory peak seen before nested span reset it
+    peak_floor: int = 0
+
+    def count(self, **counters: int):
+        for name, value in counters.items():
+            self.counters[name] = self.counters.get(name, 0) + int(value)
+
+    def to_dict(self) -> dict:
+        result = {"name": self.name, "duration": round(self.duration, 6)}
+        if self.counters:
+            result["counters"] = dict(self.counters)
+        if self.peak_memory is not None:
+            result["peak_memory"] = self.peak_memory
+        if self.children:
+            result["children"] = [child.to_dict() for child in self.children]
+        return result
+
+    def format(self) -> str:
+        text = f"{self.name}: {self.duration:.3f}s"
+        details = [f"{value} {name}" for name, value in self.counters.items()]
+        if self.peak_memory is not None:
+            details.append(f"{self.peak_memory / (1024 * 1024):.1f} MB peak")
+        if details:
+            text += f" ({', '.join(details)})"
+        return text
+
+
+class MetricsRecorder:
+    """
+    Collects nested spans of single import or export run
+    Every thread keeps its own span stack, spans opened by worker threads are attached to the root span
+    Traced memory peak is process-wide and resetting it is the only way to measure a span, so peaks are taken
+    on the thread that started recording only. They include allocations of workers running at the same time,
+    per-stage peaks are exact for sequential runs only
+    """
+
+    def __init__(self, name: str, trace_memory: bool = False):
+        self.root = Span(name)
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.start_time = time.perf_counter()
+        self.owns_tracemalloc = trace_memory and not tracemalloc.is_tracing()
+        self.trace_memory = trace_memory
+        self.trace_thread = threading.get_ident()
+        if self.owns_tracemalloc:
+            tracemalloc.start()
+
+    def get_stack(self) -> list[Span]:
+        stack = getattr(self.local, "stack", None)
+        if stack is None:
+            stack = self.local.stack = [self.root]
+        return stack
+
+    @contextmanager
+    def span(self, name: str, **counters: int):
+        stack = self.get_stack()
+        parent = stack[-1]
+        span = Span(name, counters=dict(counters))
+        with self.lock:
+            parent.children.append(span)
+        # Worker spans never reset the peak, it would drop peaks of spans open on other threads
+        trace_memory = self.trace_memory and threading.get_ident() == self.trace_thread
+        if trace_memory:
+            # Resetting peak hides it from parent, so parent keeps it as floor
+            parent.peak_floor = max(parent.peak_floor, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        stack.append(span)
+        start_time = time.perf_counter()
+        try:
+            yield span
+        finally:
+            span.duration = time.perf_counter() - start_time
+            stack.pop()
+            if trace_memory:
+                span.peak_memory = max(span.peak_floor, tracemalloc.get_traced_memory()[1])
+                parent.peak_floor = max(parent.peak_floor, span.peak_memory)
+
+    def add(self, span: Span):
+        parent = self.get_stack()[-1]
+        with self.lock:
+            parent.children.append(span)
+
+    def finish(self) -> Span:
+        self.root.duration = time.perf_counter() - self.start_time
+        if self.trace_memory:
+            self.root.peak_memory = max(self.root.peak_floor, tracemalloc.get_traced_memory()[1])
+        if self.owns_tracemalloc:
+            tracemalloc.stop()
+        return self.root
+
+
+# Recorder of the run in progress, spans opened without it are printed right away
+active_recorder: Optional[MetricsRecorder] = None
+# Report of the last finished run, shown by the panel
+last_report: Optional[dict] = None
+
+
+def start(name: str, trace_memory: bool = False) -> MetricsRecorder:
+    """Starts recording new run, unfinished previous run is discarded"""
+    global active_recorder
+    discard()
+    active_recorder = MetricsRecorder(name, trace_memory)
+    return active_recorder
+
+
+def discard():
+    global active_recorder
+    if active_recorder is not None:
+        active_recorder.finish()
+        active_recorder = None
+
+
+def stop(report_dir: Optional[str] = None) -> Optional[dict]:
+    """Finishes recording, writes JSON report to report_dir if given and prints summary"""
+    global active_recorder, last_report
+    if active_recorder is None:
+        return None
+    root = active_recorder.finish()
+    active_recorder = None
+
+    last_report = root.to_dict()
+    if report_dir is not None:
+        report_path = os.path.join(report_dir, REPORT_FILENAME)
+        try:
+            with open(report_path, "w") as f:
+                json.dump(last_report, f, indent=4)
+        except OSError as e:
+            print(f"Failed to write stats report {report_path}: {e}")
+
+    print("\n".join(get_summary_lines(last_report)))
+    return last_report
+
+
+@contextmanager
+def span(name: str, **counters: int):
+    """Times nested stage of the active run, without active run stage timing is printed"""
+    if active_recorder is not None:
+        with active_recorder.span(name, **counters) as result:
+            yield result
+        return
+    result = Span(name, counters=dict(counters))
+    start_time = time.perf_counter()
+    try:
+        yield result
+    finally:
+        result.duration = time.perf_counter() - start_time
+        print(result.format())
+
+
+def record(name: str, start_time: float, **counters: int) -> Span:
+    """
+    Adds stage that has already finished, for code measuring itself from start_time (time.perf_counter)
+    Such stage has no nested stages or memory peak
+    """
+    result = Span(name, duration=time.perf_counter() - start_time, counters=dict(counters))
+    if active_recorder is not None:
+        active_recorder.add(result)
+    else:
+        print(result.format())
+    return result
+
+
+def get_summary_lines(report: dict, max_depth: int = 2) -> list[str]:
+    """Formats report as indented lines, stages deeper than max_depth are left out"""
+    lines = []
+
+    def add_lines(span_dict: dict, depth: int):
+        span = Span(
+            span_dict["name"],
+            duration=span_dict["duration"],
+            counters=span_dict.get("counters", {}),
+            peak_memory=span_dict.get("peak_memory"),
+        )
+        lines.append("  " * depth + span.format())
+        if depth < max_depth:
+            for child in span_dict.get("children", []):
+                add_lines(child, depth + 1)
+
+    add_lines(report, 0)
+    return lines
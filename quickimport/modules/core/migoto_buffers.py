@@ -0,0 +1,165 @@
+from typing import Optional
+
+import numpy
+from numpy.typing import NDArray
+
+from .byte_buffer import AbstractSemantic, BufferLayout, BufferSemantic, NumpyBuffer, Semantic
+from .dxgi_format import DXGIFormat, DXGIType
+from .datastructures import IndexBuffer, InputLayoutElement, VertexBufferGroup
+
+
+# Semantics BlenderDataImporter creates mesh data for, tangents are recalculated on export
+imported_semantics: list[Semantic] = [
+    Semantic.Position,
+    Semantic.Normal,
+    Semantic.Color,
+    Semantic.TexCoord,
+    Semantic.Blendindices,
+    Semantic.Blendweight,
+]
+skipped_semantics: list[Semantic] = [Semantic.Tangent, Semantic.Binormal]
+
+
+def get_semantic(elem: InputLayoutElement) -> Optional[Semantic]:
+    name = elem.SemanticName.upper()
+    if name == "BLENDWEIGHTS":
+        name = "BLENDWEIGHT"
+    try:
+        return Semantic(name)
+    except ValueError:
+        return None
+
+
+def get_vertex_elements(vb: VertexBufferGroup) -> list[InputLayoutElement]:
+    """Returns per-vertex elements import_vertices would read, semantics skipped by loader are left out"""
+    return [
+        elem for elem in vb.layout
+        if elem.InputSlotClass == "per-vertex" and not elem.reused_offset and elem.InputSlot in vb.slots
+        and elem.name.upper() not in vb.skip_semantics
+    ]
+
+
+def get_unsupported_reason(vb: VertexBufferGroup, ib: Optional[IndexBuffer]) -> Optional[str]:
+    """
+    Returns why buffers have to be imported by legacy path or None if NumpyBuffer path can handle them
+    Legacy path stores anything it doesn't understand as vertex layers, so it's used for such layouts
+    """
+    topology = ib.topology if ib is not None else vb.topology
+    if topology not in ("trianglelist", "trianglestrip"):
+        return f"{topology} topology"
+
+    for elem in get_vertex_elements(vb):
+        semantic = get_semantic(elem)
+        if semantic is None:
+            return f"unhandled semantic {elem.name}"
+        if semantic in skipped_semantics:
+            continue
+        if semantic not in imported_semantics:
+            return f"unhandled semantic {elem.name}"
+        try:
+            dxgi_format = DXGIFormat(elem.Format)
+        except ValueError:
+            return f"unsupported format {elem.Format} of {elem.name}"
+        if elem.invalid_semantic:
+            return f"{elem.name} overflows vertex buffer stride"
+        if semantic == Semantic.TexCoord and (not elem.is_float() or dxgi_format.num_values != 2):
+            return f"{elem.Format} {elem.name}"
+        if semantic == Semantic.Blendindices and not elem.is_int():
+            return f"{elem.Format} {elem.name}"
+        if dxgi_format.num_values > 4:
+            return f"{elem.Format} {elem.name}"
+
+    return None
+
+
+def get_unorm_semantics(vb: VertexBufferGroup) -> set[AbstractSemantic]:
+    """
+    Returns semantics stored as UNORM in game buffers
+    Text dumps hold them already decoded to floats, so their buffer semantics don't tell UNORM apart
+    """
+    return {
+        AbstractSemantic(get_semantic(elem), elem.SemanticIndex)
+        for elem in get_vertex_elements(vb)
+        if elem.Format.endswith("_UNORM") and get_semantic(elem) is not None
+    }
+
+
+def make_buffer_semantic(elem: InputLayoutElement, decoded: bool = False) -> BufferSemantic:
+    """
+    Converts InputLayout element to BufferSemantic
+    Values of text dumps are already decoded, so they are described by 32-bit format of the same width
+    """
+    dxgi_format = DXGIFormat(elem.Format)
+    if decoded:
+        if elem.is_float():
+            dxgi_type = DXGIType.FLOAT32
+        elif dxgi_format.dxgi_type in [DXGIType.SINT32, DXGIType.SINT16, DXGIType.SINT8]:
+            dxgi_type = DXGIType.SINT32
+        else:
+            dxgi_type = DXGIType.UINT32
+        dxgi_format = DXGIFormat.from_type(dxgi_type, dxgi_format.num_values)
+    return BufferSemantic(
+        AbstractSemantic(get_semantic(elem), elem.SemanticIndex),
+        dxgi_format,
+        offset=elem.AlignedByteOffset,
+        input_slot=elem.InputSlot,
+        data_step_rate=elem.InstanceDataStepRate,
+    )
+
+
+def load_vertex_buffer(vb: VertexBufferGroup) -> NumpyBuffer:
+    """Builds single NumpyBuffer with all imported semantics of vertex buffer group"""
+    elements = [elem for elem in get_vertex_elements(vb) if get_semantic(elem) in imported_semantics]
+
+    if vb.has_raw_data():
+        slot_buffers = {}
+        for idx, slot in vb.slots.items():
+            slot_elements = [elem for elem in elements if elem.InputSlot == idx]
+            if not slot_elements:
+                continue
+            slot_layout = BufferLayout(
+                [make_buffer_semantic(elem) for elem in slot_elements],
+                stride=slot.stride,
+                force_stride=True,
+            )
+            slot_buffers[idx] = NumpyBuffer(slot_layout)
+            slot_buffers[idx].import_raw_data(slot.raw_data)
+        semantics = [make_buffer_semantic(elem) for elem in elements]
+        vertex_buffer = NumpyBuffer(BufferLayout(semantics), size=vb.vertex_count)
+        for elem, semantic in zip(elements, semantics):
+            name = semantic.get_name()
+            vertex_buffer.set_field(name, slot_buffers[elem.InputSlot].get_field(name))
+    else:
+        semantics = [make_buffer_semantic(elem, decoded=True) for elem in elements]
+        vertex_buffer = NumpyBuffer(BufferLayout(semantics), size=len(vb.vertices))
+        for elem, semantic in zip(elements, semantics):
+            data = numpy.array([vertex[elem.name] for vertex in vb.vertices], dtype=semantic.format.numpy_base_type)
+            vertex_buffer.set_field(semantic.get_name(), data.reshape(vertex_buffer.data[semantic.get_name()].shape))
+
+    return vertex_buffer
+
+
+def get_unused_w_reason(vertex_buffer: NumpyBuffer) -> Optional[str]:
+    """
+    Legacy path keeps meaningful W of 4D positions and normals as vertex layers
+    NumpyBuffer path drops it, so it can only be used when W holds default value
+    """
+    for semantic, default in [(Semantic.Position, 1.0), (Semantic.Normal, 0.0)]:
+        buffer_semantic = vertex_buffer.layout.get_element(AbstractSemantic(semantic))
+        if buffer_semantic is None or buffer_semantic.get_num_values() != 4:
+            continue
+        w = vertex_buffer.get_field(buffer_semantic.get_name())[:, 3]
+        if buffer_semantic.format.type_decoder is not None:
+            w = buffer_semantic.format.type_decoder(w)
+        if not numpy.all(w == default):
+            return f"{semantic} W is used"
+    return None
+
+
+def load_index_buffer(faces: NDArray) -> NumpyBuffer:
+    index_buffer = NumpyBuffer(
+        BufferLayout([BufferSemantic(AbstractSemantic(Semantic.Index), DXGIFormat.R32_UINT)]),
+        size=faces.size,
+    )
+    index_buffer.set_field(Semantic.Index.value, faces.ravel())
+    return index_buffer
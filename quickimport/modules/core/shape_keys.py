@@ -0,0 +1,53 @@
+from dataclasses import dataclass
+from typing import Iterable
+
+import numpy
+from numpy.typing import NDArray
+
+
+@dataclass
+class SparseShapeKey:
+    """Shape key stored as offsets from basis for the vertices it actually moves"""
+
+    name: str
+    indices: NDArray
+    deltas: NDArray
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def to_dense(self, num_vertices: int) -> NDArray:
+        """Expands sparse offsets back to (num_vertices, 3) array"""
+        data = numpy.zeros((num_vertices, 3), dtype=self.deltas.dtype)
+        data[self.indices] = self.deltas
+        return data
+
+    def apply(self, basis: NDArray, out: NDArray) -> NDArray:
+        """Writes absolute shape key coordinates to `out` (basis + deltas)"""
+        out[:] = basis
+        out[self.indices] += self.deltas
+        return out
+
+
+def make_sparse_shapekey(name: str, offsets: NDArray, epsilon: float = 1e-6) -> SparseShapeKey:
+    """
+    Converts (V, 3) array of offsets from basis to sparse shape key
+    Vertex is considered moved when any of its offset components exceeds epsilon
+    """
+    offsets = offsets.reshape(-1, 3)
+    indices = numpy.nonzero((numpy.abs(offsets) > epsilon).any(axis=1))[0]
+    return SparseShapeKey(
+        name=name,
+        indices=indices.astype(numpy.uint32),
+        deltas=offsets[indices],
+    )
+
+
+def make_sparse_shapekeys(
+    names: list[str], offsets: Iterable[NDArray], epsilon: float = 1e-6
+) -> list[SparseShapeKey]:
+    """
+    Converts (V, 3) offset arrays (or rows of (K, V, 3) block) to list of sparse shape keys
+    Keys are converted one at a time, so only one dense key is processed at once
+    """
+    return [make_sparse_shapekey(name, key_offsets, epsilon) for name, key_offsets in zip(names, offsets)]
@@ -0,0 +1,41 @@
+import numpy
+from numpy.typing import NDArray
+
+
+def build_triangle_edges(faces: NDArray, num_vertices: int) -> tuple[NDArray, NDArray]:
+    """
+    Derives unique edges from (F, 3) triangles
+    Returns (E, 2) edge vertex ids and (F * 3,) edge id of every loop, where loop edge goes to next loop of face
+    """
+    faces = numpy.asarray(faces, dtype=numpy.int64).reshape(-1, 3)
+    # Loop i of triangle (a, b, c) uses edges (a, b), (b, c), (c, a)
+    starts = faces.ravel()
+    ends = faces[:, [1, 2, 0]].ravel()
+    low = numpy.minimum(starts, ends)
+    high = numpy.maximum(starts, ends)
+    # Single int64 key per undirected edge is much faster to unique than rows of pairs
+    keys = low * num_vertices + high
+    unique_keys, loop_edges = numpy.unique(keys, return_inverse=True)
+    edges = numpy.stack([unique_keys // num_vertices, unique_keys % num_vertices], axis=1)
+    return edges.astype(numpy.int32), loop_edges.ravel().astype(numpy.int32)
+
+
+def is_trusted_triangles(faces: NDArray, num_vertices: int) -> bool:
+    """
+    Cheap sanity check of (F, 3) triangles: in-range indices, no degenerate and no duplicated faces
+    Triangles passing it don't need mesh.validate to be turned into valid mesh
+    """
+    faces = numpy.asarray(faces).reshape(-1, 3)
+    if len(faces) == 0:
+        return True
+    if faces.min() < 0 or faces.max() >= num_vertices:
+        return False
+    if numpy.any((faces[:, 0] == faces[:, 1]) | (faces[:, 1] == faces[:, 2]) | (faces[:, 0] == faces[:, 2])):
+        return False
+    # Same vertices in any order make the same face for Blender
+    sorted_faces = numpy.sort(faces.astype(numpy.int64), axis=1)
+    if num_vertices < 2**21:
+        keys = (sorted_faces[:, 0] * num_vertices + sorted_faces[:, 1]) * num_vertices + sorted_faces[:, 2]
+        return len(numpy.unique(keys)) == len(keys)
+    # Packed key would overflow int64, fall back to slower row-wise unique
+    return len(numpy.unique(sorted_faces, axis=0)) == len(sorted_faces)
@@ -0,0 +1,182 @@
+from dataclasses import dataclass
+from itertools import product
+from typing import Optional
+
+import numpy
+from numpy.typing import NDArray
+
+
+@dataclass
+class WeldResult:
+    """Mapping between original vertices and vertices left after welding"""
+
+    # (V,) id of welded vertex for every original vertex
+    remap: NDArray
+    # (W,) original id of vertex representing every welded vertex
+    kept: NDArray
+
+    def __len__(self) -> int:
+        return len(self.kept)
+
+    def weld_faces(self, faces: NDArray) -> tuple[NDArray, NDArray]:
+        """
+        Returns (welded faces, original faces) with faces collapsed by welding removed
+        Original faces let per-loop data (uvs, colors, normals) keep reading values of original vertices
+        """
+        faces = numpy.asarray(faces).reshape(-1, 3)
+        welded = self.remap[faces]
+        valid = (
+            (welded[:, 0] != welded[:, 1])
+            & (welded[:, 1] != welded[:, 2])
+            & (welded[:, 0] != welded[:, 2])
+        )
+        return welded[valid], faces[valid]
+
+
+def pack_rows(data: NDArray) -> NDArray:
+    """Views every row of 2-dim array as single opaque value, so rows can be compared and sorted as scalars"""
+    data = numpy.ascontiguousarray(data)
+    return data.view(numpy.dtype((numpy.void, data.dtype.itemsize * data.shape[1]))).ravel()
+
+
+# Cell itself and half of its 26 neighbours, the other half is covered by neighbours looking back at the cell
+NEIGHBOUR_OFFSETS = numpy.array(
+    [offset for offset in product((-1, 0, 1), repeat=3) if offset >= (0, 0, 0)], dtype=numpy.int64
+)
+
+
+def find_neighbour_cells(cells: NDArray) -> tuple[NDArray, NDArray, list[NDArray]]:
+    """
+    Returns (cell id of every vertex, number of vertices in every cell, neighbour cell id for every offset)
+    Missing neighbour cells are -1
+    """
+    low = cells.min(axis=0) - 1
+    dims = cells.max(axis=0) - low + 2
+    if int(dims[0]) * int(dims[1]) * int(dims[2]) < 2**62:
+        # Grid fits into int64, every cell is a single linear key and neighbours are a fixed key distance away
+        keys = numpy.ravel_multi_index((cells - low).T, dims)
+        unique_keys, cell_ids, counts = numpy.unique(keys, return_inverse=True, return_counts=True)
+        neighbours = []
+        for offset in NEIGHBOUR_OFFSETS:
+            neighbour_keys = unique_keys + int(numpy.ravel_multi_index(offset + 1, dims) - numpy.ravel_multi_index((1, 1, 1), dims))
+            found = numpy.minimum(numpy.searchsorted(unique_keys, neighbour_keys), len(unique_keys) - 1)
+            neighbours.append(numpy.where(unique_keys[found] == neighbour_keys, found, -1))
+        return cell_ids.ravel(), counts, neighbours
+
+    # Huge grid, cells are looked up by uniquing rows of cell and its neighbour coordinates together
+    unique_cells, cell_ids, counts = numpy.unique(pack_rows(cells), return_inverse=True, return_counts=True)
+    unique_cells = unique_cells.view(cells.dtype).reshape(len(unique_cells), 3)
+    neighbours = []
+    for offset in NEIGHBOUR_OFFSETS:
+        rows = numpy.concatenate([unique_cells, unique_cells + offset])
+        _, inverse = numpy.unique(pack_rows(rows), return_inverse=True)
+        inverse = inverse.ravel()
+        lookup = numpy.full(len(inverse), -1)
+        lookup[inverse[:len(unique_cells)]] = numpy.arange(len(unique_cells))
+        neighbours.append(lookup[inverse[len(unique_cells):]])
+    return cell_ids.ravel(), counts, neighbours
+
+
+def find_cell_pairs(cells: NDArray) -> tuple[NDArray, NDArray]:
+    """Returns (a, b) ids of every pair of vertices sharing a grid cell or lying in neighbouring cells of (V, 3) grid"""
+    cell_ids, counts, neighbours = find_neighbour_cells(cells)
+    # Vertices ordered by cell, members of cell i are members[starts[i]:starts[i] + counts[i]]
+    members = numpy.argsort(cell_ids, kind="stable")
+    starts = numpy.cumsum(counts) - counts
+
+    pairs_a, pairs_b = [], []
+    for offset, neighbour in zip(NEIGHBOUR_OFFSETS, neighbours):
+        cell_a = numpy.flatnonzero(neighbour >= 0)
+        cell_b = neighbour[cell_a]
+        # Every member of cell a against every member of cell b
+        pair_counts = counts[cell_a] * counts[cell_b]
+        pair_cell = numpy.repeat(numpy.arange(len(cell_a)), pair_counts)
+        local = numpy.arange(len(pair_cell)) - numpy.repeat(numpy.cumsum(pair_counts) - pair_counts, pair_counts)
+        index_a, index_b = numpy.divmod(local, counts[cell_b][pair_cell])
+        a = members[starts[cell_a][pair_cell] + index_a]
+        b = members[starts[cell_b][pair_cell] + index_b]
+        if not offset.any():
+            # Within the same cell every pair shows up twice and every vertex is paired with itself
+            a, b = a[index_a < index_b], b[index_a < index_b]
+        pairs_a.append(a)
+        pairs_b.append(b)
+
+    return numpy.concatenate(pairs_a), numpy.concatenate(pairs_b)
+
+
+def find_components(num_vertices: int, a: NDArray, b: NDArray) -> NDArray:
+    """Returns lowest vertex id of connected component for every vertex, edges are given as (a, b) id pairs"""
+    labels = numpy.arange(num_vertices)
+    while True:
+        # Hook every vertex to the lowest label of its edges, then shortcut label chains to their roots
+        hooked = labels.copy()
+        numpy.minimum.at(hooked, a, labels[b])
+        numpy.minimum.at(hooked, b, labels[a])
+        numpy.minimum.at(hooked, labels, hooked)
+        while True:
+            jumped = hooked[hooked]
+            if numpy.array_equal(jumped, hooked):
+                break
+            hooked = jumped
+        if numpy.array_equal(hooked, labels):
+            return labels
+        labels = hooked
+
+
+def weld_vertices(
+    positions: NDArray,
+    distance: float = 1e-4,
+    normals: Optional[NDArray] = None,
+    max_normal_angle: Optional[float] = None,
+    attributes: Optional[list[NDArray]] = None,
+) -> WeldResult:
+    """
+    Welds vertices which positions are within distance of each other using grid hash
+    Grid cells are as large as weld distance, so every close pair lies in the same or neighbouring cells.
+    Such pairs are checked against the real distance and merged transitively, like chains of close vertices
+    Optionally only welds vertices with normals within max_normal_angle (radians)
+    and with exactly matching attributes (e.g. blend indices and weights)
+    """
+    num_vertices = len(positions)
+    if num_vertices == 0:
+        return WeldResult(remap=numpy.arange(0), kept=numpy.arange(0))
+    positions = numpy.ascontiguousarray(numpy.asarray(positions, dtype=numpy.float64).reshape(num_vertices, -1)[:, :3])
+
+    if normals is not None and max_normal_angle is not None:
+        normals = numpy.asarray(normals, dtype=numpy.float64).reshape(num_vertices, -1)[:, :3]
+        lengths = numpy.linalg.norm(normals, axis=1, keepdims=True)
+        normals = normals / numpy.where(lengths > 0, lengths, 1)
+        min_normal_dot = numpy.cos(max_normal_angle)
+    else:
+        normals = None
+
+    # Exact duplicates (split for uv or normal seams) are merged upfront, so crowded cells don't pair them all
+    rows = [positions.view(numpy.uint8)]
+    if normals is not None:
+        rows.append(normals.view(numpy.uint8))
+    if attributes:
+        # Compare raw bytes of attributes, so float and int data can share single row
+        rows += [numpy.ascontiguousarray(a).reshape(num_vertices, -1).view(numpy.uint8) for a in attributes]
+    _, first, duplicate_ids = numpy.unique(pack_rows(numpy.concatenate(rows, axis=1)), return_index=True, return_inverse=True)
+    # Distinct vertices numbered in order of first occurrence, so lowest id of a component is its first vertex
+    order = numpy.argsort(first)
+    rank = numpy.empty_like(order)
+    rank[order] = numpy.arange(len(order))
+    distinct = first[order]
+    duplicate_ids = rank[duplicate_ids.ravel()]
+
+    # Pairs of distinct vertices in neighbouring cells, checked against real distance, normals and attributes
+    a, b = find_cell_pairs(numpy.floor(positions[distinct] / distance).astype(numpy.int64))
+    mergeable = numpy.linalg.norm(positions[distinct[a]] - positions[distinct[b]], axis=1) <= distance
+    if attributes:
+        attribute_rows = numpy.concatenate(rows[len(rows) - len(attributes):], axis=1)[distinct]
+        _, attribute_ids = numpy.unique(pack_rows(attribute_rows), return_inverse=True)
+        attribute_ids = attribute_ids.ravel()
+        mergeable &= attribute_ids[a] == attribute_ids[b]
+    if normals is not None:
+        mergeable &= numpy.einsum("ij,ij->i", normals[distinct[a]], normals[distinct[b]]) >= min_normal_dot
+    components = find_components(len(distinct), a[mergeable], b[mergeable])
+
+    labels = components[duplicate_ids]
+    kept_ranks = numpy.unique(labels)
+    return WeldResult(remap=numpy.searchsorted(kept_ranks, labels), kept=distinct[kept_ranks])
@@ -8,14 +8,16 @@ from bpy.types import Mesh, Object
 from typing import Optional, Callable
 from operator import attrgetter
 
-from .byte_buffer import (
+from ..core.byte_buffer import (
     AbstractSemantic,
     Semantic,
     BufferSemantic,
     NumpyBuffer,
     BufferLayout,
 )
-from .dxgi_format import DXGIFormat, DXGIType
+from ..core.dxgi_format import DXGIFormat, DXGIType
+from ..core.shape_keys import SparseShapeKey, make_sparse_shapekeys
+from ..core import metrics
 
 
 class BlenderDataExtractor:
@@ -192,7 +194,7 @@ class BlenderDataExtractor:
         flip_winding=False,
         dedupe=False,
     ) -> tuple[NumpyBuffer, NDArray]:
-        start_time: float = time.time()
+        start_time: float = time.perf_counter()
 
         # Make loop data layout
         layout = BufferLayout([])
@@ -271,14 +273,14 @@ class BlenderDataExtractor:
         if dedupe:
             loop_data.remove_duplicates()
 
-        print(
-            f"Loop data fetch time: {time.time() - start_time:.3f}s ({len(loop_data.get_data())} vertices, {len(index_data)} indices)"
+        metrics.record(
+            "Loop data fetch", start_time, vertices=len(loop_data.get_data()), indices=len(index_data)
         )
 
         return loop_data, index_data
 
     def get_vertex_data(self, mesh: Mesh, proxy_layout: BufferLayout) -> NumpyBuffer:
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Make vertex data layout
         layout = BufferLayout([])
@@ -345,9 +347,7 @@ class BlenderDataExtractor:
                 data = data.reshape(-1)
             vertex_data.set_field(buffer_semantic.get_name(), data)
 
-        print(
-            f"Vertex data fetch time: {time.time() - start_time:.3f}s ({len(vertex_data.get_data())} vertices)"
-        )
+        metrics.record("Vertex data fetch", start_time, vertices=len(vertex_data.get_data()))
 
         return vertex_data
 
@@ -357,38 +357,83 @@ class BlenderDataExtractor:
         names_filter: Optional[list[str]] = None,
         deduct_basis=False,
     ) -> dict[str, numpy.ndarray]:
-        start_time = time.time()
-
-        numpy_type = self.blender_data_formats[Semantic.ShapeKey].get_numpy_type()
-
-        base_data = None
-        if deduct_basis:
-            base_data = self.fetch_data(
-                obj.data.shape_keys.key_blocks["Basis"].data, "co", numpy_type
-            )
-
-        result = {}
-
+        """
+        Returns coords of shape keys as dict of (V, 3) views into single shared block
+        Copy the returned arrays if they have to outlive the other ones or be modified independently
+        """
+        start_time = time.perf_counter()
+
+        # Resolve requested shape keys before allocating anything
+        names = []
         for shapekey in obj.data.shape_keys.key_blocks:
             if names_filter is not None:
                 if shapekey.name not in names_filter:
                     continue
             elif deduct_basis and shapekey.name == "Basis":
                 continue
+            names.append(shapekey.name)
 
-            data = self.fetch_data(shapekey.data, "co", numpy_type)
-            self.sanitize_blender_data(data)
+        if deduct_basis:
+            # Basis is fetched as extra first row of the block, so it can be deducted in one go
+            block = self.fetch_shapekey_block(obj, ["Basis"] + names)
+            self.sanitize_blender_data(block)
+            block[1:] -= block[0]
+            block = block[1:]
+        else:
+            block = self.fetch_shapekey_block(obj, names)
+            self.sanitize_blender_data(block)
+
+        result = dict(zip(names, block))
 
-            if deduct_basis:
-                data -= base_data
+        metrics.record("Shape Keys fetch", start_time, shapekeys=len(result), bytes=block.nbytes)
 
-            result[shapekey.name] = data
+        return result
 
-        print(
-            f"Shape Keys fetch time: {time.time() - start_time:.3f}s ({len(result)} shapekeys)"
+    def fetch_shapekey_block(self, obj: Object, names: list[str]) -> NDArray:
+        """Fetches coords of requested shape keys into single preallocated (K, V, 3) block"""
+        shapekey_format = self.blender_data_formats[Semantic.ShapeKey]
+        key_blocks = obj.data.shape_keys.key_blocks
+        block = numpy.empty(
+            (len(names), len(obj.data.vertices) * shapekey_format.num_values),
+            dtype=shapekey_format.numpy_base_type,
         )
+        # Rows of C-contiguous block are contiguous views, so foreach_get fills the block in place
+        for row, name in zip(block, names):
+            key_blocks[name].data.foreach_get("co", row)
+        return block.reshape(len(names), -1, shapekey_format.num_values)
 
-        return result
+    def get_shapekey_data_sparse(
+        self,
+        obj: Object,
+        names_filter: Optional[list[str]] = None,
+        epsilon: float = 1e-6,
+    ) -> tuple[NDArray, list[SparseShapeKey]]:
+        """
+        Returns basis coords and list of shape keys stored as index + delta arrays
+        Only vertices moved by more than epsilon along any axis are kept per key
+        """
+        start_time = time.perf_counter()
+
+        basis = obj.data.shape_keys.reference_key
+        names = [
+            shapekey.name
+            for shapekey in obj.data.shape_keys.key_blocks
+            if shapekey.name != basis.name
+            and (names_filter is None or shapekey.name in names_filter)
+        ]
+
+        block = self.fetch_shapekey_block(obj, [basis.name] + names)
+        self.sanitize_blender_data(block)
+        block[1:] -= block[0]
+
+        result = make_sparse_shapekeys(names, block[1:], epsilon)
+
+        metrics.record(
+            "Sparse Shape Keys fetch", start_time, shapekeys=len(result), deltas=sum(map(len, result))
+        )
+
+        # Deltas are copies, so copying basis too lets the dense block go
+        return block[0].copy(), result
 
     @staticmethod
     def sanitize_blender_data(arr: NDArray) -> None:
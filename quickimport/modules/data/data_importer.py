@@ -3,11 +3,20 @@ import bpy
 
 from typing import List, Dict, Optional
 
-from .byte_buffer import AbstractSemantic, Semantic, BufferSemantic, NumpyBuffer
-from .dxgi_format import  DXGIType
+from ..core.byte_buffer import AbstractSemantic, Semantic, BufferSemantic, NumpyBuffer
+from ..core.dxgi_format import  DXGIType
+from ..core.shape_keys import SparseShapeKey, make_sparse_shapekey
+from ..core.welding import weld_vertices
+from .mesh_builder import BlenderMeshBuilder
+from ..datahandling import import_triangle_edges
 
 
 class BlenderDataImporter:
+    # Shapekey offsets below this value are considered noise and aren't imported
+    shapekey_epsilon: float = 1e-6
+    # Shapekeys moving fewer vertices than this part of the mesh are written vertex by vertex,
+    # per-vertex RNA access costs about as much as foreach_set of a hundred vertices
+    sparse_shapekey_write_ratio: float = 0.01
 
     def set_data(self,
                  obj: bpy.types.Object, 
@@ -15,16 +24,30 @@ class BlenderDataImporter:
                  index_buffer: NumpyBuffer,
                  vertex_buffer: NumpyBuffer,
                  semantic_converters: Dict[AbstractSemantic, List[callable]], 
-                 format_converters: Dict[AbstractSemantic, List[callable]]):
+                 format_converters: Dict[AbstractSemantic, List[callable]],
+                 merge_distance: Optional[float] = None,
+                 merge_match_skinning: bool = True):
         
         buffer_semantic = index_buffer.layout.get_element(AbstractSemantic(Semantic.Index))
         index_data = self.get_semantic_data(index_buffer, buffer_semantic, format_converters, semantic_converters)
 
-        self.import_faces(mesh, index_data)
+        # Optionally weld vertices on decoded arrays, so mesh is created with already merged vertices
+        weld = None
+        if merge_distance is not None:
+            weld = self.weld_vertices(vertex_buffer, semantic_converters, format_converters, merge_distance, merge_match_skinning)
 
-        vertex_ids = index_data.flatten()
+        builder = BlenderMeshBuilder(mesh)
+
+        if weld is not None:
+            # Loops keep original vertex ids to fetch per-loop data (uvs, colors, normals) from
+            welded_index_data, index_data = weld.weld_faces(index_data)
+            builder.add_triangles(welded_index_data)
+            builder.add_vertices(len(weld))
+        else:
+            builder.add_triangles(index_data)
+            builder.add_vertices(len(vertex_buffer.data))
 
-        mesh.vertices.add(len(vertex_buffer.data))
+        vertex_ids = index_data.flatten()
 
         vg_indices = {}
         vg_weights = {}
@@ -42,14 +65,18 @@ class BlenderDataImporter:
             # Get converted data from vertex buffer
             data = self.get_semantic_data(vertex_buffer, buffer_semantic, format_converters, semantic_converters)
 
-            # Any remaining normalized integers must be converted to floats before import
-            if buffer_semantic.format.dxgi_type in [DXGIType.UNORM16, DXGIType.UNORM8, DXGIType.SNORM16, DXGIType.SNORM8]:
-                data = buffer_semantic.format.type_decoder(data)
+            # Per-vertex data of welded group is taken from its representative vertex
+            if weld is not None and semantic in [Semantic.Position, Semantic.Blendindices, Semantic.Blendweight, Semantic.ShapeKey]:
+                data = data[weld.kept]
 
             if semantic == Semantic.ShapeKey:
-                shapekeys[buffer_semantic.abstract.index] = data
+                # Most shapekeys move only a small part of the mesh, so only the moved vertices are kept
+                shapekey_id = buffer_semantic.abstract.index
+                shapekeys[shapekey_id] = make_sparse_shapekey(
+                    f'Deform {shapekey_id}', numpy.asarray(data, dtype=numpy.float32), self.shapekey_epsilon
+                )
             elif semantic == Semantic.Color:
-                self.import_colors(mesh, buffer_semantic.get_name(), data, vertex_ids)
+                self.import_colors(builder, buffer_semantic.get_name(), data, vertex_ids)
             elif semantic == Semantic.TexCoord:
                 texcoords[buffer_semantic.abstract.index] = data
             elif semantic == Semantic.Normal:
@@ -59,19 +86,42 @@ class BlenderDataImporter:
             elif semantic == Semantic.Blendweight:
                 vg_weights[buffer_semantic.abstract.index] = data
             elif semantic == Semantic.Position:
-                self.import_positions(mesh, data)
+                builder.set_positions(data)
             else:
                 continue
 
-        self.import_texcoords(mesh, texcoords, vertex_ids)
+        self.import_texcoords(builder, texcoords, vertex_ids)
         self.import_vertex_groups(obj, vg_indices, vg_weights)
         self.import_shapekeys(obj, shapekeys)
 
-        # Create edges and other missing metadata
-        mesh.validate(verbose=False, clean_customdata=False)
+        # Create edges and other missing metadata, full validation is only needed for suspicious input
+        if not import_triangle_edges(mesh):
+            mesh.validate(verbose=False, clean_customdata=False)
         mesh.update()
 
-        self.import_normals(mesh, normals, vertex_ids)
+        self.import_normals(mesh, normals, vertex_ids, per_loop=weld is not None)
+
+    def weld_vertices(self,
+                      vertex_buffer: NumpyBuffer,
+                      semantic_converters: Dict[AbstractSemantic, List[callable]],
+                      format_converters: Dict[AbstractSemantic, List[callable]],
+                      merge_distance: float,
+                      match_skinning: bool = True):
+        
+        positions = None
+        attributes = []
+        for buffer_semantic in vertex_buffer.layout.semantics:
+            semantic = buffer_semantic.abstract.enum
+            if semantic == Semantic.Position:
+                positions = self.get_semantic_data(vertex_buffer, buffer_semantic, format_converters, semantic_converters)
+            elif match_skinning and semantic in [Semantic.Blendindices, Semantic.Blendweight]:
+                # Vertices with different skinning are never merged
+                attributes.append(vertex_buffer.get_field(buffer_semantic.get_name()))
+
+        if positions is None:
+            return None
+
+        return weld_vertices(positions, merge_distance, attributes=attributes)
 
     def get_semantic_data(self, 
                           buffer: NumpyBuffer, 
@@ -80,6 +130,10 @@ class BlenderDataImporter:
                           semantic_converters: Dict[AbstractSemantic, List[callable]]):
         
         data = buffer.get_field(buffer_semantic.get_name())
+
+        # Normalized integers are converted to floats first, so converters always work with actual values
+        if buffer_semantic.format.dxgi_type in [DXGIType.UNORM16, DXGIType.UNORM8, DXGIType.SNORM16, DXGIType.SNORM8]:
+            data = buffer_semantic.format.type_decoder(data)
     
         for converter in format_converters.get(buffer_semantic.abstract, []):
             try:
@@ -97,73 +151,71 @@ class BlenderDataImporter:
 
         return data
    
-    def import_faces(self, 
-                     mesh: bpy.types.Mesh, 
-                     index_data: numpy.ndarray):
-        
-        mesh.loops.add(len(index_data) * 3)
-        mesh.polygons.add(len(index_data))
-
-        mesh.loops.foreach_set('vertex_index', index_data.flatten())
-
-        mesh.polygons.foreach_set('loop_start', [x*3 for x in range(len(index_data))])
-        mesh.polygons.foreach_set('loop_total', [3] * len(index_data))
-
-    def import_positions(self, 
-                         mesh: bpy.types.Mesh, 
-                         position_data: numpy.ndarray):
-        
-        mesh.vertices.foreach_set('co', position_data.ravel())
-        
     def import_vertex_groups(self, 
                              obj: bpy.types.Object, 
                              vg_indices: Dict[int, numpy.ndarray], 
                              vg_weights: Dict[int, numpy.ndarray]):
         
-        assert (len(vg_indices) == len(vg_weights))
+        if not vg_indices:
+            return
 
-        num_vertex_groups = max([indices.max() for indices in vg_indices.values()])
+        num_vertex_groups = max([int(indices.max()) for indices in vg_indices.values()])
 
         for i in range(num_vertex_groups + 1):
             obj.vertex_groups.new(name=str(i))
 
         for semantic_index in sorted(vg_indices.keys()):
             indices = vg_indices[semantic_index]
-            weights = vg_weights[semantic_index]
+            indices = indices.reshape(len(indices), -1)
+            weights = vg_weights.get(semantic_index)
+            if weights is None:
+                # Without blend weights every listed group gets full influence
+                weights = numpy.ones(indices.shape, dtype=numpy.float32)
+            weights = weights.reshape(indices.shape)
+
+            vertex_ids = numpy.repeat(numpy.arange(len(indices)), indices.shape[1])
+            indices, weights = indices.ravel(), weights.ravel()
+            nonzero = weights != 0.0
+            vertex_ids, indices, weights = vertex_ids[nonzero], indices[nonzero], weights[nonzero]
+            if len(indices) == 0:
+                continue
 
-        for vertex_id, (indexes, weights) in enumerate(zip(indices, weights)):
-            for index, weight in zip(indexes, weights):
-                if weight == 0.0:
-                    continue
-                obj.vertex_groups[index].add((vertex_id,), weight, 'REPLACE')
+            # Add vertices sharing the same group and weight with a single call
+            order = numpy.lexsort((weights, indices))
+            vertex_ids, indices, weights = vertex_ids[order], indices[order], weights[order]
+            splits = numpy.flatnonzero((indices[1:] != indices[:-1]) | (weights[1:] != weights[:-1])) + 1
+            for start, end in zip(numpy.r_[0, splits], numpy.r_[splits, len(indices)]):
+                obj.vertex_groups[int(indices[start])].add(vertex_ids[start:end].tolist(), float(weights[start]), 'REPLACE')
 
     def import_colors(self, 
-                      mesh: bpy.types.Mesh, 
+                      builder: BlenderMeshBuilder, 
                       color_name: str, 
                       color_data: numpy.ndarray, 
                       vertex_ids: numpy.ndarray):
         
-        mesh.vertex_colors.new(name=color_name)
-        color_layer = mesh.vertex_colors[color_name].data
-        color_layer.foreach_set('color', color_data[vertex_ids].flatten())
+        builder.add_color_layer(color_name, color_data[vertex_ids])
 
     def import_normals(self, 
                        mesh: bpy.types.Mesh, 
                        normals: Optional[numpy.ndarray], 
-                       vertex_ids: numpy.ndarray):
+                       vertex_ids: numpy.ndarray,
+                       per_loop: bool = False):
         
         if normals is None:
             if hasattr(mesh, 'calc_normals'):
                 mesh.calc_normals()
             return
-        if bpy.app.version >= (4, 1):
+        if bpy.app.version >= (4, 1) and per_loop:
+            # Welded vertices may carry several normals, so they have to be written per loop
+            mesh.normals_split_custom_set(normals[vertex_ids])
+        elif bpy.app.version >= (4, 1):
             # Directly write vertex normals to loops without any shenanigans
             mesh.normals_split_custom_set_from_vertices(normals)
         else:
             # Initialize empty split vertex normals
             mesh.create_normals_split()
             # Write vertex normals, they will be immidiately converted to loop normals
-            mesh.loops.foreach_set('normal', normals[vertex_ids].flatten().tolist())
+            mesh.loops.foreach_set('normal', numpy.ascontiguousarray(normals[vertex_ids], dtype=numpy.float32).ravel())
             # Read loop normals
             recalculated_normals = numpy.empty(len(mesh.loops)*3, dtype=numpy.float32)
             mesh.loops.foreach_get('normal', recalculated_normals)
@@ -173,10 +225,10 @@ class BlenderDataImporter:
             # Force vertex normals interpolation across the polygon (required in older versions)
             mesh.polygons.foreach_set('use_smooth', numpy.ones(len(mesh.polygons), dtype=numpy.int8))
             # Write loop normals to permanent storage
-            mesh.normals_split_custom_set(recalculated_normals.tolist())
+            mesh.normals_split_custom_set(recalculated_normals)
 
     def import_texcoords(self, 
-                         mesh: bpy.types.Mesh, 
+                         builder: BlenderMeshBuilder, 
                          texcoords: Dict[int, numpy.ndarray], 
                          vertex_ids: numpy.ndarray):
         
@@ -185,14 +237,11 @@ class BlenderDataImporter:
         
         for (texcoord_id, data) in sorted(texcoords.items()):
             uv_name = f'TEXCOORD{texcoord_id and texcoord_id or ""}.xy'
-            mesh.uv_layers.new(name=uv_name)
-
-            uv_layer = mesh.uv_layers[uv_name].data
-            uv_layer.foreach_set('uv', data[vertex_ids].flatten())
+            builder.add_uv_layer(uv_name, data[vertex_ids])
 
     def import_shapekeys(self, 
                          obj: bpy.types.Object, 
-                         shapekeys: Dict[int, numpy.ndarray]):
+                         shapekeys: Dict[int, SparseShapeKey]):
         
         if not shapekeys:
             return
@@ -209,16 +258,27 @@ class BlenderDataImporter:
 
         basis_co = numpy.empty(vert_count * 3, dtype=numpy.float32)
         basis.data.foreach_get('co', basis_co)
-        basis_co = basis_co.reshape(-1, 3)  
+        basis_co = basis_co.reshape(-1, 3)
+
+        # Single coords buffer is reused for every densely written shapekey
+        shapekey_co = numpy.empty_like(basis_co)
 
-        for shapekey_id, offsets in shapekeys.items():
-            # Add new shapekey
-            shapekey = obj.shape_key_add(name=f'Deform {shapekey_id}')
+        for sparse_shapekey in shapekeys.values():
+            # Add new shapekey, it's initialized with basis coords
+            shapekey = obj.shape_key_add(name=sparse_shapekey.name, from_mix=False)
             shapekey.interpolation = 'KEY_LINEAR'
 
-            position_offsets = numpy.array(offsets, dtype=numpy.float32).reshape(-1, 3)
+            if len(sparse_shapekey) == 0:
+                continue
+
+            if len(sparse_shapekey) < vert_count * self.sparse_shapekey_write_ratio:
+                # Only moved vertices differ from basis coords the key already has
+                moved_co = basis_co[sparse_shapekey.indices] + sparse_shapekey.deltas
+                for index, co in zip(sparse_shapekey.indices.tolist(), moved_co.tolist()):
+                    shapekey.data[index].co = co
+                continue
 
             # Apply shapekey vertex position offsets
-            position_offsets += basis_co
+            sparse_shapekey.apply(basis_co, shapekey_co)
 
-            shapekey.data.foreach_set('co', position_offsets.ravel())
+            shapekey.data.foreach_set('co', shapekey_co.ravel())
@@ -1,22 +1,22 @@
 import time
-from typing import Callable, Optional, Union
+from typing import Callable, Optional
 
-import numpy
 from bpy.types import Collection, Context, Mesh, Object
 from numpy.typing import NDArray
 
-from .byte_buffer import (
+from ..core import converters
+from ..core.byte_buffer import (
     AbstractSemantic,
     BufferLayout,
     NumpyBuffer,
     Semantic,
     BufferSemantic,
 )
+from ..core.dxgi_format import DXGIFormat
+from ..core.datastructures import Fatal, GameEnum
 from .data_extractor import BlenderDataExtractor
 from .data_importer import BlenderDataImporter
-from .dxgi_format import DXGIFormat
-from ..datahandling import Fatal
-from ..datastructures import GameEnum
+from ..core import metrics
 
 
 class DataModel(object):
@@ -53,6 +53,8 @@ class DataModel(object):
         vertex_buffer: NumpyBuffer,
         vg_remap: Optional[NDArray],
         mirror_mesh: bool = False,
+        merge_distance: Optional[float] = None,
+        merge_match_skinning: bool = True,
     ) -> None:
         # Copy default converters
         semantic_converters, format_converters = {}, {}
@@ -133,6 +135,8 @@ class DataModel(object):
             vertex_buffer,
             semantic_converters,
             format_converters,
+            merge_distance,
+            merge_match_skinning,
         )
 
     def get_data(
@@ -158,7 +162,7 @@ class DataModel(object):
     def build_buffers(
         self, index_data, vertex_buffer, excluded_buffers
     ) -> dict[str, NumpyBuffer]:
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         result = {}
         for buffer_name, buffer_layout in self.buffers_format.items():
@@ -179,8 +183,8 @@ class DataModel(object):
                 continue
             result[buffer_name] = buffer
 
-        print(
-            f"Buffers build time: {time.time() - start_time:.3f}s ({len(result)} buffers)"
+        metrics.record(
+            "Buffers build", start_time, buffers=len(result), bytes=sum(b.data.nbytes for b in result.values())
         )
 
         return result
@@ -330,90 +334,13 @@ class DataModel(object):
 
         return index_buffer, vertex_buffer
 
-    @staticmethod
-    def converter_flip_vector(data: NDArray) -> NDArray:
-        return -data
-
-    @staticmethod
-    def converter_mirror_vector(data: NDArray) -> NDArray:
-        data[:, 0] *= -1
-        return data
-
-    @staticmethod
-    def converter_flip_texcoord_v(data: NDArray) -> NDArray:
-        if data.dtype != numpy.float32:
-            data = data.astype(numpy.float32)
-        data[:, 1] = 1.0 - data[:, 1]
-        return data
-
-    @staticmethod
-    def converter_reshape_second_dim(data: NDArray, width: int) -> NDArray:
-        """
-        Restructures 2-dim numpy array's 2-nd dimension to given width by regrouping values
-        Automatically converts 1-dim array to 2-dim with given width (every `width` elements are getting wrapped in array)
-        """
-        data = numpy.reshape(data, (-1, width))
-        return data
-
-    @staticmethod
-    def converter_resize_second_dim(
-        data: NDArray, width: int, fill: Union[int, float] = 0
-    ) -> NDArray:
-        """
-        Restructures 2-dim numpy array's 2-nd dimension to given width by padding or dropping values
-        Automatically converts 1-dim array to 2-dim with given width (every element is getting padded to width)
-        """
-        num_dimensions, num_values = data.ndim, data.shape[1] if data.ndim > 1 else 0
-        if num_dimensions != 2 or num_values != width:
-            if num_values < width:
-                if num_dimensions == 1:
-                    # Array is 1-dim one and requires conversion to 2-dim
-                    num_values = 1
-                    # Wrap every value into array
-                    data = data.reshape(-1, 1)
-                    if width == 1:
-                        # Requested width is also 1, lets exit early
-                        return data
-                # Change the size of 2-nd dimension
-                new_shape = list(data.shape)
-                new_shape[1] = width
-                if fill == 1:
-                    new_data = numpy.ones(dtype=data.dtype, shape=new_shape)
-                else:
-                    new_data = numpy.zeros(dtype=data.dtype, shape=new_shape)
-                    if fill != 0:
-                        new_data.fill(fill)
-                # Fill empty array with data
-                new_data[:, 0:num_values] = data
-                return new_data
-            else:
-                # Trim excessive values to given width
-                return data[:, : -(num_values - width)]
-        else:
-            # Array structure
-            return data
-
-    @staticmethod
-    def converter_rgb_to_bgr_vector(data: NDArray) -> NDArray:
-        data = data.flatten()
-        # Create array from 0 to len
-        # Creates [0, 1, 2, 3, 4, 5] for len=6
-        indices = numpy.arange(len(data))
-        # Convert flat array to 2-dim array of index triads
-        # [0, 1, 2, 3, 4, 5] -> [[0, 1, 2], [3, 4, 5]]
-        indices = indices.reshape(-1, 3)
-        # Swap every first with every third element of index triads
-        # [[0, 1, 2], [3, 4, 5]] -> [[2, 1, 0], [5, 4, 3]]
-        indices[:, [0, 2]] = indices[:, [2, 0]]
-        # Destroy first dimension so we could use the array as index for loop data array
-        # [[2, 1, 0], [5, 4, 3]] -> [2, 1, 0, 5, 4, 3]
-        indices = indices.flatten()
-        # Swap every first with every third element of loop data array
-        data = data[indices]
-
-        data = data.reshape(-1, 3)
-
-        return data
+    # Converters are Blender-independent, see core.converters
+    converter_flip_vector = staticmethod(converters.flip_vector)
+    converter_mirror_vector = staticmethod(converters.mirror_vector)
+    converter_flip_texcoord_v = staticmethod(converters.flip_texcoord_v)
+    converter_reshape_second_dim = staticmethod(converters.reshape_second_dim)
+    converter_resize_second_dim = staticmethod(converters.resize_second_dim)
+    converter_rgb_to_bgr_vector = staticmethod(converters.rgb_to_bgr_vector)
 
     @staticmethod
     def _insert_converter(
@@ -605,21 +532,8 @@ class DataModelXXMI(DataModel):
                 ]
         return cls
 
-    def converter_normalize_weights(self, data: NDArray) -> NDArray:
-        """Normalizes weight values to ensure they sum to 1.0 for each vertex"""
-        if data.size == data.shape[0]:
-            return data
-        sums: NDArray = numpy.sum(data, axis=1, keepdims=True)
-        # Avoid division by zero - if sum is 0, set it to 1
-        sums[sums == 0] = 1.0
-        normalized: NDArray = data / sums
-
-        return normalized
-
-    def converter_flip_bitangent_sign(self, data: NDArray) -> NDArray:
-        """Flips the sign of the bitangent vector"""
-        data *= -1
-        return data
+    converter_normalize_weights = staticmethod(converters.normalize_weights)
+    converter_flip_bitangent_sign = staticmethod(converters.flip_bitangent_sign)
 
     def get_mesh_data(
         self,
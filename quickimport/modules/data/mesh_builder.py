@@ -0,0 +1,93 @@
+import numpy
+import bpy
+
+from numpy.typing import NDArray
+
+
+class BlenderMeshBuilder:
+    """
+    Writes geometry of new mesh from contiguous typed arrays
+    On Blender 4.0+ data goes straight to mesh attributes, older versions use legacy collections
+    """
+
+    def __init__(self, mesh: bpy.types.Mesh):
+        self.mesh = mesh
+        self.use_attributes = bpy.app.version >= (4, 0)
+
+    def add_triangles(self, faces: NDArray):
+        mesh = self.mesh
+        faces = numpy.ascontiguousarray(faces, dtype=numpy.int32).reshape(-1, 3)
+        num_faces = len(faces)
+
+        mesh.loops.add(num_faces * 3)
+        mesh.polygons.add(num_faces)
+
+        loop_start = numpy.arange(0, num_faces * 3, 3, dtype=numpy.int32)
+
+        if self.use_attributes:
+            mesh.attributes['.corner_vert'].data.foreach_set('value', faces.ravel())
+            # Face sizes are derived from offsets since 4.0, loop_total is read-only compatibility view
+            mesh.polygons.foreach_set('loop_start', loop_start)
+        else:
+            mesh.loops.foreach_set('vertex_index', faces.ravel())
+            mesh.polygons.foreach_set('loop_start', loop_start)
+            mesh.polygons.foreach_set('loop_total', numpy.full(num_faces, 3, dtype=numpy.int32))
+
+    def add_vertices(self, count: int):
+        self.mesh.vertices.add(count)
+
+    def set_positions(self, positions: NDArray):
+        mesh = self.mesh
+        positions = numpy.ascontiguousarray(positions, dtype=numpy.float32).reshape(-1, 3)
+
+        if self.use_attributes:
+            mesh.attributes['position'].data.foreach_set('vector', positions.ravel())
+        else:
+            mesh.vertices.foreach_set('co', positions.ravel())
+
+    def add_edges(self, edges: NDArray, loop_edges: NDArray):
+        mesh = self.mesh
+        edges = numpy.ascontiguousarray(edges, dtype=numpy.int32).reshape(-1, 2)
+        loop_edges = numpy.ascontiguousarray(loop_edges, dtype=numpy.int32).ravel()
+
+        mesh.edges.add(len(edges))
+
+        if self.use_attributes:
+            mesh.attributes['.edge_verts'].data.foreach_set('value', edges.ravel())
+            mesh.attributes['.corner_edge'].data.foreach_set('value', loop_edges)
+        else:
+            mesh.edges.foreach_set('vertices', edges.ravel())
+            mesh.loops.foreach_set('edge_index', loop_edges)
+
+    def add_uv_layer(self, name: str, uvs: NDArray):
+        """Adds UV map from (L, 2) per-loop coordinates"""
+        mesh = self.mesh
+        uvs = numpy.ascontiguousarray(uvs, dtype=numpy.float32).reshape(-1, 2)
+
+        if self.use_attributes:
+            # 2D float corner attributes are UV maps
+            uv_layer = mesh.attributes.new(name=name, type='FLOAT2', domain='CORNER')
+            uv_layer.data.foreach_set('vector', uvs.ravel())
+        else:
+            mesh.uv_layers.new(name=name)
+            mesh.uv_layers[name].data.foreach_set('uv', uvs.ravel())
+
+    def add_color_layer(self, name: str, colors: NDArray):
+        """
+        Adds byte color layer from (L, C) per-loop colors, values are stored as is like with legacy vertex colors
+        Colors with less than 4 channels are padded with 1.0
+        """
+        mesh = self.mesh
+        colors = numpy.asarray(colors, dtype=numpy.float32)
+        colors = colors.reshape(len(colors), -1)
+        if colors.shape[1] < 4:
+            padding = numpy.ones((len(colors), 4 - colors.shape[1]), dtype=numpy.float32)
+            colors = numpy.hstack([colors, padding])
+        colors = numpy.ascontiguousarray(colors[:, :4])
+
+        if self.use_attributes:
+            color_layer = mesh.color_attributes.new(name=name, type='BYTE_COLOR', domain='CORNER')
+            color_layer.data.foreach_set('color_srgb', colors.ravel())
+        else:
+            mesh.vertex_colors.new(name=name)
+            mesh.vertex_colors[name].data.foreach_set('color', colors.ravel())
@@ -1,4 +1,5 @@
 import json
+import math
 import os
 import re
 from pathlib import Path
@@ -6,11 +7,14 @@ from pathlib import Path
 
 import bmesh
 import bpy
+import numpy
 from bpy.types import Context, Mesh, Object, Operator
 from bpy_extras.io_utils import axis_conversion
 from mathutils import Vector
 
-from .datastructures import (
+from .data.mesh_builder import BlenderMeshBuilder
+from .core.topology import build_triangle_edges, is_trusted_triangles
+from .core.datastructures import (
     ConstantBuffer,
     FALogFile,
     Fatal,
@@ -80,8 +84,9 @@ def assert_pointlist_ib_is_pointless(ib: IndexBuffer, vb: VertexBufferGroup):
     # index buffers are the trivial case that lists every vertex in order, and
     # just ignore them since we already loaded the vertex buffer in that order.
     assert len(vb) == len(ib)  # FIXME: Properly implement point list index buffers
-    assert all(
-        [(i,) == j for i, j in enumerate(ib.faces)]
+    indices = numpy.array(ib.faces, dtype=numpy.int64).ravel()
+    assert len(indices) == len(ib.faces) and numpy.array_equal(
+        indices, numpy.arange(len(indices))
     )  # FIXME: Properly implement point list index buffers
 
 
@@ -94,6 +99,96 @@ def mesh_triangulate(me: Mesh):
     bm.free()
 
 
+def import_triangle_edges(mesh: Mesh) -> bool:
+    """
+    Creates edges of all-triangle mesh straight from its loops, so mesh.validate can be skipped
+    Returns False if mesh fails array-side sanity check, it has to be validated by caller then
+    """
+    num_loops = len(mesh.loops)
+    if num_loops != len(mesh.polygons) * 3 or len(mesh.edges) != 0:
+        return False
+    faces = numpy.empty(num_loops, dtype=numpy.int32)
+    mesh.loops.foreach_get("vertex_index", faces)
+    faces = faces.reshape(-1, 3)
+    if not is_trusted_triangles(faces, len(mesh.vertices)):
+        return False
+    edges, loop_edges = build_triangle_edges(faces, len(mesh.vertices))
+    BlenderMeshBuilder(mesh).add_edges(edges, loop_edges)
+    return True
+
+
+def get_loop_normals(mesh: Mesh) -> numpy.ndarray:
+    loop_normals = numpy.empty(len(mesh.loops) * 3, dtype=numpy.float32)
+    if bpy.app.version >= (4, 1):
+        mesh.corner_normals.foreach_get("vector", loop_normals)
+    else:
+        mesh.calc_normals_split()
+        mesh.loops.foreach_get("normal", loop_normals)
+    return loop_normals.reshape(-1, 3)
+
+
+def cleanup_meshes(
+    meshes: list[Mesh],
+    merge_distance: float = None,
+    tris_to_quads: bool = False,
+    delete_loose: bool = False,
+):
+    """
+    Welds by distance, joins triangles into quads and deletes loose geometry in single bmesh round trip per mesh
+    Replaces bpy.ops.mesh operators, so no mode switches and edit-mesh rebuilds are involved
+    """
+    if merge_distance is None and not tris_to_quads and not delete_loose:
+        return
+
+    normals_layer_name = "_cleanup_loop_normals"
+
+    for mesh in set(meshes):
+        # Custom normals are stored relative to topology, so keep them as plain corner vectors while it changes
+        has_custom_normals = mesh.has_custom_normals
+        if has_custom_normals:
+            loop_normals = get_loop_normals(mesh)
+            normals_layer = mesh.attributes.new(normals_layer_name, "FLOAT_VECTOR", "CORNER")
+            normals_layer.data.foreach_set("vector", loop_normals.ravel())
+
+        bm = bmesh.new()
+        bm.from_mesh(mesh)
+
+        if merge_distance is not None:
+            bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=merge_distance)
+
+        if tris_to_quads:
+            # Same thresholds and delimits as tris_convert_to_quads defaults
+            bmesh.ops.join_triangles(
+                bm,
+                faces=bm.faces,
+                angle_face_threshold=math.radians(40),
+                angle_shape_threshold=math.radians(40),
+                cmp_seam=True,
+                cmp_sharp=True,
+                cmp_uvs=True,
+                cmp_vcols=True,
+                cmp_materials=True,
+            )
+
+        if delete_loose:
+            loose_edges = [e for e in bm.edges if not e.link_faces]
+            bmesh.ops.delete(bm, geom=loose_edges, context="EDGES")
+            loose_verts = [v for v in bm.verts if not v.link_edges]
+            bmesh.ops.delete(bm, geom=loose_verts, context="VERTS")
+
+        bm.to_mesh(mesh)
+        bm.free()
+
+        if has_custom_normals:
+            normals_layer = mesh.attributes[normals_layer_name]
+            loop_normals = numpy.empty(len(mesh.loops) * 3, dtype=numpy.float32)
+            normals_layer.data.foreach_get("vector", loop_normals)
+            mesh.attributes.remove(normals_layer)
+            mesh.normals_split_custom_set(loop_normals.reshape(-1, 3))
+
+        mesh.update()
+
+
 def find_stream_output_vertex_buffers(log):
     vb_so_map = {}
     for so_draw_call, bindings in log.slot_class["so"].items():
@@ -0,0 +1,180 @@
+import os
+import time
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional
+
+import bpy
+
+from .core.datastructures import Fatal
+from .core import metrics
+
+
+# Data collections checked for new datablocks when cancelled import is rolled back
+# Shape keys and linked libraries are included, library cache and armature import append actions and node groups
+rollback_collections = (
+    "objects", "meshes", "shape_keys", "armatures", "actions", "materials", "node_groups", "images",
+    "collections", "libraries",
+)
+
+
+@dataclass
+class ImportStep:
+    label: str
+    # Step receives context of the call running it, context of execute() is gone by later timer events
+    run: Callable[[bpy.types.Context], None]
+    # Step isn't started until its future is done, so main thread never waits for workers
+    future: Optional[Future] = None
+
+    def is_ready(self) -> bool:
+        return self.future is None or self.future.done()
+
+
+class DeferredReports:
+    """
+    Stands in for operator in worker threads: collects reports and exposes copied operator options
+    Reports are passed to actual operator by replay() on main thread
+    """
+
+    def __init__(self, operator: bpy.types.Operator, options: Iterable[str] = ()):
+        self.reports = []
+        for name in options:
+            if hasattr(operator, name):
+                setattr(self, name, getattr(operator, name))
+
+    def report(self, report_type: set, message: str):
+        self.reports.append((report_type, message))
+
+    def replay(self, operator: bpy.types.Operator):
+        for report_type, message in self.reports:
+            operator.report(report_type, message)
+        self.reports.clear()
+
+
+class OperatorImplementation:
+    """
+    Code of registered operator kept in a class Blender never sees, so it can live in modules loaded on first use
+    Attributes missing from implementation are read from operator and every attribute is stored on operator,
+    so state set during execute() is still there when modal() gets new implementation instance
+    """
+
+    def __init__(self, operator: bpy.types.Operator):
+        object.__setattr__(self, "operator", operator)
+
+    def __getattr__(self, name: str):
+        return getattr(self.operator, name)
+
+    def __setattr__(self, name: str, value):
+        setattr(self.operator, name, value)
+
+
+class DataSnapshot:
+    """Remembers existing datablocks, so everything created after it can be removed"""
+
+    def __init__(self):
+        self.pointers = {
+            name: {block.as_pointer() for block in getattr(bpy.data, name)}
+            for name in rollback_collections
+        }
+
+    def rollback(self):
+        # Some collections (shape_keys) have no remove(), batch_remove deletes blocks of any type in one pass
+        blocks = [
+            block
+            for name in rollback_collections
+            for block in getattr(bpy.data, name)
+            if block.as_pointer() not in self.pointers[name]
+        ]
+        bpy.data.batch_remove(blocks)
+
+
+class ImportJob:
+    """
+    Resumable import pipeline made of steps executed in order on main thread
+    Blender-independent work (parsing) is submitted to worker threads, steps consuming its results
+    wait for them without blocking. Without workers submitted work runs inline, so same steps can
+    be executed synchronously by run()
+    """
+
+    def __init__(self, operator: bpy.types.Operator, use_workers: bool = True):
+        self.operator = operator
+        self.steps = deque()
+        # Run once every other step is done, including steps added while job runs
+        self.final_steps = deque()
+        self.num_done = 0
+        self.label = ""
+        self.executor = None
+        if use_workers:
+            self.executor = ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, 4))
+        self.snapshot = DataSnapshot()
+
+    @property
+    def num_total(self) -> int:
+        return self.num_done + len(self.steps) + len(self.final_steps)
+
+    @property
+    def progress(self) -> float:
+        return self.num_done / max(self.num_total, 1)
+
+    def submit(self, func: Callable, *args, **kwargs) -> Future:
+        if self.executor is not None:
+            return self.executor.submit(func, *args, **kwargs)
+        future = Future()
+        try:
+            future.set_result(func(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def add_step(self, label: str, run: Callable[[bpy.types.Context], None], future: Optional[Future] = None):
+        self.steps.append(ImportStep(label, run, future))
+
+    def add_steps(self, steps: Iterable[tuple[str, Callable[[bpy.types.Context], None]]]):
+        for label, run in steps:
+            self.add_step(label, run)
+
+    def add_final_step(self, label: str, run: Callable[[bpy.types.Context], None]):
+        self.final_steps.append(ImportStep(label, run))
+
+    def run(self, context: bpy.types.Context, time_budget: Optional[float] = None) -> bool:
+        """
+        Executes ready steps with given context until time budget (seconds) runs out, returns True once all steps are done
+        Fatal errors are reported and the job goes on, like synchronous import does
+        """
+        start = time.perf_counter()
+        while self.steps or self.final_steps:
+            if not self.steps:
+                self.steps.extend(self.final_steps)
+                self.final_steps.clear()
+            step = self.steps[0]
+            if not step.is_ready():
+                if time_budget is not None:
+                    break
+                step.future.exception()
+            self.steps.popleft()
+            self.label = step.label
+            try:
+                with metrics.span(step.label):
+                    step.run(context)
+            except Fatal as e:
+                self.operator.report({"ERROR"}, str(e))
+            self.num_done += 1
+            if time_budget is not None and time.perf_counter() - start >= time_budget:
+                break
+        return not self.steps and not self.final_steps
+
+    def finish(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+
+    def cancel(self):
+        """Drops pending work and removes every datablock created by the job"""
+        self.steps.clear()
+        self.final_steps.clear()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+        self.snapshot.rollback()
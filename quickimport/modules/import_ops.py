@@ -9,10 +9,9 @@ from typing import Callable
 from glob import glob, escape as glob_escape
 
 import bpy
-from bpy.props import BoolProperty, CollectionProperty, StringProperty
+from bpy.props import StringProperty
 from bpy.types import (
     Operator,
-    OperatorFileListElement,
     PropertyGroup,
     Context,
     Object,
@@ -20,8 +19,6 @@ from bpy.types import (
 )
 from bpy_extras.io_utils import (
     ImportHelper,
-    orientation_helper,
-    unpack_list,
     axis_conversion,
 )
 
@@ -33,16 +30,31 @@ from .datahandling import (
     new_custom_attribute_int,
     assert_pointlist_ib_is_pointless,
     import_pose,
+    cleanup_meshes,
+    import_triangle_edges,
 )
-from .datastructures import (
+from .core.datastructures import (
     Fatal,
     ImportPaths,
-    IOOBJOrientationHelper,
     VBSOMapEntry,
     VertexBufferGroup,
     IndexBuffer,
     vertex_color_layer_channels,
+    recalculated_semantics,
 )
+from .core.byte_buffer import NumpyBuffer, Semantic
+from .core.migoto_buffers import (
+    get_unorm_semantics,
+    get_unsupported_reason,
+    get_unused_w_reason,
+    load_index_buffer,
+    load_vertex_buffer,
+)
+from .core.welding import WeldResult, weld_vertices
+from .data.data_model import DataModel
+from .data.mesh_builder import BlenderMeshBuilder
+from .import_job import DeferredReports, ImportJob
+from .core import metrics
 
 class XXMIProperties(PropertyGroup):
     """Properties for XXMITools"""
@@ -65,7 +77,7 @@ class XXMIProperties(PropertyGroup):
         options={"HIDDEN"},
     ) #type: ignore
 
-def load_3dmigoto_mesh_bin(operator: Operator, vb_paths, ib_paths, pose_path):
+def load_3dmigoto_mesh_bin(operator: Operator, vb_paths, ib_paths, pose_path, skip_semantics=()):
     if len(vb_paths) != 1 or len(ib_paths) > 1:
         raise Fatal("Cannot merge meshes loaded from binary files")
 
@@ -77,8 +89,9 @@ def load_3dmigoto_mesh_bin(operator: Operator, vb_paths, ib_paths, pose_path):
     if hasattr(operator, "load_buf_limit_range"):  # Frame analysis import only
         use_drawcall_range = operator.load_buf_limit_range
 
-    vb = VertexBufferGroup()
-    vb.parse_vb_bin(vb_paths[0], use_drawcall_range)
+    # Vertices are kept as raw bytes, they're only decoded to dicts if legacy import is required
+    vb = VertexBufferGroup(skip_semantics=skip_semantics)
+    vb.parse_vb_bin(vb_paths[0], use_drawcall_range, load_vertices=False)
 
     ib = None
     if ib_bin_path:
@@ -97,17 +110,37 @@ def load_3dmigoto_mesh_bin(operator: Operator, vb_paths, ib_paths, pose_path):
     return vb, ib, os.path.basename(vb_paths[0][0][0]), pose_path
 
 
-def load_3dmigoto_mesh(operator: Operator, paths: ImportPaths):
+# Semantic indices TEXCOORD can have, the ones above max_texcoords option are skipped
+MAX_TEXCOORD_INDEX = 32
+
+
+def get_skip_semantics(operator: Operator) -> tuple[str, ...]:
+    """Names of elements the import won't use with operator's options, they are skipped by loaders"""
+    skip_semantics = recalculated_semantics
+    max_texcoords = getattr(operator, "max_texcoords", 0)
+    if max_texcoords > 0:
+        # Element of index 0 is named just TEXCOORD, so it's always kept
+        skip_semantics += tuple(f"TEXCOORD{index}" for index in range(max_texcoords, MAX_TEXCOORD_INDEX))
+    return skip_semantics
+
+
+def load_3dmigoto_mesh(operator: Operator, paths: ImportPaths, skip_semantics=None):
+    """
+    Semantics listed in skip_semantics are never decoded, vertices won't have them at all
+    By default they're derived from operator's options, see get_skip_semantics
+    """
+    if skip_semantics is None:
+        skip_semantics = get_skip_semantics(operator)
     vb_paths, ib_paths, use_bin, pose_path = zip(*paths)
     pose_path = pose_path[0]
 
     if use_bin[0]:
-        return load_3dmigoto_mesh_bin(operator, vb_paths, ib_paths, pose_path)
+        return load_3dmigoto_mesh_bin(operator, vb_paths, ib_paths, pose_path, skip_semantics)
 
-    vb = VertexBufferGroup(vb_paths[0])
+    vb = VertexBufferGroup(vb_paths[0], skip_semantics=skip_semantics)
     # Merge additional vertex buffers for meshes split over multiple draw calls:
     for vb_path in vb_paths[1:]:
-        tmp = VertexBufferGroup(vb_path)
+        tmp = VertexBufferGroup(vb_path, skip_semantics=skip_semantics)
         vb.merge(tmp)
 
     # For quickly testing how importent any unsupported semantics may be:
@@ -158,6 +191,8 @@ def import_normals_step1(
     operator: Operator,
     translate_normal: Callable,
     flip_mesh: bool,
+    per_vertex: Callable = tuple,
+    loop_vertex_ids: list = None,
 ):
     # Ensure normals are 3-dimensional:
     # XXX: Assertion triggers in DOA6
@@ -168,7 +203,7 @@ def import_normals_step1(
                 {"WARNING"},
                 "Normals are 4D, storing W coordinate in NORMAL.w vertex layer. Beware that some types of edits on this mesh may be problematic.",
             )
-            vertex_layers["NORMAL.w"] = [[x[3]] for x in data]
+            vertex_layers["NORMAL.w"] = [[x[3]] for x in per_vertex(data)]
     normals = [tuple(map(translate_normal, (x[0], x[1], x[2]))) for x in data]
     normals = [(-(2 * flip_mesh - 1) * x[0], x[1], x[2]) for x in normals]
     # To make sure the normals don't get lost by Blender's edit mode,
@@ -187,7 +222,7 @@ def import_normals_step1(
         return normals
     mesh.create_normals_split()
     for loop in mesh.loops:
-        loop.normal[:] = normals[loop.vertex_index]
+        loop.normal[:] = normals[loop_vertex_ids[loop.index]]
     return []
 
 
@@ -197,8 +232,8 @@ def import_normals_step2(mesh: Mesh):
     clnors = clnors.reshape((-1, 3))
     # Not sure this is still required with use_auto_smooth, but the other
     # importers do it, and at the very least it shouldn't hurt...
-    mesh.polygons.foreach_set("use_smooth", [True] * len(mesh.polygons))
-    mesh.normals_split_custom_set(clnors.tolist())
+    mesh.polygons.foreach_set("use_smooth", numpy.ones(len(mesh.polygons), dtype=bool))
+    mesh.normals_split_custom_set(clnors)
     mesh.use_auto_smooth = (
         True  # This has a double meaning, one of which is to use the custom normals
     )
@@ -238,7 +273,16 @@ def import_vertex_groups(mesh: Mesh, obj: Object, blend_indices, blend_weights):
                     obj.vertex_groups[i].add((vertex.index,), w, "REPLACE")
 
 
-def import_uv_layers(mesh: Mesh, obj: Object, texcoords, flip_texcoord_v: bool):
+def get_loop_vertex_ids(mesh: Mesh) -> numpy.ndarray:
+    loop_vertex_ids = numpy.empty(len(mesh.loops), dtype=numpy.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vertex_ids)
+    return loop_vertex_ids
+
+
+def import_uv_layers(mesh: Mesh, obj: Object, texcoords, flip_texcoord_v: bool, loop_vertex_ids=None):
+    if loop_vertex_ids is None:
+        loop_vertex_ids = get_loop_vertex_ids(mesh)
+    builder = BlenderMeshBuilder(mesh)
     for texcoord, data in sorted(texcoords.items()):
         # TEXCOORDS can have up to four components, but UVs can only have two
         # dimensions. Not positive of the best way to handle this in general,
@@ -256,14 +300,10 @@ def import_uv_layers(mesh: Mesh, obj: Object, texcoords, flip_texcoord_v: bool):
         else:
             raise Fatal("Unhandled TEXCOORD%s dimension: %i" % (texcoord, dim))
         cmap = {"x": 0, "y": 1, "z": 2, "w": 3}
+        loop_data = numpy.array(data, dtype=numpy.float32)[loop_vertex_ids]
 
         for components in components_list:
             uv_name = "TEXCOORD%s.%s" % (texcoord and texcoord or "", components)
-            if hasattr(mesh, "uv_textures"):  # 2.79
-                mesh.uv_textures.new(uv_name)
-            else:  # 2.80
-                mesh.uv_layers.new(name=uv_name)
-            blender_uvs = mesh.uv_layers[uv_name]
 
             # This will assign a texture to the UV layer, which works fine but
             # working out which texture maps to which UV layer is guesswork
@@ -279,19 +319,18 @@ def import_uv_layers(mesh: Mesh, obj: Object, texcoords, flip_texcoord_v: bool):
 
             # Can't find an easy way to flip the display of V in Blender, so
             # add an option to flip it on import & export:
+            uvs = numpy.zeros((len(loop_data), 2), dtype=numpy.float32)
             if len(components) % 2 == 1:
                 # 1D or 3D TEXCOORD, save in a UV layer with V=0
-                translate_uv = lambda u: (u[0], 0)
-            elif flip_texcoord_v:
-                translate_uv = lambda uv: (uv[0], 1.0 - uv[1])
-                # Record that V was flipped so we know to undo it when exporting:
-                obj["3DMigoto:" + uv_name] = {"flip_v": True}
+                uvs[:, 0] = loop_data[:, cmap[components[0]]]
             else:
-                translate_uv = lambda uv: uv
+                uvs[:] = loop_data[:, [cmap[c] for c in components]]
+                if flip_texcoord_v:
+                    uvs[:, 1] = 1.0 - uvs[:, 1]
+                    # Record that V was flipped so we know to undo it when exporting:
+                    obj["3DMigoto:" + uv_name] = {"flip_v": True}
 
-            uvs = [[d[cmap[c]] for c in components] for d in data]
-            for loop in mesh.loops:
-                blender_uvs.data[loop.index].uv = translate_uv(uvs[loop.vertex_index])
+            builder.add_uv_layer(uv_name, uvs)
 
 
 # This loads unknown data from the vertex buffers as vertex layers
@@ -326,65 +365,70 @@ def import_vertex_layers(mesh: Mesh, obj: Object, vertex_layers):
                 raise Fatal("BUG: Bad layer type %s" % type(data[0][0]))
 
 
-def import_faces_from_ib(mesh: Mesh, ib: IndexBuffer, flip_winding: bool):
-    mesh.loops.add(len(ib.faces) * 3)
-    mesh.polygons.add(len(ib.faces))
-    if flip_winding:
-        mesh.loops.foreach_set("vertex_index", unpack_list(map(reversed, ib.faces)))
+def import_faces(mesh: Mesh, faces, weld: WeldResult = None):
+    """Creates triangles from (F, 3) vertex ids, returns original vertex id of every loop"""
+    faces = numpy.asarray(faces, dtype=numpy.int64).reshape(-1, 3)
+    if weld is not None:
+        # Loops of collapsed triangles are dropped, the rest still know their original vertices
+        faces, original_faces = weld.weld_faces(faces)
     else:
-        mesh.loops.foreach_set("vertex_index", unpack_list(ib.faces))
-    mesh.polygons.foreach_set("loop_start", [x * 3 for x in range(len(ib.faces))])
-    mesh.polygons.foreach_set("loop_total", [3] * len(ib.faces))
+        original_faces = faces
+    BlenderMeshBuilder(mesh).add_triangles(faces)
+    return original_faces.ravel()
+
+
+def flip_faces_winding(faces: numpy.ndarray) -> numpy.ndarray:
+    """Reverses vertex order of every (F, 3) face by swapping columns"""
+    return faces[:, ::-1]
+
+
+def import_faces_from_ib(mesh: Mesh, ib: IndexBuffer, flip_winding: bool, weld: WeldResult = None):
+    faces = numpy.array(ib.faces, dtype=numpy.int64).reshape(-1, 3)
+    if flip_winding:
+        faces = flip_faces_winding(faces)
+    return import_faces(mesh, faces, weld)
+
+
+def make_trianglelist_faces(num_vertices: int) -> numpy.ndarray:
+    num_faces = num_vertices // 3
+    return numpy.arange(num_faces * 3, dtype=numpy.int64).reshape(-1, 3)
+
+
+def make_trianglestrip_faces(num_vertices: int) -> numpy.ndarray:
+    num_faces = num_vertices - 2
+    if num_faces <= 0:
+        raise Fatal("Insufficient vertices in trianglestrip")
+
+    # Face i is made of vertices i, i+1, i+2, but every 2nd face has the last two vertices
+    # swapped to keep all faces in the same orientation:
+    # https://learn.microsoft.com/en-us/windows/win32/direct3d9/triangle-strips
+    start = numpy.arange(num_faces, dtype=numpy.int64)
+    odd = start % 2
+    faces = numpy.empty((num_faces, 3), dtype=numpy.int64)
+    faces[:, 0] = start
+    faces[:, 1] = start + 1 + odd
+    faces[:, 2] = start + 2 - odd
+    return faces
 
 
 def import_faces_from_vb_trianglelist(
-    mesh: Mesh, vb: VertexBufferGroup, flip_winding: bool
+    mesh: Mesh, vb: VertexBufferGroup, flip_winding: bool, weld: WeldResult = None
 ):
     # Only lightly tested
-    num_faces = len(vb.vertices) // 3
-    mesh.loops.add(num_faces * 3)
-    mesh.polygons.add(num_faces)
+    faces = make_trianglelist_faces(len(vb.vertices))
     if flip_winding:
-        raise Fatal(
-            "Flipping winding order untested without index buffer"
-        )  # export in particular needs support
-        mesh.loops.foreach_set(
-            "vertex_index", [x for x in reversed(range(num_faces * 3))]
-        )
-    else:
-        mesh.loops.foreach_set("vertex_index", [x for x in range(num_faces * 3)])
-    mesh.polygons.foreach_set("loop_start", [x * 3 for x in range(num_faces)])
-    mesh.polygons.foreach_set("loop_total", [3] * num_faces)
+        faces = flip_faces_winding(faces)
+    return import_faces(mesh, faces, weld)
 
 
 def import_faces_from_vb_trianglestrip(
-    mesh: Mesh, vb: VertexBufferGroup, flip_winding: bool
+    mesh: Mesh, vb: VertexBufferGroup, flip_winding: bool, weld: WeldResult = None
 ):
     # Only lightly tested
+    faces = make_trianglestrip_faces(len(vb.vertices))
     if flip_winding:
-        raise Fatal(
-            "Flipping winding order with triangle strip topology is not implemented"
-        )
-    num_faces = len(vb.vertices) - 2
-    if num_faces <= 0:
-        raise Fatal("Insufficient vertices in trianglestrip")
-    mesh.loops.add(num_faces * 3)
-    mesh.polygons.add(num_faces)
-
-    # Every 2nd face has the vertices out of order to keep all faces in the same orientation:
-    # https://learn.microsoft.com/en-us/windows/win32/direct3d9/triangle-strips
-    tristripindex = [
-        (
-            i,
-            i % 2 and i + 2 or i + 1,
-            i % 2 and i + 1 or i + 2,
-        )
-        for i in range(num_faces)
-    ]
-
-    mesh.loops.foreach_set("vertex_index", unpack_list(tristripindex))
-    mesh.polygons.foreach_set("loop_start", [x * 3 for x in range(num_faces)])
-    mesh.polygons.foreach_set("loop_total", [3] * num_faces)
+        faces = flip_faces_winding(faces)
+    return import_faces(mesh, faces, weld)
 
 
 def import_vertices(
@@ -394,8 +438,21 @@ def import_vertices(
     operator: Operator,
     flip_normal: bool = False,
     flip_mesh: bool = False,
+    weld: WeldResult = None,
+    loop_vertex_ids: list = None,
 ):
-    mesh.vertices.add(len(vb.vertices))
+    if loop_vertex_ids is None:
+        loop_vertex_ids = get_loop_vertex_ids(mesh)
+    builder = BlenderMeshBuilder(mesh)
+    if weld is None:
+        per_vertex = tuple
+        builder.add_vertices(len(vb.vertices))
+    else:
+        # Per-vertex data is taken from vertex representing each welded group,
+        # per-loop data keeps reading values of original vertices via loop_vertex_ids
+        kept = weld.kept.tolist()
+        per_vertex = lambda data: [data[i] for i in kept]
+        builder.add_vertices(len(kept))
 
     blend_indices = {}
     blend_weights = {}
@@ -418,6 +475,17 @@ def import_vertices(
         elem_name = elem.name.upper()
         elem_index = elem.SemanticIndex
 
+        if elem_name in recalculated_semantics:
+            operator.report(
+                {"INFO"},
+                "Skipping import of %s in favour of recalculating on export"
+                % elem.name,
+            )
+            continue
+        if elem_name in vb.skip_semantics:
+            # Never decoded by loader
+            continue
+
         data = tuple(x[elem.name] for x in vb.vertices)
         if elem_name == "POSITION":
             if len(data[0]) == 4:
@@ -426,42 +494,36 @@ def import_vertices(
                         {"WARNING"},
                         "Positions are 4D, storing W coordinate in POSITION.w vertex layer. Beware that some types of edits on this mesh may be problematic.",
                     )
-                    vertex_layers["POSITION.w"] = [[x[3]] for x in data]
-            positions = [(-(2 * flip_mesh - 1) * x[0], x[1], x[2]) for x in data]
-            mesh.vertices.foreach_set("co", unpack_list(positions))
+                    vertex_layers["POSITION.w"] = [[x[3]] for x in per_vertex(data)]
+            positions = numpy.array(per_vertex(data), dtype=numpy.float32)[:, :3]
+            if flip_mesh:
+                positions[:, 0] *= -1
+            builder.set_positions(positions)
         elif elem_name.startswith("COLOR"):
             if len(data[0]) <= 3 or vertex_color_layer_channels == 4:
-                mesh.vertex_colors.new(name=elem.name)
-                color_layer = mesh.vertex_colors[elem.name].data
-                c = vertex_color_layer_channels
-                for loop in mesh.loops:
-                    color_layer[loop.index].color = list(data[loop.vertex_index]) + [
-                        0
-                    ] * (c - len(data[loop.vertex_index]))
+                colors = numpy.zeros((len(data), vertex_color_layer_channels), dtype=numpy.float32)
+                colors[:, :len(data[0])] = data
+                builder.add_color_layer(elem.name, colors[loop_vertex_ids])
             else:
                 mesh.vertex_colors.new(name=elem.name + ".RGB")
                 mesh.vertex_colors.new(name=elem.name + ".A")
                 color_layer = mesh.vertex_colors[elem.name + ".RGB"].data
                 alpha_layer = mesh.vertex_colors[elem.name + ".A"].data
                 for loop in mesh.loops:
-                    color_layer[loop.index].color = data[loop.vertex_index][:3]
-                    alpha_layer[loop.index].color = [data[loop.vertex_index][3], 0, 0]
+                    color = data[loop_vertex_ids[loop.index]]
+                    color_layer[loop.index].color = color[:3]
+                    alpha_layer[loop.index].color = [color[3], 0, 0]
         elif elem_name == "NORMAL":
             use_normals = True
             translate_normal = normal_import_translation(elem, flip_normal)
             normals = import_normals_step1(
-                mesh, data, vertex_layers, operator, translate_normal, flip_mesh
-            )
-        elif elem_name in ("TANGENT", "BINORMAL"):
-            operator.report(
-                {"INFO"},
-                "Skipping import of %s in favour of recalculating on export"
-                % elem.name,
+                mesh, data, vertex_layers, operator, translate_normal, flip_mesh,
+                per_vertex, loop_vertex_ids,
             )
         elif elem_name.startswith("BLENDINDICES"):
-            blend_indices[elem_index] = data
+            blend_indices[elem_index] = per_vertex(data)
         elif elem_name.startswith("BLENDWEIGHT"):
-            blend_weights[elem_index] = data
+            blend_weights[elem_index] = per_vertex(data)
         elif elem_name.startswith("TEXCOORD") and elem.is_float():
             texcoords[elem_index] = data
         else:
@@ -470,7 +532,7 @@ def import_vertices(
                 "Storing unhandled semantic %s %s as vertex layer"
                 % (elem.name, elem.Format),
             )
-            vertex_layers[elem.name] = data
+            vertex_layers[elem.name] = per_vertex(data)
 
     return (
         blend_indices,
@@ -482,60 +544,125 @@ def import_vertices(
     )
 
 
-def import_3dmigoto_vb_ib(
+# Same distance bpy.ops.mesh.remove_doubles uses by default
+MERGE_VERTS_DISTANCE = 0.0001
+WELD_NORMALS_LAYER = "_weld_loop_normals"
+
+
+def weld_vertex_buffer(vb: VertexBufferGroup, distance: float, match_skinning: bool = True) -> WeldResult:
+    """Welds vertices of buffer by position, with match_skinning vertices with different skinning are never merged"""
+    elements = [
+        elem for elem in vb.layout
+        if elem.InputSlotClass == "per-vertex" and not elem.reused_offset and elem.InputSlot in vb.slots
+    ]
+    position = next((elem for elem in elements if elem.name.upper() == "POSITION"), None)
+    if position is None:
+        return None
+    positions = numpy.array([x[position.name][:3] for x in vb.vertices], dtype=numpy.float64)
+    attributes = [
+        numpy.array([x[elem.name] for x in vb.vertices])
+        for elem in elements
+        if match_skinning and elem.name.upper().startswith(("BLENDINDICES", "BLENDWEIGHT"))
+    ]
+    return weld_vertices(positions, distance, attributes=attributes)
+
+
+def import_mesh_data(
     operator: Operator,
-    context: Context,
-    paths: ImportPaths,
-    flip_texcoord_v: bool = True,
-    flip_winding: bool = False,
-    flip_mesh: bool = False,
-    flip_normal: bool = False,
-    axis_forward="-Z",
-    axis_up="Y",
-    pose_cb_off=[0, 0],
-    pose_cb_step=1,
-    merge_verts: bool = False,
-    tris_to_quads: bool = False,
-    clean_loose: bool = False,
+    mesh: Mesh,
+    obj: Object,
+    vb: VertexBufferGroup,
+    ib: IndexBuffer,
+    vertex_buffer: NumpyBuffer,
+    flip_texcoord_v: bool,
+    flip_winding: bool,
+    flip_mesh: bool,
+    flip_normal: bool,
+    merge_verts: bool,
+    merge_verts_match_skinning: bool = True,
 ):
-    vb, ib, name, pose_path = load_3dmigoto_mesh(operator, paths)
+    if ib is not None:
+        faces = numpy.array(ib.faces, dtype=numpy.uint32).reshape(-1, 3)
+    elif vb.topology == "trianglelist":
+        faces = make_trianglelist_faces(vb.vertex_count)
+    else:
+        faces = make_trianglestrip_faces(vb.vertex_count)
+
+    model = DataModel()
+    # Mirroring flips winding on its own, so original flag is passed here
+    model.flip_winding = flip_winding
+    model.flip_normal = flip_normal
+    model.flip_texcoord_v = flip_texcoord_v
+    model.semantic_converters = {}
+    model.format_converters = {}
+    # Decided by format of game buffer, text dumps describe UNORM values as already decoded floats
+    unorm_semantics = get_unorm_semantics(vb)
+    for buffer_semantic in vertex_buffer.layout.semantics:
+        if buffer_semantic.abstract.enum == Semantic.Normal and buffer_semantic.abstract in unorm_semantics:
+            # Scale UNORM range 0:+1 to normal range -1:+1
+            model.format_converters[buffer_semantic.abstract] = [lambda data: data * 2.0 - 1.0]
+
+    model.set_data(
+        obj,
+        mesh,
+        load_index_buffer(faces),
+        vertex_buffer,
+        None,
+        mirror_mesh=flip_mesh,
+        merge_distance=MERGE_VERTS_DISTANCE if merge_verts else None,
+        merge_match_skinning=merge_verts_match_skinning,
+    )
 
-    mesh = bpy.data.meshes.new(name)
-    obj = bpy.data.objects.new(mesh.name, mesh)
+    texcoords = [s for s in vertex_buffer.layout.semantics if s.abstract.enum == Semantic.TexCoord]
+    if flip_texcoord_v:
+        for buffer_semantic in texcoords:
+            uv_name = "TEXCOORD%s.xy" % (buffer_semantic.abstract.index or "")
+            # Record that V was flipped so we know to undo it when exporting:
+            obj["3DMigoto:" + uv_name] = {"flip_v": True}
+    if not texcoords:
+        operator.report(
+            {"WARNING"},
+            "{}: No TEXCOORDs / UV layers imported. This may cause issues with normals/tangents/lighting on export.".format(
+                mesh.name
+            ),
+        )
 
-    global_matrix = axis_conversion(from_forward=axis_forward, from_up=axis_up).to_4x4()
-    obj.matrix_world = global_matrix
 
-    # Attach the vertex buffer layout to the object for later exporting. Can't
-    # seem to retrieve this if attached to the mesh - to_mesh() doesn't copy it:
-    obj["3DMigoto:VBLayout"] = vb.layout.serialise()
-    obj["3DMigoto:Topology"] = vb.topology
-    for raw_vb in vb.vbs:
-        obj["3DMigoto:VB%iStride" % raw_vb.idx] = raw_vb.stride
-    obj["3DMigoto:FirstVertex"] = vb.first
-    # Record these import options so the exporter can set them to match by
-    # default. Might also consider adding them to the .fmt file so reimporting
-    # a previously exported file can also set them by default?
-    obj["3DMigoto:FlipWinding"] = flip_winding
-    obj["3DMigoto:FlipNormal"] = flip_normal
-    obj["3DMigoto:FlipMesh"] = flip_mesh
+def import_mesh_data_legacy(
+    operator: Operator,
+    mesh: Mesh,
+    obj: Object,
+    vb: VertexBufferGroup,
+    ib: IndexBuffer,
+    flip_texcoord_v: bool,
+    flip_winding: bool,
+    flip_mesh: bool,
+    flip_normal: bool,
+    merge_verts: bool,
+    merge_verts_match_skinning: bool = True,
+):
     if flip_mesh:
         flip_winding = not flip_winding
 
+    # Weld duplicated vertices before any mesh data is created, point lists have nothing to weld
+    weld = None
+    if merge_verts and vb.topology != "pointlist" and (ib is None or ib.topology != "pointlist"):
+        weld = weld_vertex_buffer(vb, MERGE_VERTS_DISTANCE, merge_verts_match_skinning)
+        if weld is not None:
+            print(f"{mesh.name}: welded {len(vb.vertices)} vertices into {len(weld)}")
+
+    loop_vertex_ids = None
     if ib is not None:
         if ib.topology in ("trianglelist", "trianglestrip"):
-            import_faces_from_ib(mesh, ib, flip_winding)
+            loop_vertex_ids = import_faces_from_ib(mesh, ib, flip_winding, weld)
         elif ib.topology == "pointlist":
             assert_pointlist_ib_is_pointless(ib, vb)
         else:
             raise Fatal("Unsupported topology (IB): {}".format(ib.topology))
-        # Attach the index buffer layout to the object for later exporting.
-        obj["3DMigoto:IBFormat"] = ib.format
-        obj["3DMigoto:FirstIndex"] = ib.first
     elif vb.topology == "trianglelist":
-        import_faces_from_vb_trianglelist(mesh, vb, flip_winding)
+        loop_vertex_ids = import_faces_from_vb_trianglelist(mesh, vb, flip_winding, weld)
     elif vb.topology == "trianglestrip":
-        import_faces_from_vb_trianglestrip(mesh, vb, flip_winding)
+        loop_vertex_ids = import_faces_from_vb_trianglestrip(mesh, vb, flip_winding, weld)
     elif vb.topology != "pointlist":
         raise Fatal("Unsupported topology (VB): {}".format(vb.topology))
     if vb.topology == "pointlist":
@@ -548,11 +675,11 @@ def import_3dmigoto_vb_ib(
 
     (blend_indices, blend_weights, texcoords, vertex_layers, use_normals, normals) = (
         import_vertices(
-            mesh, obj, vb, operator, flip_normal, flip_mesh
+            mesh, obj, vb, operator, flip_normal, flip_mesh, weld, loop_vertex_ids
         )
     )
 
-    import_uv_layers(mesh, obj, texcoords, flip_texcoord_v)
+    import_uv_layers(mesh, obj, texcoords, flip_texcoord_v, loop_vertex_ids)
     if not texcoords:
         operator.report(
             {"WARNING"},
@@ -565,48 +692,155 @@ def import_3dmigoto_vb_ib(
 
     import_vertex_groups(mesh, obj, blend_indices, blend_weights)
 
+    if use_normals and weld is not None and bpy.app.version >= (4, 1):
+        # Welded vertices may carry several normals, keep them per loop so validate can't misalign them
+        loop_normals = numpy.array(normals, dtype=numpy.float32)[loop_vertex_ids]
+        normals_layer = mesh.attributes.new(WELD_NORMALS_LAYER, "FLOAT_VECTOR", "CORNER")
+        normals_layer.data.foreach_set("vector", loop_normals.ravel())
+
+    # Edges come straight from triangle arrays when they pass sanity check, anything suspicious is validated.
     # Validate closes the loops so they don't disappear after edit mode and probably other important things:
-    mesh.validate(
-        verbose=False, clean_customdata=False
-    )  # *Very* important to not remove lnors here!
+    if not import_triangle_edges(mesh):
+        mesh.validate(
+            verbose=False, clean_customdata=False
+        )  # *Very* important to not remove lnors here!
     # Not actually sure update is necessary. It seems to update the vertex normals, not sure what else:
     mesh.update()
 
     # Must be done after validate step:
     if use_normals:
-        if bpy.app.version >= (4, 1):
+        if bpy.app.version >= (4, 1) and weld is not None:
+            normals_layer = mesh.attributes[WELD_NORMALS_LAYER]
+            loop_normals = numpy.empty(len(mesh.loops) * 3, dtype=numpy.float32)
+            normals_layer.data.foreach_get("vector", loop_normals)
+            mesh.attributes.remove(normals_layer)
+            mesh.normals_split_custom_set(loop_normals.reshape(-1, 3))
+        elif bpy.app.version >= (4, 1):
             mesh.normals_split_custom_set_from_vertices(normals)
         else:
             import_normals_step2(mesh)
     elif hasattr(mesh, "calc_normals"):  # Dropped in Blender 4.0
         mesh.calc_normals()
 
+
+def parse_3dmigoto_vb_ib(operator: Operator, paths: ImportPaths):
+    """
+    Loads buffers and prepares them for import without touching Blender data, so it's safe to call from worker threads
+    Returns (vb, ib, name, pose_path, vertex_buffer, unsupported_reason), vertex_buffer is None for legacy import
+    """
+    with metrics.span("Parsing buffers") as stage:
+        vb, ib, name, pose_path = load_3dmigoto_mesh(operator, paths)
+        stage.name = f"Parsing {name}"
+
+        # Vertex buffers are loaded into NumpyBuffer and imported by BlenderDataImporter,
+        # layouts it can't represent go through legacy per-vertex import instead
+        vertex_buffer = None
+        unsupported_reason = get_unsupported_reason(vb, ib)
+        if unsupported_reason is None:
+            vertex_buffer = load_vertex_buffer(vb)
+            unsupported_reason = get_unused_w_reason(vertex_buffer)
+        if unsupported_reason is not None:
+            vertex_buffer = None
+            vb.decode_vertices()
+
+        stage.count(vertices=vb.vertex_count)
+        if ib is not None:
+            stage.count(indices=len(ib.faces) * ib.indices_per_face)
+        if vertex_buffer is not None:
+            stage.count(bytes=vertex_buffer.data.nbytes)
+
+    return vb, ib, name, pose_path, vertex_buffer, unsupported_reason
+
+
+def import_3dmigoto_vb_ib(
+    operator: Operator,
+    context: Context,
+    paths: ImportPaths,
+    **kwargs,
+):
+    return build_3dmigoto_vb_ib(operator, context, parse_3dmigoto_vb_ib(operator, paths), **kwargs)
+
+
+def build_3dmigoto_vb_ib(
+    operator: Operator,
+    context: Context,
+    parsed_mesh: tuple,
+    flip_texcoord_v: bool = True,
+    flip_winding: bool = False,
+    flip_mesh: bool = False,
+    flip_normal: bool = False,
+    axis_forward="-Z",
+    axis_up="Y",
+    pose_cb_off=[0, 0],
+    pose_cb_step=1,
+    merge_verts: bool = False,
+    merge_verts_match_skinning: bool = True,
+):
+    """Creates object from result of parse_3dmigoto_vb_ib, must be called on main thread"""
+    vb, ib, name, pose_path, vertex_buffer, unsupported_reason = parsed_mesh
+
+    mesh = bpy.data.meshes.new(name)
+    obj = bpy.data.objects.new(mesh.name, mesh)
+
+    global_matrix = axis_conversion(from_forward=axis_forward, from_up=axis_up).to_4x4()
+    obj.matrix_world = global_matrix
+
+    # Attach the vertex buffer layout to the object for later exporting. Can't
+    # seem to retrieve this if attached to the mesh - to_mesh() doesn't copy it:
+    obj["3DMigoto:VBLayout"] = vb.layout.serialise()
+    obj["3DMigoto:Topology"] = vb.topology
+    for raw_vb in vb.vbs:
+        obj["3DMigoto:VB%iStride" % raw_vb.idx] = raw_vb.stride
+    obj["3DMigoto:FirstVertex"] = vb.first
+    # Record these import options so the exporter can set them to match by
+    # default. Might also consider adding them to the .fmt file so reimporting
+    # a previously exported file can also set them by default?
+    obj["3DMigoto:FlipWinding"] = flip_winding
+    obj["3DMigoto:FlipNormal"] = flip_normal
+    obj["3DMigoto:FlipMesh"] = flip_mesh
+
+    try:
+        if unsupported_reason is None:
+            with metrics.span("Mesh data import") as stage:
+                import_mesh_data(
+                    operator, mesh, obj, vb, ib, vertex_buffer,
+                    flip_texcoord_v, flip_winding, flip_mesh, flip_normal, merge_verts, merge_verts_match_skinning,
+                )
+        else:
+            print(f"{mesh.name}: using legacy import ({unsupported_reason})")
+            with metrics.span("Legacy mesh data import") as stage:
+                import_mesh_data_legacy(
+                    operator, mesh, obj, vb, ib,
+                    flip_texcoord_v, flip_winding, flip_mesh, flip_normal, merge_verts, merge_verts_match_skinning,
+                )
+        stage.count(vertices=len(mesh.vertices), loops=len(mesh.loops))
+    except Exception:
+        # Don't leave half-built mesh behind
+        bpy.data.objects.remove(obj)
+        bpy.data.meshes.remove(mesh)
+        raise
+
+    if ib is not None:
+        # Attach the index buffer layout to the object for later exporting.
+        obj["3DMigoto:IBFormat"] = ib.format
+        obj["3DMigoto:FirstIndex"] = ib.first
+
     context.scene.collection.objects.link(obj)
     obj.select_set(True)
     context.view_layer.objects.active = obj
 
-    bpy.ops.object.mode_set(mode="EDIT")
-    bpy.ops.mesh.select_all(action="SELECT")
-    if merge_verts:
-        bpy.ops.mesh.remove_doubles(use_sharp_edge_from_normals=True)
-    if tris_to_quads:
-        bpy.ops.mesh.tris_convert_to_quads(
-            uvs=True, vcols=True, seam=True, sharp=True, materials=True
-        )
-    if clean_loose:
-        bpy.ops.mesh.delete_loose()
-    bpy.ops.object.mode_set(mode="OBJECT")
     if pose_path is not None:
-        import_pose(
-            operator,
-            context,
-            pose_path,
-            limit_bones_to_vertex_groups=True,
-            axis_forward=axis_forward,
-            axis_up=axis_up,
-            pose_cb_off=pose_cb_off,
-            pose_cb_step=pose_cb_step,
-        )
+        with metrics.span("Pose import"):
+            import_pose(
+                operator,
+                context,
+                pose_path,
+                limit_bones_to_vertex_groups=True,
+                axis_forward=axis_forward,
+                axis_up=axis_up,
+                pose_cb_off=pose_cb_off,
+                pose_cb_step=pose_cb_step,
+            )
         context.view_layer.objects.active = obj
 
     return obj
@@ -617,19 +851,86 @@ def import_3dmigoto(
     context: Context,
     paths: ImportPaths,
     merge_meshes: bool = True,
+    merge_verts: bool = False,
+    tris_to_quads: bool = False,
+    clean_loose: bool = False,
     **kwargs,
 ):
     if merge_meshes:
-        return import_3dmigoto_vb_ib(operator, context, paths, **kwargs)
+        obj = import_3dmigoto_vb_ib(operator, context, paths, merge_verts=merge_verts, **kwargs)
+        objects = [obj]
     else:
         obj = []
         for p in paths:
             try:
-                obj.append(import_3dmigoto_vb_ib(operator, context, [p], **kwargs))
+                obj.append(import_3dmigoto_vb_ib(operator, context, [p], merge_verts=merge_verts, **kwargs))
             except Fatal as e:
                 operator.report({"ERROR"}, str(e) + ": " + str(p[:2]))
         # FIXME: Group objects together
-        return obj
+        objects = obj
+
+    # Single cleanup pass over all imported meshes, vertices are already welded on import
+    cleanup_meshes(
+        [o.data for o in objects],
+        tris_to_quads=tris_to_quads,
+        delete_loose=clean_loose,
+    )
+
+    return obj
+
+
+def add_import_3dmigoto_steps(
+    job: ImportJob,
+    operator: Operator,
+    paths: ImportPaths,
+    merge_meshes: bool = True,
+    merge_verts: bool = False,
+    tris_to_quads: bool = False,
+    clean_loose: bool = False,
+    on_imported: Callable = None,
+    **kwargs,
+):
+    """
+    Same as import_3dmigoto, but buffers are parsed by job workers and every object is built by its own step
+    Optional on_imported callback receives context and list of imported objects once they're cleaned up
+    """
+    objects = []
+    groups = [paths] if merge_meshes else [[p] for p in paths]
+
+    for group in groups:
+        reports = DeferredReports(operator, options=("load_buf_limit_range", "max_texcoords"))
+        future = job.submit(parse_3dmigoto_vb_ib, reports, group)
+
+        def build(context, future=future, group=group, reports=reports):
+            reports.replay(operator)
+            try:
+                parsed_mesh = future.result()
+                objects.append(build_3dmigoto_vb_ib(operator, context, parsed_mesh, merge_verts=merge_verts, **kwargs))
+            except Fatal as e:
+                if merge_meshes:
+                    raise
+                operator.report({"ERROR"}, str(e) + ": " + str(group[0][:2]))
+
+        job.add_step(f"Building {get_import_paths_name(group)}", build, future)
+
+    def cleanup(context):
+        # Single cleanup pass over all imported meshes, vertices are already welded on import
+        cleanup_meshes(
+            [o.data for o in objects],
+            tris_to_quads=tris_to_quads,
+            delete_loose=clean_loose,
+        )
+        if on_imported is not None:
+            on_imported(context, objects)
+
+    job.add_step("Cleaning up meshes", cleanup)
+
+
+def get_import_paths_name(paths: ImportPaths) -> str:
+    vb_path = paths[0].vb_paths[0]
+    if paths[0].use_bin:
+        vb_path = vb_path[0]
+    return os.path.basename(vb_path)
 
 
 def import_3dmigoto_raw_buffers(
@@ -661,113 +962,44 @@ def import_3dmigoto_raw_buffers(
             cleanup=True,
         )
 
-@orientation_helper(axis_forward="-Z", axis_up="Y")
-class QuickImportXXMIFrameAnalysis(bpy.types.Operator, ImportHelper, IOOBJOrientationHelper):
-    """Import a mesh dumped with 3DMigoto's frame analysis"""
-    bl_idname = "import_mesh.quickimportxxmi_frame_analysis"
-    bl_label = "Import 3DMigoto Frame Analysis Dump"
-    bl_options = {'PRESET', 'UNDO'}
-
-    filename_ext = ".txt"
-    filter_glob: StringProperty(
-        default="*.txt",
-        options={"HIDDEN"},
-    )
-
-    files: CollectionProperty(
-        name="File Path",
-        type=OperatorFileListElement,
-    )
-
-    flip_texcoord_v: BoolProperty(
-        name="Flip TEXCOORD V",
-        description="Flip TEXCOORD V asix during importing",
-        default=True,
-    )
-
-    flip_winding: BoolProperty(
-        name="Flip Winding Order",
-        description="Flip winding order (face orientation) during importing. Try if the model doesn't seem to be shading as expected in Blender and enabling the 'Face Orientation' overlay shows **RED** (if it shows BLUE, try 'Flip Normal' instead). Not quite the same as flipping normals within Blender as this only reverses the winding order without flipping the normals. Recommended for Unreal Engine",
-        default=False,
-    )
-
-    flip_mesh: BoolProperty(
-        name="Flip Mesh",
-        description="Mirrors mesh over the X Axis on import, and invert the winding order.",
-        default=False,
-    )
-
-    flip_normal: BoolProperty(
-        name="Flip Normal",
-        description="Flip Normals during importing. Try if the model doesn't seem to be shading as expected in Blender and enabling 'Face Orientation' overlay shows **BLUE** (if it shows RED, try 'Flip Winding Order' instead). Not quite the same as flipping normals within Blender as this won't reverse the winding order",
-        default=False,
-    )
-
-    load_related: BoolProperty(
-        name="Auto-load related meshes",
-        description="Automatically load related meshes found in the frame analysis dump",
-        default=True,
-    )
-
-    load_related_so_vb: BoolProperty(
-        name="Load pre-SO buffers (EXPERIMENTAL)",
-        description="Scans the frame analysis log file to find GPU pre-skinning Stream Output techniques in prior draw calls, and loads the unposed vertex buffers from those calls that are suitable for editing. Recommended for Unity games to load neutral poses",
-        default=False,
-    )
-
-    load_buf: BoolProperty(
-        name="Load .buf files instead",
-        description="Load the mesh from the binary .buf dumps instead of the .txt files\nThis will load the entire mesh as a single object instead of separate objects from each draw call",
-        default=False,
-    )
-
-    load_buf_limit_range: BoolProperty(
-        name="Limit to draw range",
-        description="Load just the vertices/indices used in the draw call (equivalent to loading the .txt files) instead of the complete buffer",
-        default=False,
-    )
-
-    merge_meshes: BoolProperty(
-        name="Merge meshes together",
-        description="Merge all selected meshes together into one object. Meshes must be related",
-        default=False,
+def add_import_3dmigoto_raw_buffers_steps(
+    job: ImportJob,
+    operator: Operator,
+    vb_fmt_path: Path,
+    ib_fmt_path: Path,
+    vb_path: Path = None,
+    ib_path: Path = None,
+    vgmap_path: Path = None,
+    **kwargs,
+):
+    """Same as import_3dmigoto_raw_buffers, but executed by job steps"""
+    paths = (
+        ImportPaths(
+            vb_paths=list(zip(vb_path, [vb_fmt_path] * len(vb_path))),
+            ib_paths=(ib_path, ib_fmt_path),
+            use_bin=True,
+            pose_path=None,
+        ),
     )
 
-    pose_cb: StringProperty(
-        name="Bone CB",
-        description='Indicate a constant buffer slot (e.g. "vs-cb2") containing the bone matrices',
-        default="",
-    )
+    def on_imported(context, obj):
+        if obj and vgmap_path:
+            apply_vgmap(
+                operator,
+                context,
+                targets=obj,
+                filepath=vgmap_path,
+                rename=True,
+                cleanup=True,
+            )
 
-    pose_cb_off: bpy.props.IntVectorProperty(
-        name="Bone CB range",
-        description="Indicate start and end offsets (in multiples of 4 component values) to find the matrices in the Bone CB",
-        default=[0, 0],
-        size=2,
-        min=0,
-    )
+    add_import_3dmigoto_steps(job, operator, paths, merge_meshes=False, on_imported=on_imported, **kwargs)
 
-    pose_cb_step: bpy.props.IntProperty(
-        name="Vertex group step",
-        description="If used vertex groups are 0,1,2,3,etc specify 1. If they are 0,3,6,9,12,etc specify 3",
-        default=1,
-        min=1,
-    )
-    merge_verts: BoolProperty(
-        name="Merge Vertices",
-        description="Merge by distance to remove duplicate vertices",
-        default=False,
-    )
-    tris_to_quads: BoolProperty(
-        name="Tris to Quads",
-        description="Convert all tris to quads",
-        default=False,
-    )
-    clean_loose: BoolProperty(
-        name="Clean Loose",
-        description="Remove loose geometry",
-        default=False,
-    )
+class QuickImportXXMIFrameAnalysis:
+    """
+    Import a mesh dumped with 3DMigoto's frame analysis
+    Mixed into implementation of registered operator, which declares FrameAnalysisImportProperties
+    """
 
     def get_vb_ib_paths(self, load_related=None):
         buffer_pattern = re.compile(
@@ -926,7 +1158,7 @@ class QuickImportXXMIFrameAnalysis(bpy.types.Operator, ImportHelper, IOOBJOrient
             ret.add(ImportPaths(tuple(vb_paths), ib_paths[0], use_bin, pose_path))
         return ret
 
-    def execute(self, context):
+    def add_import_steps(self, job: ImportJob, context: Context):
         if self.load_buf:
             # Is there a way to have the mutual exclusivity reflected in
             # the UI? Grey out options or use radio buttons or whatever?
@@ -949,64 +1181,30 @@ class QuickImportXXMIFrameAnalysis(bpy.types.Operator, ImportHelper, IOOBJOrient
                     "load_buf",
                     "pose_cb",
                     "load_buf_limit_range",
+                    "max_texcoords",
                 )
             )
             paths = self.get_vb_ib_paths()
+        except Fatal as e:
+            self.report({"ERROR"}, str(e))
+            return
 
-            import_3dmigoto(self, context, paths, **keywords)
+        def on_imported(context, objects):
             xxmi = getattr(context.scene, "xxmi", None)
             if xxmi and not xxmi.dump_path:
                 if os.path.exists(
                     os.path.join(os.path.dirname(self.filepath), "hash.json")
                 ):
                     xxmi.dump_path = os.path.dirname(self.filepath)
-        except Fatal as e:
-            self.report({"ERROR"}, str(e))
-        return {"FINISHED"}
-
-    def draw(self, context):
-        # Overriding the draw method to disable automatically adding operator
-        # properties to options panel, so we can define sub-panels to group
-        # options and disable grey out mutually exclusive options.
-        pass
-
-
-@orientation_helper(axis_forward="-Z", axis_up="Y")
-class QuickImport3DMigotoRaw(bpy.types.Operator, ImportHelper, IOOBJOrientationHelper):
-    """Import raw 3DMigoto vertex and index buffers"""
-    bl_idname = "import_mesh.quickimportxxmi_raw_buffers"
-    bl_label = "Import 3DMigoto Raw Buffers"
-    #bl_options = {'PRESET', 'UNDO'}
-    bl_options = {'UNDO'}
-
-    filename_ext = ".vb;.ib"
-    filter_glob: StringProperty(
-        default="*.vb*;*.ib",
-        options={"HIDDEN"},
-    )
-
-    files: CollectionProperty(
-        name="File Path",
-        type=OperatorFileListElement,
-    )
 
-    flip_texcoord_v: BoolProperty(
-        name="Flip TEXCOORD V",
-        description="Flip TEXCOORD V axis during importing",
-        default=True,
-    )
+        add_import_3dmigoto_steps(job, self, paths, on_imported=on_imported, **keywords)
 
-    flip_winding: BoolProperty(
-        name="Flip Winding Order",
-        description="Flip winding order (face orientation) during importing. Try if the model doesn't seem to be shading as expected in Blender and enabling the 'Face Orientation' overlay shows **RED** (if it shows BLUE, try 'Flip Normal' instead). Not quite the same as flipping normals within Blender as this only reverses the winding order without flipping the normals. Recommended for Unreal Engine",
-        default=False,
-    )
 
-    flip_normal: BoolProperty(
-        name="Flip Normal",
-        description="Flip Normals during importing. Try if the model doesn't seem to be shading as expected in Blender and enabling 'Face Orientation' overlay shows **BLUE** (if it shows RED, try 'Flip Winding Order' instead). Not quite the same as flipping normals within Blender as this won't reverse the winding order",
-        default=False,
-    )
+class QuickImport3DMigotoRaw:
+    """
+    Import raw 3DMigoto vertex and index buffers
+    Mixed into implementation of registered operator, which declares RawBuffersImportProperties
+    """
 
     def get_vb_ib_paths(self, filename):
         vb_bin_path = glob(glob_escape(os.path.splitext(filename)[0]) + ".vb*")
@@ -1023,14 +1221,14 @@ class QuickImport3DMigotoRaw(bpy.types.Operator, ImportHelper, IOOBJOrientationH
             vgmap_path = None
         return (vb_bin_path, ib_bin_path, fmt_path, vgmap_path)
 
-    def execute(self, context):
+    def add_import_steps(self, job: ImportJob, context: Context):
         # I'm not sure how to find the Import3DMigotoReferenceInputFormat
         # instance that Blender instantiated to pass the values from one
         # import dialog to another, but since everything is modal we can
         # just use globals:
         global migoto_raw_import_options
         migoto_raw_import_options = self.as_keywords(
-            ignore=("filepath", "files", "filter_glob")
+            ignore=("filepath", "files", "filter_glob", "max_texcoords")
         )
 
         done = set()
@@ -1046,9 +1244,9 @@ class QuickImport3DMigotoRaw(bpy.types.Operator, ImportHelper, IOOBJOrientationH
                 done.update(vb_path_norm)
 
                 if fmt_path is not None:
-                    import_3dmigoto_raw_buffers(
+                    add_import_3dmigoto_raw_buffers_steps(
+                        job,
                         self,
-                        context,
                         fmt_path,
                         fmt_path,
                         vb_path=vb_path,
@@ -1062,7 +1260,6 @@ class QuickImport3DMigotoRaw(bpy.types.Operator, ImportHelper, IOOBJOrientationH
                     bpy.ops.import_mesh.migoto_input_format("INVOKE_DEFAULT")
             except Fatal as e:
                 self.report({"ERROR"}, str(e))
-        return {"FINISHED"}
 
 
 class Import3DMigotoReferenceInputFormat(Operator, ImportHelper):
@@ -0,0 +1,177 @@
+import bpy
+from bpy.props import BoolProperty, CollectionProperty, IntProperty, StringProperty
+from bpy.types import OperatorFileListElement
+from bpy_extras.io_utils import orientation_helper
+
+
+# Options of import operators are declared apart from import code, so operators can be registered without loading it
+
+
+@orientation_helper(axis_forward="-Z", axis_up="Y")
+class FrameAnalysisImportProperties:
+    """Options of importing meshes dumped with 3DMigoto's frame analysis"""
+
+    filename_ext = ".txt"
+    filter_glob: StringProperty(
+        default="*.txt",
+        options={"HIDDEN"},
+    )
+
+    files: CollectionProperty(
+        name="File Path",
+        type=OperatorFileListElement,
+    )
+
+    flip_texcoord_v: BoolProperty(
+        name="Flip TEXCOORD V",
+        description="Flip TEXCOORD V asix during importing",
+        default=True,
+    )
+
+    flip_winding: BoolProperty(
+        name="Flip Winding Order",
+        description="Flip winding order (face orientation) during importing. Try if the model doesn't seem to be shading as expected in Blender and enabling the 'Face Orientation' overlay shows **RED** (if it shows BLUE, try 'Flip Normal' instead). Not quite the same as flipping normals within Blender as this only reverses the winding order without flipping the normals. Recommended for Unreal Engine",
+        default=False,
+    )
+
+    flip_mesh: BoolProperty(
+        name="Flip Mesh",
+        description="Mirrors mesh over the X Axis on import, and invert the winding order.",
+        default=False,
+    )
+
+    flip_normal: BoolProperty(
+        name="Flip Normal",
+        description="Flip Normals during importing. Try if the model doesn't seem to be shading as expected in Blender and enabling 'Face Orientation' overlay shows **BLUE** (if it shows RED, try 'Flip Winding Order' instead). Not quite the same as flipping normals within Blender as this won't reverse the winding order",
+        default=False,
+    )
+
+    load_related: BoolProperty(
+        name="Auto-load related meshes",
+        description="Automatically load related meshes found in the frame analysis dump",
+        default=True,
+    )
+
+    load_related_so_vb: BoolProperty(
+        name="Load pre-SO buffers (EXPERIMENTAL)",
+        description="Scans the frame analysis log file to find GPU pre-skinning Stream Output techniques in prior draw calls, and loads the unposed vertex buffers from those calls that are suitable for editing. Recommended for Unity games to load neutral poses",
+        default=False,
+    )
+
+    load_buf: BoolProperty(
+        name="Load .buf files instead",
+        description="Load the mesh from the binary .buf dumps instead of the .txt files\nThis will load the entire mesh as a single object instead of separate objects from each draw call",
+        default=False,
+    )
+
+    load_buf_limit_range: BoolProperty(
+        name="Limit to draw range",
+        description="Load just the vertices/indices used in the draw call (equivalent to loading the .txt files) instead of the complete buffer",
+        default=False,
+    )
+
+    merge_meshes: BoolProperty(
+        name="Merge meshes together",
+        description="Merge all selected meshes together into one object. Meshes must be related",
+        default=False,
+    )
+
+    pose_cb: StringProperty(
+        name="Bone CB",
+        description='Indicate a constant buffer slot (e.g. "vs-cb2") containing the bone matrices',
+        default="",
+    )
+
+    pose_cb_off: bpy.props.IntVectorProperty(
+        name="Bone CB range",
+        description="Indicate start and end offsets (in multiples of 4 component values) to find the matrices in the Bone CB",
+        default=[0, 0],
+        size=2,
+        min=0,
+    )
+
+    pose_cb_step: bpy.props.IntProperty(
+        name="Vertex group step",
+        description="If used vertex groups are 0,1,2,3,etc specify 1. If they are 0,3,6,9,12,etc specify 3",
+        default=1,
+        min=1,
+    )
+    merge_verts: BoolProperty(
+        name="Merge Vertices",
+        description="Merge by distance to remove duplicate vertices",
+        default=False,
+    )
+    merge_verts_match_skinning: BoolProperty(
+        name="Match Skinning",
+        description="Only merge vertices with identical blend indices and weights",
+        default=True,
+    )
+    max_texcoords: IntProperty(
+        name="Max UV Maps",
+        description="Number of TEXCOORD sets to import, higher ones are never decoded. 0 imports all of them",
+        default=0,
+        min=0,
+        max=8,
+    )
+    tris_to_quads: BoolProperty(
+        name="Tris to Quads",
+        description="Convert all tris to quads",
+        default=False,
+    )
+    clean_loose: BoolProperty(
+        name="Clean Loose",
+        description="Remove loose geometry",
+        default=False,
+    )
+
+
+@orientation_helper(axis_forward="-Z", axis_up="Y")
+class RawBuffersImportProperties:
+    """Options of importing raw 3DMigoto vertex and index buffers"""
+
+    filename_ext = ".vb;.ib"
+    filter_glob: StringProperty(
+        default="*.vb*;*.ib",
+        options={"HIDDEN"},
+    )
+
+    files: CollectionProperty(
+        name="File Path",
+        type=OperatorFileListElement,
+    )
+
+    flip_texcoord_v: BoolProperty(
+        name="Flip TEXCOORD V",
+        description="Flip TEXCOORD V axis during importing",
+        default=True,
+    )
+
+    flip_winding: BoolProperty(
+        name="Flip Winding Order",
+        description="Flip winding order (face orientation) during importing. Try if the model doesn't seem to be shading as expected in Blender and enabling the 'Face Orientation' overlay shows **RED** (if it shows BLUE, try 'Flip Normal' instead). Not quite the same as flipping normals within Blender as this only reverses the winding order without flipping the normals. Recommended for Unreal Engine",
+        default=False,
+    )
+
+    flip_normal: BoolProperty(
+        name="Flip Normal",
+        description="Flip Normals during importing. Try if the model doesn't seem to be shading as expected in Blender and enabling 'Face Orientation' overlay shows **BLUE** (if it shows RED, try 'Flip Winding Order' instead). Not quite the same as flipping normals within Blender as this won't reverse the winding order",
+        default=False,
+    )
+
+    merge_verts: BoolProperty(
+        name="Merge Vertices",
+        description="Merge by distance to remove duplicate vertices",
+        default=False,
+    )
+    merge_verts_match_skinning: BoolProperty(
+        name="Match Skinning",
+        description="Only merge vertices with identical blend indices and weights",
+        default=True,
+    )
+    max_texcoords: IntProperty(
+        name="Max UV Maps",
+        description="Number of TEXCOORD sets to import, higher ones are never decoded. 0 imports all of them",
+        default=0,
+        min=0,
+        max=8,
+    )
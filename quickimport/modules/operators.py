@@ -13,7 +13,7 @@ from .datahandling import (
     update_vgmap,
 )
 
-from .datastructures import IOOBJOrientationHelper
+from .core.datastructures import IOOBJOrientationHelper
 
 
 class ApplyVGMap(Operator, ImportHelper):
@@ -12,6 +12,7 @@ def save_preferences(context):
     preferences = {
         "tri_to_quads": prefs.tri_to_quads,
         "merge_by_distance": prefs.merge_by_distance,
+        "merge_match_skinning": prefs.merge_match_skinning,
         "reset_rotation": prefs.reset_rotation,
         "import_textures": prefs.import_textures,
         "create_collection": prefs.create_collection,
@@ -25,7 +26,12 @@ def save_preferences(context):
         "import_stockingmap": prefs.import_stockingmap,
         "import_face": prefs.import_face,
         "import_armature": prefs.import_armature,
-        "flip_mesh": prefs.flip_mesh
+        "flip_mesh": prefs.flip_mesh,
+        "link_resources": prefs.link_resources,
+        "background_import": prefs.background_import,
+        "trace_memory": prefs.trace_memory,
+        "use_texture_cache": prefs.use_texture_cache,
+        "texture_cache_size": prefs.texture_cache_size
     }
     
     with open(get_preferences_path(), 'w') as f:
@@ -47,6 +53,7 @@ def apply_preferences(preferences, context):
             prefs = context.scene.quick_import_settings
             prefs.tri_to_quads = preferences.get("tri_to_quads", False)
             prefs.merge_by_distance = preferences.get("merge_by_distance", False) 
+            prefs.merge_match_skinning = preferences.get("merge_match_skinning", True)
             prefs.reset_rotation = preferences.get("reset_rotation", False)
             prefs.import_textures = preferences.get("import_textures", True)
             prefs.create_collection = preferences.get("create_collection", True)
@@ -61,4 +68,9 @@ def apply_preferences(preferences, context):
             prefs.import_face = preferences.get("import_face", False)
             prefs.import_armature = preferences.get("import_armature", False)
             prefs.flip_mesh = preferences.get("flip_mesh", False)
+            prefs.link_resources = preferences.get("link_resources", False)
+            prefs.background_import = preferences.get("background_import", True)
+            prefs.trace_memory = preferences.get("trace_memory", False)
+            prefs.use_texture_cache = preferences.get("use_texture_cache", True)
+            prefs.texture_cache_size = preferences.get("texture_cache_size", 1024)
 
@@ -0,0 +1,328 @@
+"""
+Manifest of bundled armature and face .blend resources
+
+Maps normalized character names (aliases included) to resource file and exact object names inside it,
+so imports don't have to scan resource directories or list library contents on every run.
+Module doesn't depend on bpy, regenerate manifest after changing resources with:
+    python quickimport/resourcemanifest.py
+Most bundled .blend files are zstd compressed, so building the manifest outside of Blender's Python
+requires the zstandard package (pip install zstandard). Reading the shipped manifest doesn't need it.
+"""
+import json
+import os
+import struct
+
+from typing import Optional
+
+
+# Common name mappings and parts used across operators
+CHARACTER_NAME_MAPPING = {
+    "AratakiItto": "Itto",
+    "Arataki": "Itto", 
+    "TravelerBoy": "Aether",
+    "TravelerMale": "Aether",
+    "KamisatoAyaka": "Ayaka",
+    "KamisatoAyato": "Ayato",
+    "Raiden": "RaidenShogun",
+    "Shogun": "RaidenShogun",
+    "TravelerGirl": "Lumine",
+    "TravelerFemale": "Lumine",
+    "SangonomiyaKokomi": "Kokomi",
+    "KaedeharaKazuha": "Kazuha",
+    "Kaedehara": "Kazuha",
+    "Yae": "YaeMiko",
+    "FischlSkin": "FischlHighness",
+    "NingguangSkin": "NingguangOrchid",
+    "MonaGlobal": "Mona",
+    "Tartaglia": "Childe",
+    "BarbaraSkin": "BarbaraSummertime",
+    "DilucSkin": "DilucFlamme",
+    "DilucFlames": "DilucFlamme",
+    "KiraraSkin": "KiraraBoots",
+    "Kujou": "KujouSara",
+    "Sara": "KujouSara",
+    "Kuki": "Shinobu",
+    "KukiShinobu": "Shinobu",
+    "HutaoSkin": "HutaoCherry",
+    "HutaoCherries": "HutaoCherry",
+    "HutaoSnow": "HutaoCherry",
+    "HutaoLaden": "HutaoCherry",
+    "HutaoCherriesSnowLaden": "HutaoCherry",
+    "HutaoCherriesSnow": "HutaoCherry",
+    "PhainonAlt": "PhainonDemiurge",
+    "PhainonKhaslana": "PhainonDemiurge",
+    "Khaslana": "PhainonDemiurge",
+    "PhainonUlt": "PhainonDemiurge",
+
+
+    
+    # "FurinaPonytail": "Furina"
+}
+
+COMMON_PARTS = ['PonyTail', 'Body', 'Head', 'Arm', 'Leg', 'Dress', 'Extra', 'Extras', 'Hair', 'Mask', 'Idle', 'Eyes', 'Coat', 'JacketHead', 'JacketBody', 'Jacket',
+'Hat', 'HatHead', 'HatBody', 'BackHair', 'Wings']
+
+# Special face-specific name mappings
+FACE_NAME_MAPPING = {
+    "JeanCN": "Jean",
+    "JeanSea": "Jean", 
+    "JeanSkin": "Jean",
+    "KaeyaSailwind": "Kaeya",
+    "KeQingSkin": "Keqing",
+    "KeQingOpulent": "Keqing",
+    "KeQingOpulentSplendor": "Keqing",
+    "ShenheFrostFlower": "Shenhe",
+    "ShenheFlower": "Shenhe"
+}
+
+MANIFEST_VERSION = 1
+ARMATURE_GAMES = ["GI", "HSR"]
+
+RESOURCES_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "resources")
+MANIFEST_PATH = os.path.join(RESOURCES_DIR, "manifest.json")
+
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def read_blend_file(path):
+    """Returns uncompressed contents of .blend file"""
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:4] == ZSTD_MAGIC:
+        # Bundled with Blender since 3.0, has to be installed to build manifest with other Python
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(f"{os.path.basename(path)} is zstd compressed, install zstandard package to read it")
+        with zstandard.ZstdDecompressor().stream_reader(data) as reader:
+            data = reader.read()
+    return data
+
+
+def parse_sdna_field_offset(sdna, pointer_size, endian, struct_name, field_name):
+    """Finds byte offset of field in struct using DNA1 block of .blend file"""
+    def read_int(offset):
+        return struct.unpack_from(endian + "i", sdna, offset)[0]
+
+    def read_strings(offset, count):
+        result = []
+        for _ in range(count):
+            end = sdna.index(b"\0", offset)
+            result.append(sdna[offset:end].decode("utf-8", errors="replace"))
+            offset = end + 1
+        return result, offset
+
+    def align(offset):
+        return (offset + 3) & ~3
+
+    if sdna[:8] != b"SDNANAME":
+        raise ValueError("invalid DNA1 block")
+    names, offset = read_strings(12, read_int(8))
+
+    offset = align(offset)
+    if sdna[offset:offset + 4] != b"TYPE":
+        raise ValueError("invalid DNA1 block")
+    types, offset = read_strings(offset + 8, read_int(offset + 4))
+
+    offset = align(offset)
+    if sdna[offset:offset + 4] != b"TLEN":
+        raise ValueError("invalid DNA1 block")
+    type_lengths = struct.unpack_from(endian + f"{len(types)}h", sdna, offset + 4)
+
+    offset = align(offset + 4 + 2 * len(types))
+    if sdna[offset:offset + 4] != b"STRC":
+        raise ValueError("invalid DNA1 block")
+    num_structs = read_int(offset + 4)
+    offset += 8
+
+    for _ in range(num_structs):
+        type_id, num_fields = struct.unpack_from(endian + "2h", sdna, offset)
+        fields = struct.unpack_from(endian + f"{num_fields * 2}h", sdna, offset + 4)
+        offset += 4 + num_fields * 4
+        if types[type_id] != struct_name:
+            continue
+        field_offset = 0
+        for field_type, field_name_id in zip(fields[0::2], fields[1::2]):
+            name = names[field_name_id]
+            if name.split("[")[0].lstrip("*") == field_name and not name.startswith("*"):
+                return field_offset
+            array_len = 1
+            for dim in name.split("[")[1:]:
+                array_len *= int(dim.rstrip("]"))
+            if name.startswith("*") or name.startswith("(*"):
+                field_offset += pointer_size * array_len
+            else:
+                field_offset += type_lengths[field_type] * array_len
+        break
+
+    raise ValueError(f"field {struct_name}.{field_name} not found in DNA1 block")
+
+
+def read_blend_object_names(path):
+    """Returns names of all objects stored in .blend file without loading it into Blender"""
+    data = read_blend_file(path)
+    if data[:7] != b"BLENDER":
+        raise ValueError(f"not a .blend file: {path}")
+
+    pointer_size = 8 if data[7:8] == b"-" else 4
+    endian = "<" if data[8:9] == b"v" else ">"
+    block_header = struct.Struct(endian + "4si" + ("Q" if pointer_size == 8 else "I") + "ii")
+
+    # Collect object blocks first, name offset is known only after DNA1 block (stored last) is read
+    object_blocks = []
+    id_name_offset = None
+    offset = 12
+    while offset + block_header.size <= len(data):
+        code, length, _, _, _ = block_header.unpack_from(data, offset)
+        offset += block_header.size
+        if code == b"OB\0\0":
+            object_blocks.append(offset)
+        elif code == b"DNA1":
+            id_name_offset = parse_sdna_field_offset(data[offset:offset + length], pointer_size, endian, "ID", "name")
+        elif code == b"ENDB":
+            break
+        offset += length
+
+    if id_name_offset is None:
+        raise ValueError(f"DNA1 block not found in {path}")
+
+    names = []
+    for block_offset in object_blocks:
+        name_offset = block_offset + id_name_offset
+        name = data[name_offset:data.index(b"\0", name_offset)].decode("utf-8", errors="replace")
+        # ID names are prefixed with 2-letter type code
+        names.append(name[2:])
+    return sorted(names)
+
+
+def get_armature_key(file_name):
+    """Returns normalized character name of armature file, everything before "Armature" in lowercase"""
+    armature_idx = file_name.lower().find("armature")
+    if not file_name.endswith(".blend") or armature_idx == -1:
+        return None
+    return file_name[:armature_idx].lower()
+
+
+def find_face_key(faces, base_name):
+    """Returns key of face resource for base name: exact match first, then first name containing it"""
+    key = base_name.lower()
+    if key in faces:
+        return key
+    return next((k for k in sorted(faces) if key in k), None)
+
+
+def build_manifest(resources_dir=RESOURCES_DIR):
+    """Scans resource directories and returns manifest dict"""
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "armatures": {},
+        "faces": {},
+    }
+
+    for game in ARMATURE_GAMES:
+        entries = {}
+        armatures_dir = os.path.join(resources_dir, "armatures", game)
+        if os.path.isdir(armatures_dir):
+            for file_name in sorted(os.listdir(armatures_dir)):
+                key = get_armature_key(file_name)
+                if key is None or key in entries:
+                    continue
+                objects = read_blend_object_names(os.path.join(armatures_dir, file_name))
+                entries[key] = {
+                    "file": f"armatures/{game}/{file_name}",
+                    "objects": [name for name in objects if "Armature" in name],
+                }
+        # Aliases are resolved at build time, so lookup is single dict probe
+        for alias, target in CHARACTER_NAME_MAPPING.items():
+            if target.lower() in entries:
+                entries[alias.lower()] = entries[target.lower()]
+        manifest["armatures"][game] = entries
+
+    faces = {}
+    faces_dir = os.path.join(resources_dir, "faces")
+    if os.path.isdir(faces_dir):
+        for file_name in sorted(os.listdir(faces_dir)):
+            if not file_name.endswith(".blend"):
+                continue
+            faces[file_name[:-len(".blend")].lower()] = {
+                "file": f"faces/{file_name}",
+                "objects": read_blend_object_names(os.path.join(faces_dir, file_name)),
+            }
+    face_aliases = {**CHARACTER_NAME_MAPPING, **FACE_NAME_MAPPING}
+    for alias, target in face_aliases.items():
+        key = find_face_key(faces, target)
+        if key is not None and alias.lower() not in faces:
+            faces[alias.lower()] = faces[key]
+    manifest["faces"] = faces
+
+    return manifest
+
+
+def write_manifest(path=MANIFEST_PATH, resources_dir=RESOURCES_DIR):
+    manifest = build_manifest(resources_dir)
+    with open(path, "w") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    return manifest
+
+
+class ResourceManifest:
+    def __init__(self, data, resources_dir=RESOURCES_DIR):
+        self.armatures = data["armatures"]
+        self.faces = data["faces"]
+        self.resources_dir = resources_dir
+
+    @classmethod
+    def load(cls, path=MANIFEST_PATH):
+        """Returns loaded manifest or None if it's missing or outdated"""
+        if not os.path.isfile(path):
+            return None
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Failed to load resource manifest {path}: {e}")
+            return None
+        if data.get("version") != MANIFEST_VERSION:
+            print(f"Ignoring resource manifest {path} of unsupported version {data.get('version')}")
+            return None
+        return cls(data, os.path.dirname(path))
+
+    def resolve(self, entry):
+        """Returns (absolute path, object names) of manifest entry if its file still exists"""
+        path = os.path.join(self.resources_dir, *entry["file"].split("/"))
+        if not os.path.isfile(path):
+            return None
+        return path, entry["objects"]
+
+    def find_armature(self, base_name) -> Optional[tuple]:
+        key = base_name.lower()
+        for game in ARMATURE_GAMES:
+            entry = self.armatures.get(game, {}).get(key)
+            if entry is not None:
+                return self.resolve(entry)
+        return None
+
+    def find_face(self, base_name) -> Optional[tuple]:
+        key = find_face_key(self.faces, base_name)
+        if key is None:
+            return None
+        return self.resolve(self.faces[key])
+
+
+_manifest = None
+
+def get_manifest():
+    """Returns manifest shipped with resources, loaded once per session"""
+    global _manifest
+    if _manifest is None:
+        _manifest = ResourceManifest.load() or False
+    return _manifest or None
+
+
+if __name__ == "__main__":
+    manifest = write_manifest()
+    print(
+        f"Wrote {MANIFEST_PATH}: "
+        + ", ".join(f"{len(entries)} {game} armature keys" for game, entries in manifest["armatures"].items())
+        + f", {len(manifest['faces'])} face keys"
+    )
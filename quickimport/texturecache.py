@@ -0,0 +1,104 @@
+import hashlib
+import os
+import bpy #type: ignore
+
+from typing import Optional
+
+
+# Extensions for formats the DDS addon converts textures to
+CACHE_EXTENSIONS = {
+    "TARGA": ".tga",
+    "TARGA_RAW": ".tga",
+    "HDR": ".hdr",
+    "PNG": ".png",
+    "OPEN_EXR": ".exr",
+}
+
+
+def get_cache_dir():
+    """Per-user folder outside of the addon, so cache survives addon updates and works for read-only installs"""
+    return bpy.utils.user_resource('DATAFILES', path=os.path.join("quickimport", "texture_cache"), create=True)
+
+
+def make_cache_key(path, invert_normals, cubemap_layout):
+    """Key changes whenever source file or conversion options change"""
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    key = f"{os.path.normcase(path)}|{stat.st_size}|{stat.st_mtime_ns}|{invert_normals}|{cubemap_layout}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def list_entries():
+    """Returns (path, size, mtime) of every cached file, least recently used first"""
+    entries = []
+    for entry in os.scandir(get_cache_dir()):
+        if entry.is_file() and not entry.name.endswith(".tmp"):
+            stat = entry.stat()
+            entries.append((entry.path, stat.st_size, stat.st_mtime))
+    entries.sort(key=lambda e: e[2])
+    return entries
+
+
+def lookup(key) -> Optional[str]:
+    """Returns path of cached converted texture or None, marks hit entry as recently used"""
+    cache_dir = get_cache_dir()
+    for ext in set(CACHE_EXTENSIONS.values()):
+        cached_path = os.path.join(cache_dir, key + ext)
+        if os.path.isfile(cached_path):
+            try:
+                os.utime(cached_path)
+            except OSError:
+                pass
+            return cached_path
+    return None
+
+
+def store(key, image, max_size_mb):
+    """Writes packed pixels of converted image to cache and evicts old entries above size limit"""
+    if image.packed_file is None:
+        return None
+
+    ext = CACHE_EXTENSIONS.get(image.file_format, ".tga")
+    cached_path = os.path.join(get_cache_dir(), key + ext)
+    tmp_path = cached_path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(image.packed_file.data)
+        os.replace(tmp_path, cached_path)
+    except OSError as e:
+        print(f"Failed to write texture cache entry {cached_path}: {e}")
+        return None
+
+    evict(max_size_mb * 1024 * 1024)
+    return cached_path
+
+
+def evict(max_size):
+    """Removes least recently used entries until cache fits into max_size bytes"""
+    entries = list_entries()
+    total_size = sum(size for _, size, _ in entries)
+    for path, size, _ in entries:
+        if total_size <= max_size:
+            break
+        try:
+            os.remove(path)
+            total_size -= size
+        except OSError as e:
+            print(f"Failed to evict texture cache entry {path}: {e}")
+    return total_size
+
+
+def purge():
+    """Removes every cached texture, returns number of removed files and freed bytes"""
+    removed, freed = 0, 0
+    for entry in os.scandir(get_cache_dir()):
+        if not entry.is_file():
+            continue
+        size = entry.stat().st_size
+        try:
+            os.remove(entry.path)
+            removed += 1
+            freed += size
+        except OSError as e:
+            print(f"Failed to remove texture cache entry {entry.path}: {e}")
+    return removed, freed
@@ -1,23 +1,107 @@
 
 import bpy #type: ignore
 import os
-if bpy.app.version < (4, 2, 0):
+from bisect import bisect_left
+from . import texturecache
+from .modules.core import metrics
+
+
+def get_import_dds():
+    """Imports DDS conversion of the Blender DDS Addon, only needed by Blender < 4.2 once textures are actually loaded"""
     try:
         from blender_dds_addon import import_dds #type: ignore
     except ImportError:
         raise ImportError("The Blender DDS Addon is required for Blender 3.6. Please install it from: https://github.com/matyalatte/Blender-DDS-Addon")
+    return import_dds
+
+
+class ObjectPrefixIndex:
+    """Sorted index of object names for prefix lookups, keeps material names of each mesh in a set"""
+    def __init__(self, objects):
+        # Only objects which data can hold materials are of interest
+        self.objects = sorted(
+            (obj for obj in objects if obj.data is not None and hasattr(obj.data, "materials")),
+            key=lambda obj: obj.name
+        )
+        self.names = [obj.name for obj in self.objects]
+        # Keyed by data, objects sharing same mesh share its materials too
+        self.materials = {
+            obj.data.name_full: {m.name for m in obj.data.materials if m is not None}
+            for obj in self.objects
+        }
+
+    def find(self, prefix):
+        """Returns all objects which names start with prefix"""
+        # Every name starting with prefix sorts between prefix itself and prefix followed by max code point
+        start = bisect_left(self.names, prefix)
+        end = bisect_left(self.names, prefix + "\U0010FFFF", lo=start)
+        return self.objects[start:end]
+
+    def assign_material(self, obj, material):
+        """Appends material to object unless it already has it, returns whether material was added"""
+        object_materials = self.materials[obj.data.name_full]
+        if material.name in object_materials:
+            return False
+        obj.data.materials.append(material)
+        object_materials.add(material.name)
+        return True
+
+
+def load_texture_stage(context, files, path, create_image):
+    """
+    Creates Blender images of texture files one by one on main thread, reporting progress per texture
+    Textures are decoded by Blender (or DDS Addon) itself, so reading them ahead in other threads only reads them twice
+    Returns dict of file -> image for every texture that was loaded successfully
+    """
+    images = {}
+    if not files:
+        return images
+
+    wm = context.window_manager
+    wm.progress_begin(0, len(files))
+    try:
+        with metrics.span("Creating images") as stage:
+            for i, file in enumerate(files):
+                try:
+                    images[file] = create_image(os.path.join(path, file))
+                except (RuntimeError, OSError, ValueError) as e:
+                    print(f"Skipping {file}: {e}")
+                wm.progress_update(i + 1)
+            stage.count(images=len(images))
+    finally:
+        wm.progress_end()
+
+    return images
 
 
 class TextureHandler:
     @staticmethod
     def convert_dds(context, file):
-        """Import a file."""
+        """Import a file, reusing previously converted image from texture cache when possible."""
+        import_dds = get_import_dds()
         dds_options = context.scene.dds_options
+        cfg = context.scene.quick_import_settings
+
+        cache_key = None
+        if cfg.use_texture_cache:
+            cache_key = texturecache.make_cache_key(file, dds_options.invert_normals, dds_options.cubemap_layout)
+            cached_path = texturecache.lookup(cache_key)
+            if cached_path is not None:
+                tex = bpy.data.images.load(cached_path)
+                tex.name = os.path.splitext(os.path.basename(file))[0]
+                tex.pack()
+                print(f"Loaded {os.path.basename(file)} from texture cache")
+                return tex
+
         tex = import_dds.load_dds(
             file,
             invert_normals=dds_options.invert_normals,
             cubemap_layout=dds_options.cubemap_layout,
         )
+
+        if cache_key is not None and tex is not None:
+            texturecache.store(cache_key, tex, cfg.texture_cache_size)
+
         return tex
 
     @staticmethod
@@ -39,32 +123,44 @@ class TextureHandler:
             "Back" not in f
         ))
         
+        if not context.scene.quick_import_settings.import_textures:
+            print(f"Skipping texture import for {sorted_files} as import_textures is disabled.")
+            return []
+
+        texture_files = {}
         for file in sorted_files:
             file_name, ext = os.path.splitext(file)
             texture_type = next((t for t in texture_types if t in file_name), None)
-            
+
             if texture_type is None:
                 print(f"Skipping {file} as it does not match known texture types.")
                 continue
-            
-            mesh_name = file_name[:-len(texture_type)]
-            
-            if context.scene.quick_import_settings.import_textures:
-                TextureHandler.convert_dds(context, file=os.path.join(path, file))
-                
-                material_name = f"mat_{mesh_name}_{texture_type}"
-                if material_name not in materials_cache:
-                    materials_cache[material_name] = TextureHandler.setup_texture(material_name, file, texture_type)
-                
-                for obj in bpy.data.objects:
-                    if obj.name.startswith(mesh_name):
-                        mat = bpy.data.materials.get(materials_cache[material_name])
-                        if mat and mat.name not in [m.name for m in obj.data.materials]:
-                            obj.data.materials.append(mat)
-                            importedmeshes.add(obj)
-                            print(f"Assigned material {mat.name} to {obj.name}")
-            else:
-                print(f"Skipping texture import for {file} as import_textures is disabled.")
+
+            texture_files[file] = texture_type
+
+        images = load_texture_stage(
+            context, list(texture_files.keys()), path,
+            lambda texture_path: TextureHandler.convert_dds(context, file=texture_path)
+        )
+
+        object_index = ObjectPrefixIndex(bpy.data.objects)
+
+        for file, texture_type in texture_files.items():
+            if file not in images:
+                continue
+
+            mesh_name = os.path.splitext(file)[0][:-len(texture_type)]
+
+            material_name = f"mat_{mesh_name}_{texture_type}"
+            if material_name not in materials_cache:
+                materials_cache[material_name] = TextureHandler.setup_texture(material_name, file, texture_type)
+
+            mat = bpy.data.materials.get(materials_cache[material_name])
+            if mat:
+                for obj in object_index.find(mesh_name):
+                    if object_index.assign_material(obj, mat):
+                        importedmeshes.add(obj)
+                        print(f"Assigned material {mat.name} to {obj.name}")
 
         return list(importedmeshes)
 
@@ -131,6 +227,8 @@ class TextureHandler42:
             "Back" not in f
         ))
         
+        texture_files = {}
+        material_names = set()
         for file in sorted_files:
             file_name, ext = os.path.splitext(file)
             texture_type = next((t for t in texture_types if t in file_name), None)
@@ -138,25 +236,44 @@ class TextureHandler42:
             if texture_type is None:
                 print(f"Skipping {file} as it does not match known texture types.")
                 continue
-            
+
             mesh_name = file_name[:-len(texture_type)]
             material_name = f"mat_{mesh_name}_{texture_type}"
-            
+
+            # Only first texture of each material is ever used, don't load the rest
+            if material_name not in material_names:
+                material_names.add(material_name)
+                texture_files[file] = material_name
+
+        images = load_texture_stage(
+            context, list(texture_files.keys()), path,
+            lambda texture_path: bpy.data.images.load(texture_path)
+        )
+
+        object_index = ObjectPrefixIndex(bpy.data.objects)
+
+        for file, material_name in texture_files.items():
+            if file not in images:
+                continue
+
+            file_name, ext = os.path.splitext(file)
+            texture_type = next(t for t in texture_types if t in file_name)
+            mesh_name = file_name[:-len(texture_type)]
+
             if material_name not in materials_cache:
-                materials_cache[material_name] = TextureHandler42.setup_texture(material_name, os.path.join(path, file), texture_type)
+                materials_cache[material_name] = TextureHandler42.setup_texture(material_name, images[file], texture_type)
             
-                for obj in bpy.data.objects:
-                    if obj.name.startswith(mesh_name):
-                        mat = bpy.data.materials.get(materials_cache[material_name])
-                        if mat and mat.name not in [m.name for m in obj.data.materials]:
-                            obj.data.materials.append(mat)
+                mat = bpy.data.materials.get(materials_cache[material_name])
+                if mat:
+                    for obj in object_index.find(mesh_name):
+                        if object_index.assign_material(obj, mat):
                             importedmeshes.add(obj)
                             print(f"Assigned material {mat.name} to {obj.name}")
 
         return list(importedmeshes)
     
     @staticmethod
-    def setup_texture(name, texture_path, texture_type):
+    def setup_texture(name, image, texture_type):
         """Creates a new material using that texture as base color, also sets alpha to none"""
         material = bpy.data.materials.new(name)
         material.use_nodes = True
@@ -166,7 +283,7 @@ class TextureHandler42:
 
         # Add Image Texture node
         texImage = material.node_tree.nodes.new("ShaderNodeTexImage")
-        texImage.image = bpy.data.images.load(texture_path)
+        texImage.image = image
         if texImage.image:
             texImage.image.alpha_mode = "NONE"
             texImage.image.colorspace_settings.name = 'sRGB'
@@ -193,4 +310,4 @@ class TextureHandler42:
             # For LightMap, NormalMap, StockingMap, and MaterialMap, just add a Material Output node
             material_output = material.node_tree.nodes.new("ShaderNodeOutputMaterial")
 
-        return material.name
\ No newline at end of file
+        return material.name
\ No newline at end of file
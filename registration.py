@@ -23,6 +23,7 @@ xxmi_classes = [
     QuickImportRaw,
     QuickImportArmature, 
     SavePreferencesOperator, 
+    PurgeTextureCacheOperator,
 ]
 
 # Consolidate all classes
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Tests import quickimport package from repository root, same as benchmarks run with `python -m benchmarks`
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
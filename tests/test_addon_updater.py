@@ -0,0 +1,188 @@
+"""
+Update checks of addon_updater against a local http.server standing in for the GitHub API
+"""
+import http.server
+import importlib.util
+import json
+import os
+import sys
+import threading
+import time
+import types
+
+import pytest
+
+
+ADDON_UPDATER_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "addon_updater.py")
+ETAG = '"v1"'
+LAST_MODIFIED = "Mon, 19 Oct 2026 00:00:00 GMT"
+TAGS = [{"name": "v9.9.9", "zipball_url": "http://127.0.0.1/zipball/v9.9.9"}]
+
+
+class FakeTimers:
+    """bpy.app.timers, registered functions are called by pump() until they return None"""
+
+    def __init__(self):
+        self.functions = []
+
+    def register(self, function, first_interval=0, persistent=False):
+        self.functions.append(function)
+
+    def is_registered(self, function):
+        return function in self.functions
+
+    def unregister(self, function):
+        self.functions.remove(function)
+
+    def pump(self, timeout=10.0):
+        deadline = time.perf_counter() + timeout
+        while self.functions:
+            assert time.perf_counter() < deadline, "update check did not finish"
+            for function in list(self.functions):
+                if function() is None:
+                    self.functions.remove(function)
+            time.sleep(0.01)
+
+
+class TagsHandler(http.server.BaseHTTPRequestHandler):
+    """Serves TAGS with validators, answers 304 to requests carrying current ETag"""
+
+    def do_GET(self):
+        self.server.requests.append(dict(self.headers))
+        time.sleep(self.server.delay)
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = json.dumps(TAGS).encode()
+        self.send_response(200)
+        self.send_header("ETag", ETAG)
+        self.send_header("Last-Modified", LAST_MODIFIED)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), TagsHandler)
+    server.requests = []
+    server.delay = 0.0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def timers(monkeypatch):
+    """Installs fake bpy and addon_utils, addon_updater only needs bpy.app.timers at check time"""
+    timers = FakeTimers()
+    bpy = types.ModuleType("bpy")
+    bpy.app = types.SimpleNamespace(timers=timers)
+    monkeypatch.setitem(sys.modules, "bpy", bpy)
+    monkeypatch.setitem(sys.modules, "addon_utils", types.ModuleType("addon_utils"))
+    return timers
+
+
+@pytest.fixture
+def updater(timers, server, tmp_path, monkeypatch):
+    # Repository root is the addon package importing bpy on its own, addon_updater is loaded into a stand-in package
+    package = types.ModuleType("addonpkg")
+    package.__path__ = []
+    monkeypatch.setitem(sys.modules, "addonpkg", package)
+    spec = importlib.util.spec_from_file_location("addonpkg.addon_updater", ADDON_UPDATER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, spec.name, module)
+    spec.loader.exec_module(module)
+
+    updater = module.Updater
+    updater._updater_path = str(tmp_path)
+    updater.user = "user"
+    updater.repo = "repo"
+    updater.current_version = (1, 0, 0)
+    updater.select_link = lambda tag: tag["zipball_url"]
+    updater._engine.form_tags_url = lambda _: f"http://127.0.0.1:{server.server_port}/tags"
+    return updater
+
+
+def test_overlapping_checks_make_single_request(updater, server, timers):
+    server.delay = 0.3
+    results = []
+
+    updater.start_async_check_update(True, results.append)
+    updater.start_async_check_update(True, results.append)
+    updater.check_for_update_now(results.append)
+    timers.pump()
+
+    assert len(server.requests) == 1
+    # Checks started while one is in flight wait for its result, every callback runs once on main thread
+    assert results == [True, True, True]
+    assert updater.update_ready
+
+
+def test_repeated_check_is_conditional_and_served_from_cache(updater, server, timers):
+    updater.check_for_update_now()
+    timers.pump()
+    assert "If-None-Match" not in server.requests[0]
+
+    updater.check_for_update_now()
+    timers.pump()
+
+    assert len(server.requests) == 2
+    assert server.requests[1]["If-None-Match"] == ETAG
+    assert server.requests[1]["If-Modified-Since"] == LAST_MODIFIED
+    # 304 response carries no body, tags come from cached response
+    assert updater.tags == ["v9.9.9"]
+    assert updater.update_ready
+    assert len(os.listdir(os.path.join(updater._updater_path, "response_cache"))) == 1
+
+
+def test_check_within_interval_starts_no_thread(updater, server, timers):
+    updater.set_check_interval(enabled=True, days=1)
+    updater.check_for_update_now()
+    timers.pump()
+    updater._update_ready = None
+    updater._json["update_ready"] = False
+    results = []
+
+    updater.check_for_update_async(results.append)
+
+    assert updater._check_thread is None
+    assert not timers.functions
+    assert len(server.requests) == 1
+    assert results == []
+
+
+def test_unchanged_state_is_not_rewritten(updater, timers):
+    updater.check_for_update_now()
+    timers.pump()
+    json_path = updater.get_json_path()
+    # Older timestamp shows whether the file was written again, mtime resolution may be coarse
+    os.utime(json_path, ns=(0, 0))
+
+    updater.save_updater_json()
+    assert os.stat(json_path).st_mtime_ns == 0
+
+    updater._json["ignore"] = True
+    updater.save_updater_json()
+    assert os.stat(json_path).st_mtime_ns != 0
+
+
+def test_state_file_is_read_in_background(updater, timers):
+    updater.check_for_update_now()
+    timers.pump()
+    json_path = updater.get_json_path()
+    updater._json = dict()
+
+    updater.start_async_json_load()
+    updater._json_thread.join()
+
+    assert updater.json_loaded
+    assert updater._json["last_check"]
+    with open(json_path) as f:
+        assert updater.json == json.load(f)
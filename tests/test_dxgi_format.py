@@ -0,0 +1,58 @@
+"""
+Parity of float32 reciprocal decoding of normalized integers with float64 division it replaced
+"""
+import numpy
+import pytest
+
+from quickimport.modules.core.dxgi_format import NORMALIZED_FLOAT_TYPE, DXGIType
+
+
+# Every normalized type with the max value its decoder divides by
+NORMALIZED_TYPES = [
+    (DXGIType.UNORM8, 255.0),
+    (DXGIType.UNORM16, 65535.0),
+    (DXGIType.SNORM8, 127.0),
+    (DXGIType.SNORM16, 32767.0),
+]
+
+# Multiplying by rounded reciprocal may land on neighbouring float32 of correctly rounded quotient
+MAX_ULP_ERROR = 1
+
+
+def get_all_values(dxgi_type: DXGIType) -> numpy.ndarray:
+    numpy_type = dxgi_type.value[0]
+    info = numpy.iinfo(numpy_type)
+    return numpy.arange(info.min, info.max + 1).astype(numpy_type)
+
+
+def decode_float64(values: numpy.ndarray, max_value: float) -> numpy.ndarray:
+    """Previous decoder: float64 division rounded to float32 once"""
+    return (values.astype(numpy.float64) / max_value).astype(NORMALIZED_FLOAT_TYPE)
+
+
+@pytest.mark.parametrize("dxgi_type, max_value", NORMALIZED_TYPES, ids=lambda v: getattr(v, "name", None))
+def test_decoder_within_ulp_of_float64_division(dxgi_type, max_value):
+    values = get_all_values(dxgi_type)
+    decoded = dxgi_type.value[4](values)
+    expected = decode_float64(values, max_value)
+
+    assert decoded.dtype == NORMALIZED_FLOAT_TYPE
+    ulp = numpy.abs(numpy.spacing(expected))
+    error = numpy.abs(decoded.astype(numpy.float64) - expected.astype(numpy.float64)) / ulp
+    assert error.max() <= MAX_ULP_ERROR
+
+
+@pytest.mark.parametrize("dxgi_type, max_value", NORMALIZED_TYPES, ids=lambda v: getattr(v, "name", None))
+def test_decoder_keeps_exact_endpoints(dxgi_type, max_value):
+    numpy_type = dxgi_type.value[0]
+    values = numpy.array([0, max_value], dtype=numpy_type)
+    assert dxgi_type.value[4](values).tolist() == [0.0, 1.0]
+
+
+@pytest.mark.parametrize("dxgi_type, max_value", NORMALIZED_TYPES, ids=lambda v: getattr(v, "name", None))
+def test_decoder_writes_into_out(dxgi_type, max_value):
+    values = get_all_values(dxgi_type)
+    out = numpy.empty(len(values), dtype=NORMALIZED_FLOAT_TYPE)
+    result = dxgi_type.value[4](values, out=out)
+    assert result is out
+    numpy.testing.assert_array_equal(out, dxgi_type.value[4](values))
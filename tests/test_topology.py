@@ -0,0 +1,55 @@
+"""
+Edges and sanity checks of triangle lists that skip mesh.validate
+"""
+import numpy
+
+from quickimport.modules.core.topology import build_triangle_edges, is_trusted_triangles
+
+
+def test_triangle_edges_are_shared_by_loops():
+    faces = numpy.array([[0, 1, 2], [2, 1, 3]])
+
+    edges, loop_edges = build_triangle_edges(faces, 4)
+
+    assert sorted(map(tuple, edges.tolist())) == [(0, 1), (0, 2), (1, 2), (1, 3), (2, 3)]
+    # Loop edge goes from loop vertex to next vertex of the face, in either direction
+    loops = faces.ravel()
+    next_loops = faces[:, [1, 2, 0]].ravel()
+    for loop, edge in enumerate(loop_edges):
+        assert set(edges[edge]) == {loops[loop], next_loops[loop]}
+    # Edge (1, 2) is used by both triangles
+    assert loop_edges[1] == loop_edges[3]
+    assert edges.dtype == numpy.int32 and loop_edges.dtype == numpy.int32
+
+
+def test_triangle_edges_of_empty_faces():
+    edges, loop_edges = build_triangle_edges(numpy.zeros((0, 3), dtype=numpy.int32), 0)
+    assert edges.shape == (0, 2)
+    assert len(loop_edges) == 0
+
+
+def test_valid_triangles_are_trusted():
+    assert is_trusted_triangles(numpy.array([[0, 1, 2], [2, 1, 3]]), 4)
+    assert is_trusted_triangles(numpy.zeros((0, 3)), 0)
+
+
+def test_out_of_range_indices_are_not_trusted():
+    assert not is_trusted_triangles(numpy.array([[0, 1, 4]]), 4)
+    assert not is_trusted_triangles(numpy.array([[0, -1, 2]]), 4)
+
+
+def test_degenerate_triangles_are_not_trusted():
+    assert not is_trusted_triangles(numpy.array([[0, 1, 2], [1, 3, 1]]), 4)
+
+
+def test_duplicated_triangles_are_not_trusted():
+    # Same vertices in different order make the same face
+    assert not is_trusted_triangles(numpy.array([[0, 1, 2], [2, 0, 1]]), 3)
+    assert not is_trusted_triangles(numpy.array([[0, 1, 2], [2, 1, 0]]), 3)
+
+
+def test_duplicates_found_when_packed_key_would_overflow():
+    num_vertices = 2**22
+    faces = numpy.array([[0, 1, num_vertices - 1], [num_vertices - 1, 1, 0], [0, 2, num_vertices - 1]])
+    assert not is_trusted_triangles(faces, num_vertices)
+    assert is_trusted_triangles(faces[1:], num_vertices)
@@ -0,0 +1,112 @@
+"""
+Grid hash welding compared with brute force merging of every pair within weld distance
+"""
+import itertools
+
+import numpy
+import pytest
+
+from quickimport.modules.core.welding import WeldResult, weld_vertices
+
+
+def weld_brute_force(positions: numpy.ndarray, distance: float, attributes: numpy.ndarray) -> tuple:
+    """Returns (remap, kept) of merging every close pair with matching attributes, components keep first vertex"""
+    labels = list(range(len(positions)))
+
+    def find(vertex):
+        while labels[vertex] != vertex:
+            vertex = labels[vertex]
+        return vertex
+
+    for a, b in itertools.combinations(range(len(positions)), 2):
+        if numpy.linalg.norm(positions[a] - positions[b]) <= distance and (attributes[a] == attributes[b]).all():
+            root_a, root_b = find(a), find(b)
+            labels[max(root_a, root_b)] = min(root_a, root_b)
+
+    roots = numpy.array([find(vertex) for vertex in range(len(positions))])
+    kept = numpy.unique(roots)
+    return numpy.searchsorted(kept, roots), kept
+
+
+def test_close_pair_is_welded_regardless_of_other_cell_members():
+    weld = weld_vertices([[1, 1, 1], [1.9, 1.9, 1.9], [1.95, 1.9, 1.9]], distance=1.0)
+    assert weld.remap.tolist() == [0, 1, 1]
+    assert weld.kept.tolist() == [0, 1]
+
+
+def test_chain_of_close_vertices_is_welded_together():
+    positions = [[0, 0, 0], [0.8, 0, 0], [1.6, 0, 0], [5, 0, 0]]
+    weld = weld_vertices(positions, distance=1.0)
+    assert weld.remap.tolist() == [0, 0, 0, 1]
+    assert weld.kept.tolist() == [0, 3]
+
+
+def test_vertices_across_cell_boundary_are_welded():
+    weld = weld_vertices([[0.99999, 0, 0], [1.00001, 0, 0]], distance=1e-4)
+    assert weld.remap.tolist() == [0, 0]
+
+
+def test_different_attributes_are_not_welded():
+    positions = numpy.zeros((3, 3))
+    weights = numpy.array([[1.0, 0.0], [1.0, 0.0], [0.5, 0.5]], dtype=numpy.float32)
+    weld = weld_vertices(positions, attributes=[weights])
+    assert weld.remap.tolist() == [0, 0, 1]
+
+
+def test_normals_beyond_max_angle_are_not_welded():
+    positions = numpy.zeros((3, 3))
+    normals = numpy.array([[0, 0, 1], [0, 0.1, 1], [0, 1, 0]])
+    weld = weld_vertices(positions, normals=normals, max_normal_angle=numpy.radians(30))
+    assert weld.remap.tolist() == [0, 0, 1]
+
+
+def test_empty_positions():
+    weld = weld_vertices(numpy.zeros((0, 3)))
+    assert len(weld) == 0
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_brute_force(seed):
+    rng = numpy.random.default_rng(seed)
+    count = int(rng.integers(2, 80))
+    distance = float(rng.uniform(0.05, 0.5))
+    # Rounded positions make exact duplicates and pairs right at the weld distance
+    positions = rng.uniform(-1, 1, (count, 3)).round(1)
+    attributes = rng.integers(0, 2, (count, 1)).astype(numpy.uint8)
+
+    weld = weld_vertices(positions, distance, attributes=[attributes])
+
+    remap, kept = weld_brute_force(positions, distance, attributes)
+    numpy.testing.assert_array_equal(weld.remap, remap)
+    numpy.testing.assert_array_equal(weld.kept, kept)
+
+
+def test_matches_brute_force_on_grid_too_large_for_int64_keys():
+    rng = numpy.random.default_rng(0)
+    positions = rng.uniform(-1, 1, (40, 3)).round(1)
+    positions[0] = [1e17, -1e17, 1e17]
+    attributes = numpy.zeros((40, 1), dtype=numpy.uint8)
+
+    weld = weld_vertices(positions, 0.3)
+
+    remap, kept = weld_brute_force(positions, 0.3, attributes)
+    numpy.testing.assert_array_equal(weld.remap, remap)
+    numpy.testing.assert_array_equal(weld.kept, kept)
+
+
+def test_weld_faces_drops_collapsed_faces():
+    weld = WeldResult(remap=numpy.array([0, 0, 1, 2]), kept=numpy.array([0, 2, 3]))
+    faces = numpy.array([[0, 2, 3], [0, 1, 2], [1, 3, 2]])
+
+    welded, original = weld.weld_faces(faces)
+
+    assert welded.tolist() == [[0, 1, 2], [0, 2, 1]]
+    # Original faces keep reading per-loop data of original vertices
+    assert original.tolist() == [[0, 2, 3], [1, 3, 2]]
+
+
+def test_weld_faces_accepts_flat_indices():
+    weld = WeldResult(remap=numpy.arange(3), kept=numpy.arange(3))
+    welded, original = weld.weld_faces(numpy.array([0, 1, 2]))
+    assert welded.tolist() == [[0, 1, 2]]
+    assert original.tolist() == [[0, 1, 2]]
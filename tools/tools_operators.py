@@ -1,7 +1,6 @@
 import bpy  #type: ignore
 from bpy.props import PointerProperty, StringProperty, EnumProperty, BoolProperty #type: ignore
 from bpy.types import Object, Operator, Panel, PropertyGroup #type: ignore
-import numpy as np
 # from .quickimport.operators import *
 
 
@@ -258,7 +257,9 @@ class OBJECT_OT_vertex_group_remap(bpy.types.Operator):
 
         return {'FINISHED'}
 
+# numpy is imported by functions using it, so enabling the add-on doesn't load it
 def calculate_vertex_influence_area(obj):
+    import numpy as np
     vertex_area = np.zeros(len(obj.data.vertices))
 
     for face in obj.data.polygons:
@@ -269,6 +270,7 @@ def calculate_vertex_influence_area(obj):
     return vertex_area
 
 def get_all_weighted_centers(obj):
+    import numpy as np
     vertex_influence_area = calculate_vertex_influence_area(obj)
     matrix_world = np.array(obj.matrix_world)
 
@@ -302,6 +304,7 @@ def get_all_weighted_centers(obj):
     return centers
 
 def find_nearest_center(base_centers, target_center):
+    import numpy as np
     best_match = None
     best_distance = float('inf')
     target_center = np.array(target_center)
@@ -2,9 +2,10 @@
 import bpy #type: ignore
 import os
 from . import bl_info
-from bpy.props import PointerProperty, StringProperty, EnumProperty, BoolProperty #type: ignore 
+from bpy.props import PointerProperty, StringProperty, EnumProperty, BoolProperty, IntProperty #type: ignore 
 from .tools.tools_operators import *
 from . import addon_updater_ops
+from .quickimport.modules.core import metrics
 
 class XXMI_TOOLS_PT_main_panel(bpy.types.Panel):
     bl_label = "ToolsXXMI"
@@ -121,6 +122,11 @@ class QuickImportSettings(bpy.types.PropertyGroup):
         default=False,
         description="Enable Merge by Distance"
     )#type: ignore 
+    merge_match_skinning: BoolProperty(
+        name="Match Skinning",
+        default=True,
+        description="Merge by Distance only merges vertices with identical blend indices and weights"
+    )#type: ignore 
     flip_mesh: BoolProperty(
         name="Flip Mesh",
         default=False,
@@ -209,6 +215,37 @@ class QuickImportSettings(bpy.types.PropertyGroup):
         default=False,
         description="Hide Advanced Settings"
     ) #type: ignore
+    link_resources: BoolProperty(
+        name="Link Resources",
+        default=False,
+        description="Link armature and face files as library overrides instead of appending them"
+    ) #type: ignore
+    background_import: BoolProperty(
+        name="Background Import",
+        default=True,
+        description="Parse buffers in background and build objects in small steps with progress, press Esc to cancel"
+    ) #type: ignore
+    trace_memory: BoolProperty(
+        name="Trace Memory",
+        default=False,
+        description="Record peak Python memory of every import stage, makes import slower"
+    ) #type: ignore
+    show_import_stats: BoolProperty(
+        name="Show Last Import Stats",
+        default=False,
+        description="Show timings of the last import"
+    ) #type: ignore
+    use_texture_cache: BoolProperty(
+        name="Texture Cache",
+        default=True,
+        description="Reuse previously converted DDS textures instead of converting them again"
+    ) #type: ignore
+    texture_cache_size: IntProperty(
+        name="Cache Size (MB)",
+        default=1024,
+        min=64,
+        description="Maximum size of converted texture cache, least recently used textures are removed first"
+    ) #type: ignore
 
 class XXMI_TOOLS_PT_quick_import_panel(bpy.types.Panel):
     bl_label = "QuickImportXXMI"
@@ -244,6 +281,8 @@ class XXMI_TOOLS_PT_quick_import_panel(bpy.types.Panel):
         row = col.row(align=True)
         row.prop(cfg, "import_textures", toggle=True)
         row.prop(cfg, "merge_by_distance", toggle=True)
+        if cfg.merge_by_distance:
+            col.prop(cfg, "merge_match_skinning", toggle=True)
         
         row = col.row(align=True)
         row.prop(cfg, "reset_rotation", toggle=True)
@@ -267,6 +306,10 @@ class XXMI_TOOLS_PT_quick_import_panel(bpy.types.Panel):
             row = col.row()
             row.prop(cfg, "import_armature", toggle=True)
             row.prop(cfg, "import_face", toggle=True)
+            row = col.row()
+            row.prop(cfg, "link_resources", toggle=True)
+            row.prop(cfg, "background_import", toggle=True)
+            row.prop(cfg, "trace_memory", toggle=True)
 
         if cfg.import_textures:
             col.separator()
@@ -284,8 +327,25 @@ class XXMI_TOOLS_PT_quick_import_panel(bpy.types.Panel):
                 row = col.row(align=True)
                 row.prop(cfg, "import_materialmap", toggle=True)
                 row.prop(cfg, "import_stockingmap", toggle=True)
+                if bpy.app.version < (4, 2, 0):
+                    col.separator()
+                    row = col.row(align=True)
+                    row.prop(cfg, "use_texture_cache", toggle=True)
+                    row.prop(cfg, "texture_cache_size")
+                    row = col.row(align=True)
+                    row.operator("quickimport.purge_texture_cache", icon='TRASH')
                 col.separator()
 
+        if metrics.last_report is not None:
+            col.separator()
+            row = col.row(align=True)
+            row.prop(cfg, "show_import_stats", text="Last Import Stats",
+                     icon='TRIA_DOWN' if cfg.show_import_stats else 'TRIA_RIGHT', emboss=False)
+            if cfg.show_import_stats:
+                stats_col = col.box().column(align=True)
+                for line in metrics.get_summary_lines(metrics.last_report, max_depth=1):
+                    stats_col.label(text=line)
+
         col.separator()
         row = col.row(align=True)
         row.scale_y = 1.2